@@ -0,0 +1,162 @@
+"""
+Benchmarks of the order creation and signing hot path, runs offline
+
+    python benchmarks/bench_hot_path.py            # run and compare with the baseline
+    python benchmarks/bench_hot_path.py --save     # run and store the baseline
+    python benchmarks/bench_hot_path.py --check    # exit 1 on regression
+
+Every benchmark reports ops/sec and the p50 and p99 latency of a single call.
+A benchmark regresses when its p50 is more than --tolerance slower than the baseline.
+"""
+
+import argparse
+import json
+import os
+import sys
+from time import perf_counter
+
+from py_order_utils.model import BUY, SELL
+
+from py_clob_client.clob_types import (
+    ApiCreds,
+    CreateOrderOptions,
+    MarketOrderArgs,
+    OrderArgs,
+    OrderType,
+    RequestArgs,
+)
+from py_clob_client.constants import AMOY
+from py_clob_client.headers.headers import (
+    create_level_1_headers,
+    create_level_2_headers,
+)
+from py_clob_client.order_builder.builder import ROUNDING_CONFIG, OrderBuilder
+from py_clob_client.signer import Signer
+from py_clob_client.signing.hmac import build_hmac_signature
+from py_clob_client.utilities import order_to_json
+
+# publicly known private key
+PRIVATE_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+TOKEN_ID = (
+    "71321045679252212594626385532706912750332728571942532289631379312455583992563"
+)
+CREDS = ApiCreds(
+    api_key="000000000-0000-0000-0000-000000000000",
+    api_passphrase="aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+    api_secret="AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=",
+)
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def get_benchmarks() -> dict:
+    signer = Signer(PRIVATE_KEY, AMOY)
+    builder = OrderBuilder(signer)
+    options = CreateOrderOptions(tick_size="0.01", neg_risk=False)
+    order_args = OrderArgs(token_id=TOKEN_ID, price=0.56, size=21.04, side=BUY)
+    market_order_args = MarketOrderArgs(
+        token_id=TOKEN_ID, amount=100, side=SELL, price=0.5, order_type=OrderType.FOK
+    )
+    signed_order = builder.create_order(order_args, options)
+    body = order_to_json(signed_order, CREDS.api_key, OrderType.GTC)
+
+    return {
+        "get_order_amounts": lambda: builder.get_order_amounts(
+            BUY, 21.04, 0.56, ROUNDING_CONFIG["0.01"]
+        ),
+        "create_order": lambda: builder.create_order(order_args, options),
+        "create_market_order": lambda: builder.create_market_order(
+            market_order_args, options
+        ),
+        "build_hmac_signature": lambda: build_hmac_signature(
+            CREDS.api_secret, 1700000000, "POST", "/order", body
+        ),
+        "create_level_1_headers": lambda: create_level_1_headers(signer, 0),
+        "create_level_2_headers": lambda: create_level_2_headers(
+            signer,
+            CREDS,
+            RequestArgs(method="POST", request_path="/order", body=body),
+        ),
+        "order_to_json": lambda: order_to_json(
+            signed_order, CREDS.api_key, OrderType.GTC
+        ),
+    }
+
+
+def run(fn, min_time: float = 0.5, min_calls: int = 50) -> dict:
+    for _ in range(5):
+        fn()
+
+    durations = []
+    start = perf_counter()
+    while len(durations) < min_calls or perf_counter() - start < min_time:
+        t = perf_counter()
+        fn()
+        durations.append(perf_counter() - t)
+
+    durations.sort()
+    return {
+        "ops_per_sec": round(len(durations) / sum(durations), 1),
+        "p50_us": round(durations[len(durations) // 2] * 1e6, 1),
+        "p99_us": round(
+            durations[min(len(durations) - 1, int(len(durations) * 0.99))] * 1e6, 1
+        ),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--save", action="store_true", help="store the baseline")
+    parser.add_argument("--check", action="store_true", help="fail on regression")
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument("--min-time", type=float, default=0.5)
+    parser.add_argument("benchmarks", nargs="*", help="names, all by default")
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)
+
+    benchmarks = get_benchmarks()
+    results = {}
+    regressions = []
+    print(
+        "{:<24} {:>12} {:>10} {:>10} {:>10}".format(
+            "benchmark", "ops/sec", "p50 us", "p99 us", "vs base"
+        )
+    )
+    for name, fn in benchmarks.items():
+        if args.benchmarks and name not in args.benchmarks:
+            continue
+        result = results[name] = run(fn, min_time=args.min_time)
+
+        change = ""
+        if name in baseline:
+            ratio = result["p50_us"] / baseline[name]["p50_us"]
+            change = "{:+.0%}".format(ratio - 1)
+            if ratio > 1 + args.tolerance:
+                regressions.append(name)
+                change += " !"
+        print(
+            "{:<24} {:>12.0f} {:>10.1f} {:>10.1f} {:>10}".format(
+                name, result["ops_per_sec"], result["p50_us"], result["p99_us"], change
+            )
+        )
+
+    if args.save:
+        baseline.update(results)
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print("baseline saved to {}".format(BASELINE_PATH))
+
+    if regressions:
+        print("regressions: {}".format(", ".join(regressions)))
+        if args.check:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""
+Import time of the package, runs offline
+
+    python benchmarks/bench_import.py            # run and compare with the baseline
+    python benchmarks/bench_import.py --save     # run and store the baseline
+    python benchmarks/bench_import.py --check    # exit 1 on regression
+
+Every import is timed in a fresh interpreter, as paid by a cold start.
+A Level 0 client must not load the signing stack, --check also fails if it does.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# modules only needed to sign, loaded on the first L1/L2 use
+SIGNING_MODULES = ["eth_account", "py_order_utils", "poly_eip712_structs", "eth_keys"]
+
+IMPORTS = {
+    "import py_clob_client": "import py_clob_client",
+    "import py_clob_client.client": "import py_clob_client.client",
+    "l0_client": "from py_clob_client.client import ClobClient\n"
+    "ClobClient('http://localhost')",
+    "l1_client": "from py_clob_client.client import ClobClient\n"
+    "ClobClient('http://localhost', chain_id=80002, key='0x{}')".format("ab" * 32),
+}
+
+TIMER = """
+from time import perf_counter
+start = perf_counter()
+{}
+elapsed = perf_counter() - start
+import json, sys
+print(json.dumps([elapsed, [m for m in {} if m in sys.modules]]))
+"""
+
+
+def run(statement: str, runs: int) -> tuple[dict, list[str]]:
+    durations = []
+    loaded = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMER.format(statement, SIGNING_MODULES)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        elapsed, loaded = json.loads(output.splitlines()[-1])
+        durations.append(elapsed)
+
+    durations.sort()
+    return {
+        "ops_per_sec": round(len(durations) / sum(durations), 1),
+        "p50_us": round(durations[len(durations) // 2] * 1e6, 1),
+        "p99_us": round(
+            durations[min(len(durations) - 1, int(len(durations) * 0.99))] * 1e6, 1
+        ),
+    }, loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--save", action="store_true", help="store the baseline")
+    parser.add_argument("--check", action="store_true", help="fail on regression")
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)
+
+    results = {}
+    regressions = []
+    print(
+        "{:<30} {:>10} {:>10} {:>10}  {}".format(
+            "import", "p50 ms", "p99 ms", "vs base", "signing modules"
+        )
+    )
+    for name, statement in IMPORTS.items():
+        result, loaded = run(statement, args.runs)
+        results[name] = result
+
+        change = ""
+        if name in baseline:
+            ratio = result["p50_us"] / baseline[name]["p50_us"]
+            change = "{:+.0%}".format(ratio - 1)
+            if ratio > 1 + args.tolerance:
+                regressions.append(name)
+                change += " !"
+        if loaded and name != "l1_client":
+            regressions.append("{} loads {}".format(name, ", ".join(loaded)))
+        print(
+            "{:<30} {:>10.1f} {:>10.1f} {:>10}  {}".format(
+                name,
+                result["p50_us"] / 1e3,
+                result["p99_us"] / 1e3,
+                change,
+                ", ".join(loaded) or "-",
+            )
+        )
+
+    if args.save:
+        baseline.update(results)
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print("baseline saved to {}".format(BASELINE_PATH))
+
+    if regressions:
+        print("regressions: {}".format(", ".join(regressions)))
+        if args.check:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
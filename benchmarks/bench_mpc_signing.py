@@ -0,0 +1,76 @@
+"""
+Throughput of the MPC signing path against the local MPC backend, runs offline
+
+    python benchmarks/bench_mpc_signing.py --latency 0.5 --requests 200
+
+Signs the requests through MPCSigningService for every max_in_flight value, the
+backend latency simulates the NEAR round trip of a sign_hash call.
+"""
+
+import argparse
+import asyncio
+import sys
+from time import perf_counter
+
+from py_clob_client.MPCBackends import LocalMPCBackend
+from py_clob_client.MPCSigner import MPCSigner
+from py_clob_client.MPCSigningService import MPCSigningService
+from py_clob_client.constants import AMOY
+
+# publicly known private key
+PRIVATE_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+PATH = "polymarket-1"
+
+
+async def run(
+    backend: LocalMPCBackend, requests: int, max_in_flight: int, verify: bool
+):
+    signer = MPCSigner(
+        ota_account=backend.address(PATH),
+        chain_id=AMOY,
+        path=PATH,
+        verify=verify,
+        backend=backend,
+    )
+    service = MPCSigningService(signer, max_in_flight=max_in_flight)
+    hashes = ["{:064x}".format(i + 1) for i in range(requests)]
+
+    start = perf_counter()
+    results = await service.sign_many(hashes)
+    elapsed = perf_counter() - start
+
+    errors = sum(1 for r in results if r.error is not None)
+    summary = service.latency.summary()
+    print(
+        "{:>14} {:>12.1f} {:>10.1f} {:>10.1f} {:>8}".format(
+            max_in_flight,
+            requests / elapsed,
+            summary["p50"] * 1e3,
+            summary["p99"] * 1e3,
+            errors,
+        )
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.5, help="sign_hash, sec")
+    parser.add_argument("--jitter", type=float, default=0.1, help="sec")
+    parser.add_argument("--no-verify", action="store_true")
+    parser.add_argument("--max-in-flight", type=int, nargs="*", default=[1, 8, 32, 128])
+    args = parser.parse_args()
+
+    backend = LocalMPCBackend(PRIVATE_KEY, latency=args.latency, jitter=args.jitter)
+    print(
+        "{:>14} {:>12} {:>10} {:>10} {:>8}".format(
+            "max_in_flight", "signs/sec", "p50 ms", "p99 ms", "errors"
+        )
+    )
+    for max_in_flight in args.max_in_flight:
+        asyncio.run(run(backend, args.requests, max_in_flight, not args.no_verify))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
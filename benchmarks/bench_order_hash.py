@@ -0,0 +1,70 @@
+"""
+Compares the generic py_order_utils EIP712 order hashing with the
+precompiled encoder of py_clob_client.signing.order
+
+    python benchmarks/bench_order_hash.py
+"""
+
+from timeit import repeat
+
+from eth_utils import keccak
+from poly_eip712_structs import make_domain
+from py_order_utils.builders import OrderBuilder as UtilsOrderBuilder
+from py_order_utils.model import OrderData, BUY
+from py_order_utils.signer import Signer as UtilsSigner
+
+from py_clob_client.config import get_contract_config
+from py_clob_client.constants import AMOY
+from py_clob_client.signing.order import get_order_hash
+
+# publicly known private key
+PRIVATE_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+ITERATIONS = 2000
+
+
+def main():
+    exchange = get_contract_config(AMOY).exchange
+    utils_signer = UtilsSigner(key=PRIVATE_KEY)
+    builder = UtilsOrderBuilder(exchange, AMOY, utils_signer)
+    order = builder.build_order(
+        OrderData(
+            maker=utils_signer.address(),
+            tokenId="71321045679252212594626385532706912750332728571942532289631379312455583992563",
+            makerAmount="50000000",
+            takerAmount="100000000",
+            side=BUY,
+            feeRateBps="0",
+            nonce="0",
+        )
+    )
+
+    def generic():
+        # what the builder does per order: derive the domain and hash every field
+        domain = make_domain(
+            name="Polymarket CTF Exchange",
+            version="1",
+            chainId=str(AMOY),
+            verifyingContract=exchange,
+        )
+        return keccak(order.signable_bytes(domain=domain))
+
+    def precompiled():
+        return get_order_hash(order, AMOY, exchange)
+
+    assert generic() == precompiled()
+
+    results = {}
+    for name, fn in [("generic", generic), ("precompiled", precompiled)]:
+        best = min(repeat(fn, number=ITERATIONS, repeat=5)) / ITERATIONS
+        results[name] = best
+        print(
+            "{:<12} {:>10.1f} us/order {:>10.0f} orders/sec".format(
+                name, best * 1e6, 1 / best
+            )
+        )
+
+    print("speedup: {:.1f}x".format(results["generic"] / results["precompiled"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""
+End-to-end throughput of the client against the offline mock CLOB
+
+    python benchmarks/load_test.py --workers 8 --requests 2000 --latency 0.01
+    python benchmarks/load_test.py --scenario post_order --error-rate 0.01 --spans
+    python benchmarks/load_test.py --host http://localhost:8080 --scenario book
+
+Without --host a mock server (benchmarks/mock_clob.py) is started in process.
+Scenarios:
+- book: get_order_book of random tokens
+- markets: a full get_markets pagination
+- post_order: create, sign and post a limit order
+- create_and_post_orders: the orders go through the pipelined create and post
+"""
+
+import argparse
+import os
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from mock_clob import MockClobServer, MockClobState  # noqa: E402
+from py_order_utils.model import BUY  # noqa: E402
+
+from py_clob_client.client import ClobClient  # noqa: E402
+from py_clob_client.clob_types import ApiCreds, OrderArgs  # noqa: E402
+from py_clob_client.constants import AMOY, END_CURSOR  # noqa: E402
+from py_clob_client.instrumentation import (  # noqa: E402
+    HistogramCollector,
+    set_instrumentation,
+)
+
+# publicly known private key
+PRIVATE_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+CREDS = ApiCreds(
+    api_key="000000000-0000-0000-0000-000000000000",
+    api_passphrase="aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+    api_secret="AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=",
+)
+
+
+def get_scenarios(client: ClobClient, token_ids: list) -> dict:
+    def book():
+        client.get_order_book(random.choice(token_ids))
+
+    def markets():
+        next_cursor = "MA=="
+        while next_cursor != END_CURSOR:
+            next_cursor = client.get_markets(next_cursor=next_cursor)["next_cursor"]
+
+    def order_args() -> OrderArgs:
+        return OrderArgs(
+            token_id=random.choice(token_ids),
+            price=random.randint(1, 99) / 100,
+            size=random.randint(5, 100),
+            side=BUY,
+        )
+
+    def post_order():
+        client.post_order(client.create_order(order_args()))
+
+    return {"book": book, "markets": markets, "post_order": post_order}
+
+
+def run_create_and_post_orders(
+    client: ClobClient, token_ids: list, workers: int, requests: int
+) -> list:
+    args = [
+        OrderArgs(
+            token_id=random.choice(token_ids),
+            price=random.randint(1, 99) / 100,
+            size=random.randint(5, 100),
+            side=BUY,
+        )
+        for _ in range(requests)
+    ]
+    responses = client.create_and_post_orders(args, max_in_flight=workers)
+    return [
+        None if isinstance(r, dict) and r.get("success") else "failed"
+        for r in responses
+    ]
+
+
+def timed(fn):
+    start = perf_counter()
+    try:
+        fn()
+        error = None
+    except Exception as e:
+        error = e
+    return perf_counter() - start, error
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--host", help="CLOB url, a mock server is started if omitted")
+    parser.add_argument(
+        "--scenario",
+        default="book",
+        choices=["book", "markets", "post_order", "create_and_post_orders"],
+    )
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0, help="mock latency, sec")
+    parser.add_argument("--jitter", type=float, default=0, help="mock jitter, sec")
+    parser.add_argument("--error-rate", type=float, default=0, help="mock errors")
+    parser.add_argument("--spans", action="store_true", help="print the span timings")
+    args = parser.parse_args()
+
+    server = None
+    host = args.host
+    if host is None:
+        state = MockClobState()
+        state.add_creds(CREDS)
+        server = MockClobServer(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            state=state,
+        ).start()
+        host = server.url
+
+    collector = HistogramCollector() if args.spans else None
+    if collector is not None:
+        set_instrumentation(collector)
+
+    client = ClobClient(host, chain_id=AMOY, key=PRIVATE_KEY, creds=CREDS)
+    markets = client.get_markets()["data"]
+    token_ids = [t["token_id"] for m in markets for t in m["tokens"]]
+
+    start = perf_counter()
+    if args.scenario == "create_and_post_orders":
+        errors = run_create_and_post_orders(
+            client, token_ids, args.workers, args.requests
+        )
+        durations = []
+    else:
+        fn = get_scenarios(client, token_ids)[args.scenario]
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            results = list(executor.map(lambda _: timed(fn), range(args.requests)))
+        durations = sorted(d for d, _ in results)
+        errors = [e for _, e in results]
+    elapsed = perf_counter() - start
+
+    failed = sum(1 for e in errors if e is not None)
+    print(
+        "{} x {} with {} workers in {:.2f}s".format(
+            args.scenario, args.requests, args.workers, elapsed
+        )
+    )
+    print("throughput: {:.1f} req/sec".format(args.requests / elapsed))
+    print("errors: {} ({:.1%})".format(failed, failed / args.requests))
+    if durations:
+        print(
+            "latency: p50 {:.2f}ms p99 {:.2f}ms max {:.2f}ms".format(
+                durations[len(durations) // 2] * 1e3,
+                durations[min(len(durations) - 1, int(len(durations) * 0.99))] * 1e3,
+                durations[-1] * 1e3,
+            )
+        )
+
+    if collector is not None:
+        print("{:<20} {:>8} {:>10} {:>10}".format("span", "count", "p50 ms", "p99 ms"))
+        for name, summary in sorted(collector.summary().items()):
+            print(
+                "{:<20} {:>8} {:>10.3f} {:>10.3f}".format(
+                    name, summary["count"], summary["p50"] * 1e3, summary["p99"] * 1e3
+                )
+            )
+        set_instrumentation(None)
+
+    if server is not None:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,506 @@
+"""
+Offline stand-in of the CLOB API, for throughput benchmarks and local testing
+
+    python benchmarks/mock_clob.py --port 8080 --latency 0.01 --error-rate 0.01
+
+Implements the routes of py_clob_client.endpoints with in-memory state:
+order books, prices, markets pagination with next_cursor, API keys, orders
+posting and cancellation, open orders and trades pagination.
+L2 requests are validated against the HMAC signature of the API key.
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import random
+import secrets
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from urllib.parse import parse_qs, urlsplit
+
+from py_clob_client.clob_types import ApiCreds
+from py_clob_client.constants import END_CURSOR
+from py_clob_client.endpoints import (
+    ARE_ORDERS_SCORING,
+    CANCEL,
+    CANCEL_ALL,
+    CANCEL_MARKET_ORDERS,
+    CANCEL_ORDERS,
+    CLOSED_ONLY,
+    CREATE_API_KEY,
+    DERIVE_API_KEY,
+    GET_API_KEYS,
+    GET_BALANCE_ALLOWANCE,
+    GET_LAST_TRADE_PRICE,
+    GET_LAST_TRADES_PRICES,
+    GET_MARKET,
+    GET_MARKETS,
+    GET_NEG_RISK,
+    GET_ORDER,
+    GET_ORDER_BOOK,
+    GET_ORDER_BOOKS,
+    GET_PRICES,
+    GET_SAMPLING_MARKETS,
+    GET_SAMPLING_SIMPLIFIED_MARKETS,
+    GET_SIMPLIFIED_MARKETS,
+    GET_SPREAD,
+    GET_SPREADS,
+    GET_TICK_SIZE,
+    MID_POINT,
+    MID_POINTS,
+    ORDERS,
+    POST_ORDER,
+    POST_ORDERS,
+    PRICE,
+    TIME,
+    TRADES,
+    UPDATE_BALANCE_ALLOWANCE,
+)
+from py_clob_client.headers.headers import (
+    POLY_ADDRESS,
+    POLY_API_KEY,
+    POLY_NONCE,
+    POLY_PASSPHRASE,
+    POLY_SIGNATURE,
+    POLY_TIMESTAMP,
+)
+from py_clob_client.signing.hmac import build_hmac_signature
+
+PAGE_SIZE = 100
+
+
+def encode_cursor(offset: int) -> str:
+    return base64.b64encode(str(offset).encode("utf-8")).decode("utf-8")
+
+
+def decode_cursor(cursor: str) -> int:
+    if not cursor or cursor == "MA==":
+        return 0
+    return int(base64.b64decode(cursor).decode("utf-8"))
+
+
+def paginate(items: list, cursor: str, page_size: int = PAGE_SIZE) -> dict:
+    offset = decode_cursor(cursor)
+    page = items[offset : offset + page_size]
+    end = offset + page_size >= len(items)
+    return {
+        "limit": page_size,
+        "count": len(page),
+        "next_cursor": END_CURSOR if end else encode_cursor(offset + page_size),
+        "data": page,
+    }
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, error: str):
+        self.status = status
+        self.error = error
+
+
+class MockClobState:
+    """
+    In-memory state of the mock CLOB
+    """
+
+    def __init__(self, n_markets: int = 250, seed: int = 0):
+        rng = random.Random(seed)
+        self.lock = Lock()
+        self.creds: dict[str, ApiCreds] = {}
+        self.creds_by_address: dict[tuple, ApiCreds] = {}
+        self.orders: dict[str, dict] = {}
+        self.trades: list[dict] = []
+        self.books: dict[str, dict] = {}
+        self.markets: list[dict] = []
+
+        for i in range(n_markets):
+            condition_id = "0x{:064x}".format(i + 1)
+            tokens = []
+            for outcome in ["Yes", "No"]:
+                token_id = str(rng.getrandbits(128))
+                mid = rng.randint(10, 90) / 100
+                self.books[token_id] = {
+                    "market": condition_id,
+                    "asset_id": token_id,
+                    "timestamp": str(int(time.time() * 1000)),
+                    "bids": [
+                        {"price": "{:.2f}".format(mid - 0.01 * (j + 1)), "size": "100"}
+                        for j in reversed(range(5))
+                        if mid - 0.01 * (j + 1) > 0
+                    ],
+                    "asks": [
+                        {"price": "{:.2f}".format(mid + 0.01 * (j + 1)), "size": "100"}
+                        for j in reversed(range(5))
+                        if mid + 0.01 * (j + 1) < 1
+                    ],
+                    "hash": "",
+                }
+                tokens.append({"token_id": token_id, "outcome": outcome, "price": mid})
+            self.markets.append(
+                {
+                    "condition_id": condition_id,
+                    "question": "Mock market {}".format(i),
+                    "minimum_tick_size": 0.01,
+                    "neg_risk": False,
+                    "active": True,
+                    "closed": False,
+                    "tokens": tokens,
+                }
+            )
+
+    def add_creds(self, creds: ApiCreds, address: str = None, nonce: int = 0):
+        self.creds[creds.api_key] = creds
+        if address is not None:
+            self.creds_by_address[(address.lower(), nonce)] = creds
+
+
+class MockClobHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    server: "MockClobServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+    def _handle(self, method: str):
+        url = urlsplit(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency + random.random() * server.jitter)
+
+        try:
+            if server.error_rate and random.random() < server.error_rate:
+                raise HttpError(500, "injected error")
+            status, payload = 200, server.route(
+                method, url.path, query, body, self.headers
+            )
+        except HttpError as e:
+            status, payload = e.status, {"error": e.error}
+
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class MockClobServer(ThreadingHTTPServer):
+    """
+    Mock CLOB served from a background thread, see start and stop
+    latency (+ a random jitter) is added to every response, and error_rate of the
+    requests fail with a 500
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        port: int = 0,
+        addr: str = "127.0.0.1",
+        latency: float = 0,
+        jitter: float = 0,
+        error_rate: float = 0,
+        state: MockClobState = None,
+    ):
+        super().__init__((addr, port), MockClobHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.state = state if state is not None else MockClobState()
+        self.__thread = None
+
+    @property
+    def url(self) -> str:
+        return "http://{}:{}".format(*self.server_address)
+
+    def start(self) -> "MockClobServer":
+        self.__thread = Thread(target=self.serve_forever, daemon=True)
+        self.__thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    # auth
+
+    def _assert_l1(self, headers):
+        for header in [POLY_ADDRESS, POLY_SIGNATURE, POLY_TIMESTAMP, POLY_NONCE]:
+            if not headers.get(header):
+                raise HttpError(401, "missing L1 header {}".format(header))
+
+    def _assert_l2(self, method: str, path: str, body, headers) -> ApiCreds:
+        creds = self.state.creds.get(headers.get(POLY_API_KEY))
+        if creds is None or headers.get(POLY_PASSPHRASE) != creds.api_passphrase:
+            raise HttpError(401, "Unauthorized/Invalid api key")
+        signature = build_hmac_signature(
+            creds.api_secret, headers.get(POLY_TIMESTAMP), method, path, body
+        )
+        if signature != headers.get(POLY_SIGNATURE):
+            raise HttpError(401, "Unauthorized/Invalid signature")
+        return creds
+
+    def _new_creds(self, headers) -> dict:
+        key = (headers[POLY_ADDRESS].lower(), int(headers[POLY_NONCE]))
+        with self.state.lock:
+            creds = self.state.creds_by_address.get(key)
+            if creds is None:
+                creds = ApiCreds(
+                    api_key=str(uuid.uuid4()),
+                    api_secret=base64.urlsafe_b64encode(secrets.token_bytes(32)).decode(
+                        "utf-8"
+                    ),
+                    api_passphrase=secrets.token_hex(32),
+                )
+                self.state.add_creds(creds, *key)
+        return {
+            "apiKey": creds.api_key,
+            "secret": creds.api_secret,
+            "passphrase": creds.api_passphrase,
+        }
+
+    # orders
+
+    def _post_order(self, order: dict) -> dict:
+        signed = order["order"]
+        order_id = (
+            "0x"
+            + hashlib.sha256(
+                json.dumps(signed, sort_keys=True).encode("utf-8")
+            ).hexdigest()
+        )
+        with self.state.lock:
+            self.state.orders[order_id] = {
+                "id": order_id,
+                "status": "LIVE",
+                "owner": order["owner"],
+                "asset_id": str(signed.get("tokenId")),
+                "side": signed.get("side"),
+                "original_size": str(signed.get("makerAmount")),
+                "size_matched": "0",
+                "order_type": order["orderType"],
+            }
+        return {
+            "success": True,
+            "errorMsg": "",
+            "orderID": order_id,
+            "status": "live",
+        }
+
+    def _cancel(self, order_ids: list) -> dict:
+        canceled, not_canceled = [], {}
+        with self.state.lock:
+            for order_id in order_ids:
+                if self.state.orders.pop(order_id, None) is not None:
+                    canceled.append(order_id)
+                else:
+                    not_canceled[order_id] = "order not found"
+        return {"canceled": canceled, "not_canceled": not_canceled}
+
+    # routing
+
+    def _book(self, token_id: str) -> dict:
+        book = self.state.books.get(token_id)
+        if book is None:
+            raise HttpError(404, "No orderbook exists for the requested token id")
+        return book
+
+    def _mid(self, token_id: str) -> str:
+        book = self._book(token_id)
+        return str(
+            round(
+                (float(book["bids"][-1]["price"]) + float(book["asks"][-1]["price"]))
+                / 2,
+                4,
+            )
+        )
+
+    def _price(self, token_id: str, side: str) -> str:
+        book = self._book(token_id)
+        return book["bids"][-1]["price"] if side == "BUY" else book["asks"][-1]["price"]
+
+    def _spread(self, token_id: str) -> str:
+        book = self._book(token_id)
+        return "{:.2f}".format(
+            float(book["asks"][-1]["price"]) - float(book["bids"][-1]["price"])
+        )
+
+    def route(self, method: str, path: str, query: dict, body, headers):
+        state = self.state
+        token_id = query.get("token_id")
+
+        if method == "GET":
+            if path == "/":
+                return "OK"
+            if path == TIME:
+                return int(time.time())
+            if path == GET_ORDER_BOOK:
+                return self._book(token_id)
+            if path == MID_POINT:
+                return {"mid": self._mid(token_id)}
+            if path == PRICE:
+                return {"price": self._price(token_id, query.get("side"))}
+            if path == GET_SPREAD:
+                return {"spread": self._spread(token_id)}
+            if path == GET_TICK_SIZE:
+                self._book(token_id)
+                return {"minimum_tick_size": 0.01}
+            if path == GET_NEG_RISK:
+                self._book(token_id)
+                return {"neg_risk": False}
+            if path == GET_LAST_TRADE_PRICE:
+                return {"price": self._mid(token_id), "side": "BUY"}
+            if path in [
+                GET_MARKETS,
+                GET_SIMPLIFIED_MARKETS,
+                GET_SAMPLING_MARKETS,
+                GET_SAMPLING_SIMPLIFIED_MARKETS,
+            ]:
+                return paginate(state.markets, query.get("next_cursor"))
+            if path.startswith(GET_MARKET):
+                condition_id = path[len(GET_MARKET) :]
+                for market in state.markets:
+                    if market["condition_id"] == condition_id:
+                        return market
+                raise HttpError(404, "market not found")
+            if path == DERIVE_API_KEY:
+                self._assert_l1(headers)
+                key = (headers[POLY_ADDRESS].lower(), int(headers[POLY_NONCE]))
+                if key not in state.creds_by_address:
+                    raise HttpError(400, "Could not derive api key!")
+                return self._new_creds(headers)
+
+        if method == "POST":
+            if path == GET_ORDER_BOOKS:
+                return [self._book(p["token_id"]) for p in body]
+            if path == MID_POINTS:
+                return {p["token_id"]: self._mid(p["token_id"]) for p in body}
+            if path == GET_PRICES:
+                return {
+                    p["token_id"]: {p["side"]: self._price(p["token_id"], p["side"])}
+                    for p in body
+                }
+            if path == GET_SPREADS:
+                return {p["token_id"]: self._spread(p["token_id"]) for p in body}
+            if path == GET_LAST_TRADES_PRICES:
+                return [
+                    {"token_id": p["token_id"], "price": self._mid(p["token_id"])}
+                    for p in body
+                ]
+            if path == CREATE_API_KEY:
+                self._assert_l1(headers)
+                return self._new_creds(headers)
+
+        # L2 endpoints
+        creds = self._assert_l2(method, path, body, headers)
+
+        if method == "GET":
+            if path == GET_API_KEYS:
+                return {"apiKeys": [creds.api_key]}
+            if path == CLOSED_ONLY:
+                return {"closed_only": False}
+            if path == ORDERS:
+                with state.lock:
+                    orders = [
+                        o
+                        for o in state.orders.values()
+                        if o["owner"] == creds.api_key
+                        and (
+                            not query.get("asset_id")
+                            or o["asset_id"] == query["asset_id"]
+                        )
+                        and (not query.get("id") or o["id"] == query["id"])
+                    ]
+                return paginate(orders, query.get("next_cursor"))
+            if path.startswith(GET_ORDER):
+                order = state.orders.get(path[len(GET_ORDER) :])
+                if order is None:
+                    raise HttpError(404, "order not found")
+                return order
+            if path == TRADES:
+                return paginate(state.trades, query.get("next_cursor"))
+            if path in [GET_BALANCE_ALLOWANCE, UPDATE_BALANCE_ALLOWANCE]:
+                return {"balance": "1000000000", "allowance": "1000000000"}
+
+        if method == "POST":
+            if path == POST_ORDER:
+                return self._post_order(body)
+            if path == POST_ORDERS:
+                return [self._post_order(order) for order in body]
+            if path == ARE_ORDERS_SCORING:
+                return {order_id: False for order_id in body}
+
+        if method == "DELETE":
+            if path == CANCEL and isinstance(body, dict):
+                return self._cancel([body["orderID"]])
+            if path == CANCEL_ORDERS:
+                return self._cancel(body)
+            if path == CANCEL_ALL:
+                with state.lock:
+                    ids = [
+                        o["id"]
+                        for o in state.orders.values()
+                        if o["owner"] == creds.api_key
+                    ]
+                return self._cancel(ids)
+            if path == CANCEL_MARKET_ORDERS:
+                with state.lock:
+                    ids = [
+                        o["id"]
+                        for o in state.orders.values()
+                        if o["owner"] == creds.api_key
+                        and (
+                            not body.get("asset_id")
+                            or o["asset_id"] == body["asset_id"]
+                        )
+                    ]
+                return self._cancel(ids)
+
+        raise HttpError(404, "{} {} not found".format(method, path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline stand-in of the CLOB API")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--jitter", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--markets", type=int, default=250)
+    args = parser.parse_args()
+
+    server = MockClobServer(
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        state=MockClobState(n_markets=args.markets),
+    )
+    print("mock CLOB listening on {}".format(server.url))
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
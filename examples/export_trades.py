@@ -0,0 +1,33 @@
+import os
+
+from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import ApiCreds, TradeParams
+from py_clob_client.trade_export import TradesExport
+from dotenv import load_dotenv
+
+from py_clob_client.constants import AMOY
+
+load_dotenv()
+
+
+def main():
+    host = os.getenv("CLOB_API_URL", "https://clob.polymarket.com")
+    key = os.getenv("PK")
+    creds = ApiCreds(
+        api_key=os.getenv("CLOB_API_KEY"),
+        api_secret=os.getenv("CLOB_SECRET"),
+        api_passphrase=os.getenv("CLOB_PASS_PHRASE"),
+    )
+    chain_id = AMOY
+    client = ClobClient(host, key=key, chain_id=chain_id, creds=creds)
+
+    # re-running the export resumes from the last written page
+    export = TradesExport(
+        client, "trades", TradeParams(maker_address=client.get_address())
+    )
+    rows = export.run()
+    print("{} trades exported to {}".format(rows, export.files()))
+    print("Done!")
+
+
+main()
@@ -0,0 +1,47 @@
+import os
+
+from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import ApiCreds, OrderArgs, PostOrdersArgs, OrderType
+from dotenv import load_dotenv
+from py_clob_client.constants import AMOY
+
+from py_clob_client.order_builder.constants import BUY
+
+
+load_dotenv()
+
+
+def main():
+    host = os.getenv("CLOB_API_URL", "https://clob.polymarket.com")
+    key = os.getenv("PK")
+    creds = ApiCreds(
+        api_key=os.getenv("CLOB_API_KEY"),
+        api_secret=os.getenv("CLOB_SECRET"),
+        api_passphrase=os.getenv("CLOB_PASS_PHRASE"),
+    )
+    chain_id = AMOY
+    client = ClobClient(host, key=key, chain_id=chain_id, creds=creds)
+
+    # A ladder of 100 limit orders buying 10 YES tokens from 0.01 to 0.50
+    ladder = [
+        PostOrdersArgs(
+            order=client.create_order(
+                OrderArgs(
+                    price=round(0.01 + 0.005 * i, 3),
+                    size=10,
+                    side=BUY,
+                    token_id="71321045679252212594626385532706912750332728571942532289631379312455583992563",
+                )
+            ),
+            orderType=OrderType.GTC,  # Good 'Til Cancelled
+        )
+        for i in range(100)
+    ]
+
+    # Split into server sized batches and submitted concurrently
+    resp = client.post_orders_batched(ladder, max_workers=4)
+    print(resp)
+    print("Done!")
+
+
+main()
@@ -0,0 +1,20 @@
+import os
+
+from py_clob_client.market_data import MarketDataClient
+
+
+def main():
+    host = os.getenv("CLOB_API_URL", "https://clob.polymarket.com")
+    client = MarketDataClient(host)
+
+    token_ids = [
+        "71321045679252212594626385532706912750332728571942532289631379312455583992563",
+        "52114319501245915516055106046884209969926127482827954674443846427813813222426",
+    ]
+    for book in client.stream_order_books(token_ids, interval=1, max_polls=10):
+        best_bid = book.bids[-1].price if book.bids else None
+        best_ask = book.asks[-1].price if book.asks else None
+        print(book.asset_id, best_bid, best_ask, book.hash)
+
+
+main()
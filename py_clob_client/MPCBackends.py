@@ -0,0 +1,134 @@
+import asyncio
+import base64
+import json
+import logging
+import random
+
+from eth_keys import keys
+from eth_utils import keccak
+
+NEAR_MAINNET_RPC = "https://1rpc.io/near"
+NEAR_TESTNET_RPC = "https://test.rpc.fastnear.com"
+
+SIGN_HASH_GAS = 300000000000000
+
+SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+
+class MPCBackend:
+    """
+    Signs message hashes with an MPC key derived for a path
+    sign_hash returns the signature in the MPC contract format:
+    {"big_r": {"affine_point": ...}, "s": {"scalar": ...}, "recovery_id": ...}
+    """
+
+    async def startup(self):
+        """
+        Opens the connection to the backend
+        """
+
+    async def sign_hash(self, message_hash: str, path: str) -> dict:
+        raise NotImplementedError
+
+
+class NearMPCBackend(MPCBackend):
+    """
+    MPC signatures from the sign_hash method of a NEAR contract
+    Every signature is a function call of the agent account, network is "mainnet" or
+    any other value for the testnet, or an RPC url
+    """
+
+    def __init__(
+        self, account_id: str, private_key, network: str, contract_account: str
+    ):
+        # py_near is only needed by this backend
+        from py_near.account import Account
+
+        self.account_id = account_id
+        self.contract_account = contract_account
+        network = network or "testnet"
+        if network == "mainnet":
+            self.network = NEAR_MAINNET_RPC
+        elif network.startswith("http"):
+            self.network = network
+        else:
+            self.network = NEAR_TESTNET_RPC
+        self.account = Account(account_id, private_key, self.network)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def startup(self):
+        await self.account.startup()
+
+    async def sign_hash(self, message_hash: str, path: str) -> dict:
+        result = await self.account.function_call(
+            self.contract_account,
+            "sign_hash",
+            {"hash": message_hash, "path": path},
+            gas=SIGN_HASH_GAS,
+            amount=1,
+        )
+        return self._extract_signature_from_result(result)
+
+    def _extract_signature_from_result(self, result):
+        """Extract the signature from the transaction result"""
+
+        if hasattr(result, "status"):
+            if isinstance(result.status, dict) and "SuccessValue" in result.status:
+                success_value = result.status["SuccessValue"]
+                decoded_bytes = base64.b64decode(success_value)
+                return json.loads(decoded_bytes.decode("utf-8"))
+            else:
+                raise Exception(f"Unexpected result structure: {result.status}")
+        else:
+            self.logger.debug("sign_hash result has no status attribute")
+            return None
+
+
+class LocalMPCBackend(MPCBackend):
+    """
+    Offline stand-in of the MPC contract, for tests and benchmarks
+    The key of a path is derived from a local root key, every signature waits
+    latency seconds (+ a random jitter) to simulate the chain round trip
+    """
+
+    def __init__(self, private_key: str, latency: float = 0, jitter: float = 0):
+        self.root_key = int(private_key.replace("0x", ""), 16)
+        self.latency = latency
+        self.jitter = jitter
+        self.__keys: dict[str, keys.PrivateKey] = {}
+
+    def private_key(self, path: str) -> keys.PrivateKey:
+        key = self.__keys.get(path)
+        if key is None:
+            tweak = int.from_bytes(keccak(text=path), "big")
+            key = keys.PrivateKey(
+                ((self.root_key + tweak) % SECP256K1_N).to_bytes(32, "big")
+            )
+            self.__keys[path] = key
+        return key
+
+    def address(self, path: str) -> str:
+        """
+        Address of the key derived for the path
+        """
+        return self.private_key(path).public_key.to_checksum_address()
+
+    async def sign_hash(self, message_hash: str, path: str) -> dict:
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + random.random() * self.jitter)
+
+        # CPU bound, kept off the event loop like the signature verification
+        signature = await asyncio.get_running_loop().run_in_executor(
+            None,
+            self.private_key(path).sign_msg_hash,
+            bytes.fromhex(message_hash.replace("0x", "")),
+        )
+        return {
+            "big_r": {
+                "affine_point": "{}{:064X}".format(
+                    "03" if signature.v else "02", signature.r
+                )
+            },
+            "s": {"scalar": "{:064X}".format(signature.s)},
+            "recovery_id": signature.v,
+        }
@@ -1,84 +1,220 @@
-from .clob_types import ApiCreds, MarketOrderArgs, PartialCreateOrderOptions, CreateOrderOptions, OrderType, TickSize, OrderBookSummary, RequestArgs
-from .MPCSigner import MPCSigner
-from .order_builder.MPCBuilder import MPCOrderBuilder
-from .constants import L0, L1, L2, L1_AUTH_UNAVAILABLE, L2_AUTH_UNAVAILABLE
+import asyncio
 import logging
-from .headers.MPCheaders import create_level_1_headers, create_level_2_headers
-from .endpoints import CREATE_API_KEY, DERIVE_API_KEY, GET_NEG_RISK, GET_TICK_SIZE, GET_ORDER_BOOK, POST_ORDER
-from .http_helpers.helpers import post, get
-from .exceptions import PolyException
-from typing import Optional
-from .utilities import price_valid, is_tick_size_smaller, parse_raw_orderbook_summary, order_to_json
+from typing import AsyncIterator, Optional
+
+from .MPCBackends import MPCBackend
+from .MPCSigner import MPCSigner
+from .cache import MarketMetadataCache
+from .client import ClobClient
+from .clob_types import (
+    ApiCreds,
+    BalanceAllowanceParams,
+    BookParams,
+    DropNotificationParams,
+    MarketOrderArgs,
+    OpenOrderParams,
+    OrderArgs,
+    OrderBookSummary,
+    OrderScoringParams,
+    OrdersScoringParams,
+    OrderType,
+    PartialCreateOrderOptions,
+    PostOrdersArgs,
+    TickSize,
+    TradeParams,
+)
+from .constants import POST_ORDERS_MAX_BATCH_SIZE
+from .endpoints import CREATE_API_KEY, DERIVE_API_KEY
+from .exceptions import PolyApiException
+from .headers.headers import create_level_1_headers_async
+from .http_helpers.helpers import get, post
+
 
 class MPCClobClient:
     def __init__(
         self,
         host,
         chain_id: int = None,
-        signature_type: int = None, 
-        funder: str = None, # define the funder as the OTA account
+        signature_type: int = None,
+        funder: str = None,  # define the funder as the OTA account
         agent_account: str = None,
         agent_private_key: str = None,
         agent_near_network: str = None,
         path: str = None,
         contract_account: str = None,
+        mpc_backend: MPCBackend = None,
+        creds: ApiCreds = None,
+        metadata_cache: MarketMetadataCache = None,
     ):
         """
-        Initializes the clob client
+        Initializes the async clob client of an MPC account
         The client can be started in 3 modes:
         1) Level 0: Requires only the clob host url
                     Allows access to open CLOB endpoints
 
-        2) Level 1: Requires the host, chain_id and a private key.
+        2) Level 1: Requires the host, chain_id and the MPC signer (agent account, path, ...)
                     Allows access to L1 authenticated endpoints + all unauthenticated endpoints
 
-        3) Level 2: Requires the host, chain_id, a private key, and Credentials.
+        3) Level 2: Requires the host, chain_id, the MPC signer, and Credentials.
                     Allows access to all endpoints
+
+        The MPC signatures come from the NEAR agent account, or from mpc_backend if given.
+        The requests go through a ClobClient sharing the transport and the metadata cache,
+        they run in threads so they never block the event loop
         """
-        self.host = host[0:-1] if host.endswith("/") else host
+        self.mpc_signer = (
+            MPCSigner(
+                agent_account,
+                agent_private_key,
+                agent_near_network,
+                funder,  # ota_account
+                chain_id,
+                path,
+                contract_account,
+                backend=mpc_backend,
+            )
+            if path
+            and (
+                mpc_backend is not None
+                or (
+                    agent_account
+                    and agent_private_key
+                    and agent_near_network
+                    and contract_account
+                )
+            )
+            else None
+        )
+
+        self.client = ClobClient(
+            host,
+            chain_id=chain_id,
+            creds=creds,
+            signature_type=signature_type,
+            funder=funder,
+            metadata_cache=metadata_cache,
+            signer=self.mpc_signer,
+        )
+        self.host = self.client.host
         self.chain_id = chain_id
-        self.creds = None
-        
-        self.mpc_signer = MPCSigner(
-            agent_account, 
-            agent_private_key, 
-            agent_near_network, 
-            funder,  # ota_account
-            chain_id,  
-            path,  
-            contract_account
-        ) if agent_account and agent_private_key and agent_near_network and path and contract_account else None
-        
-        self.mode = self._get_client_mode()
-       
 
         if self.mpc_signer:
-            self.builder = MPCOrderBuilder(
-                self.mpc_signer, sig_type=signature_type, funder=funder
-            )
-
-        # local cache
-        self.__tick_sizes = {}
-        self.__neg_risk = {}
+            # same builder as the client, the orders are signed with its async methods
+            self.builder = self.client.builder
 
         self.logger = logging.getLogger(self.__class__.__name__)
 
-    def _get_client_mode(self):
-        if self.mpc_signer is not None and self.creds is not None:
-            return L2
+    @property
+    def creds(self) -> ApiCreds:
+        return self.client.creds
+
+    @creds.setter
+    def creds(self, creds: ApiCreds):
+        # the mode of the client follows its creds
+        self.client.set_api_creds(creds)
+
+    @property
+    def mode(self) -> int:
+        return self.client.mode
+
+    @property
+    def order_tracker(self):
+        return self.client.order_tracker
+
+    async def enable_order_tracking(self, reconcile_interval: float = None):
+        """
+        Tracks the open orders locally, see ClobClient.enable_order_tracking
+        """
+        return await self.__run(self.client.enable_order_tracking, reconcile_interval)
+
+    def disable_order_tracking(self):
+        self.client.disable_order_tracking()
+
+    @property
+    def balance_ledger(self):
+        return self.client.balance_ledger
+
+    async def enable_balance_tracking(
+        self, sync_interval: float = None, token_ids: list[str] = None
+    ):
+        """
+        Tracks the balance and the positions locally, see
+        ClobClient.enable_balance_tracking
+        """
+        return await self.__run(
+            self.client.enable_balance_tracking, sync_interval, token_ids
+        )
+
+    def disable_balance_tracking(self):
+        self.client.disable_balance_tracking()
+
+    async def enable_clock_sync(self, interval: float = 60):
+        """
+        Timestamps the auth headers with an estimate of the server clock, see
+        ClobClient.enable_clock_sync
+        """
+        await self.__run(self.client.enable_clock_sync, interval)
+
+    def disable_clock_sync(self):
+        self.client.disable_clock_sync()
+
+    async def __run(self, fn, *args, **kwargs):
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    async def __iterate(self, iterator) -> AsyncIterator:
+        # every step of the iterator runs in a thread
+        done = object()
+        while True:
+            item = await self.__run(next, iterator, done)
+            if item is done:
+                return
+            yield item
+
+    def __timestamp(self) -> Optional[int]:
+        # server clock of the client, see enable_clock_sync
+        clock = self.client.clock
+        return clock.timestamp() if clock is not None else None
+
+    async def startup(self):
+        """
+        Opens the connection of the MPC signer
+        """
         if self.mpc_signer is not None:
-            return L1
-        return L0
-    
-    async def create_or_derive_api_creds(self, nonce: int = None) -> ApiCreds:
+            await self.mpc_signer.startup()
+
+    def get_address(self):
         """
-        Creates API creds if not already created for nonce, otherwise derives them
+        Returns the address of the MPC account
         """
-        try:
-            return await self.create_api_key(nonce)
-        except:
-            return await self.derive_api_key(nonce)
-    
+        return self.client.get_address()
+
+    def get_collateral_address(self):
+        return self.client.get_collateral_address()
+
+    def get_conditional_address(self):
+        return self.client.get_conditional_address()
+
+    def get_exchange_address(self, neg_risk=False):
+        return self.client.get_exchange_address(neg_risk)
+
+    def assert_level_1_auth(self):
+        """
+        Level 1 Poly Auth
+        """
+        self.client.assert_level_1_auth()
+
+    def assert_level_2_auth(self):
+        """
+        Level 2 Poly Auth
+        """
+        self.client.assert_level_2_auth()
+
+    async def get_ok(self):
+        return await self.__run(self.client.get_ok)
+
+    async def get_server_time(self):
+        return await self.__run(self.client.get_server_time)
+
     async def create_api_key(self, nonce: int = None) -> ApiCreds:
         """
         Creates a new CLOB API key for the given
@@ -86,11 +222,11 @@ class MPCClobClient:
         self.assert_level_1_auth()
 
         endpoint = "{}{}".format(self.host, CREATE_API_KEY)
-        headers = await create_level_1_headers(self.mpc_signer, nonce)
-        
+        headers = await create_level_1_headers_async(
+            self.mpc_signer, nonce, timestamp=self.__timestamp()
+        )
 
-        creds_raw = post(endpoint, headers=headers)
-      
+        creds_raw = await self.__run(post, endpoint, headers=headers)
         try:
             creds = ApiCreds(
                 api_key=creds_raw["apiKey"],
@@ -101,15 +237,7 @@ class MPCClobClient:
             self.logger.error("Couldn't parse created CLOB creds")
             return None
         return creds
-    
-    def assert_level_1_auth(self):
-        """
-        Level 1 Poly Auth
-        """
 
-        if self.mode < L1:
-            raise PolyException(L1_AUTH_UNAVAILABLE)
-        
     async def derive_api_key(self, nonce: int = None) -> ApiCreds:
         """
         Derives an already existing CLOB API key for the given address and nonce
@@ -117,11 +245,11 @@ class MPCClobClient:
         self.assert_level_1_auth()
 
         endpoint = "{}{}".format(self.host, DERIVE_API_KEY)
-        headers = await create_level_1_headers(self.mpc_signer, nonce)
-       
+        headers = await create_level_1_headers_async(
+            self.mpc_signer, nonce, timestamp=self.__timestamp()
+        )
 
-        creds_raw = get(endpoint, headers=headers)
-        
+        creds_raw = await self.__run(get, endpoint, headers=headers)
         try:
             creds = ApiCreds(
                 api_key=creds_raw["apiKey"],
@@ -132,18 +260,96 @@ class MPCClobClient:
             self.logger.error("Couldn't parse derived CLOB creds")
             return None
         return creds
-    
+
+    async def create_or_derive_api_creds(self, nonce: int = None) -> ApiCreds:
+        """
+        Creates API creds if not already created for nonce, otherwise derives them
+        """
+        try:
+            return await self.create_api_key(nonce)
+        except:
+            return await self.derive_api_key(nonce)
+
     def set_api_creds(self, creds: ApiCreds):
         """
         Sets client api creds
         """
-        self.creds = creds
-        self.mode = self._get_client_mode()
+        self.client.set_api_creds(creds)
 
-    async def create_market_order(
+    async def get_api_keys(self):
+        return await self.__run(self.client.get_api_keys)
+
+    async def get_closed_only_mode(self):
+        return await self.__run(self.client.get_closed_only_mode)
+
+    async def delete_api_key(self):
+        return await self.__run(self.client.delete_api_key)
+
+    async def get_midpoint(self, token_id):
+        return await self.__run(self.client.get_midpoint, token_id)
+
+    async def get_midpoints(self, params: list[BookParams]):
+        return await self.__run(self.client.get_midpoints, params)
+
+    async def get_price(self, token_id, side):
+        return await self.__run(self.client.get_price, token_id, side)
+
+    async def get_prices(self, params: list[BookParams]):
+        return await self.__run(self.client.get_prices, params)
+
+    async def get_spread(self, token_id):
+        return await self.__run(self.client.get_spread, token_id)
+
+    async def get_spreads(self, params: list[BookParams]):
+        return await self.__run(self.client.get_spreads, params)
+
+    async def get_tick_size(self, token_id: str) -> TickSize:
+        return await self.__run(self.client.get_tick_size, token_id)
+
+    async def get_neg_risk(self, token_id: str) -> bool:
+        return await self.__run(self.client.get_neg_risk, token_id)
+
+    async def get_order_book(self, token_id) -> OrderBookSummary:
+        return await self.__run(self.client.get_order_book, token_id)
+
+    async def get_order_books(self, params: list[BookParams]) -> list[OrderBookSummary]:
+        return await self.__run(self.client.get_order_books, params)
+
+    def get_order_book_hash(self, orderbook: OrderBookSummary) -> str:
+        return self.client.get_order_book_hash(orderbook)
+
+    async def stream_order_books(
         self,
-        order_args: MarketOrderArgs,
-        options: Optional[PartialCreateOrderOptions] = None,
+        token_ids: list[str],
+        interval: float = 1,
+        max_polls: Optional[int] = None,
+    ) -> AsyncIterator[OrderBookSummary]:
+        """
+        Polls the orderbooks of the token ids, see ClobClient.stream_order_books
+        """
+        async for book in self.__iterate(
+            self.client.stream_order_books(token_ids, interval, max_polls)
+        ):
+            yield book
+
+    async def get_last_trade_price(self, token_id):
+        return await self.__run(self.client.get_last_trade_price, token_id)
+
+    async def get_last_trades_prices(self, params: list[BookParams]):
+        return await self.__run(self.client.get_last_trades_prices, params)
+
+    async def calculate_market_price(
+        self, token_id: str, side: str, amount: float, order_type: OrderType
+    ) -> float:
+        """
+        Calculates the matching price considering an amount and the current orderbook
+        """
+        return await self.__run(
+            self.client.calculate_market_price, token_id, side, amount, order_type
+        )
+
+    async def create_order(
+        self, order_args: OrderArgs, options: Optional[PartialCreateOrderOptions] = None
     ):
         """
         Creates and signs an order
@@ -151,124 +357,175 @@ class MPCClobClient:
         """
         self.assert_level_1_auth()
 
-        # add resolve_order_options, or similar
-        tick_size = self.__resolve_tick_size(
+        create_options = await self.__run(
+            self.client.resolve_order_options,
             order_args.token_id,
-            options.tick_size if options else None,
+            order_args.price,
+            options,
         )
+        return await self.builder.create_order_async(order_args, create_options)
+
+    async def create_market_order(
+        self,
+        order_args: MarketOrderArgs,
+        options: Optional[PartialCreateOrderOptions] = None,
+    ):
+        """
+        Creates and signs a market order
+        Level 1 Auth required
+        """
+        self.assert_level_1_auth()
 
         if order_args.price is None or order_args.price <= 0:
-            order_args.price = self.calculate_market_price(
+            order_args.price = await self.calculate_market_price(
                 order_args.token_id,
                 order_args.side,
                 order_args.amount,
                 order_args.order_type,
             )
 
-        if not price_valid(order_args.price, tick_size):
-            raise Exception(
-                "price ("
-                + str(order_args.price)
-                + "), min: "
-                + str(tick_size)
-                + " - max: "
-                + str(1 - float(tick_size))
-            )
-
-        neg_risk = (
-            options.neg_risk
-            if options and options.neg_risk
-            else self.get_neg_risk(order_args.token_id)
-        )
-        
-        return await self.builder.create_market_order(
-            order_args,
-            CreateOrderOptions(
-                tick_size=tick_size,
-                neg_risk=neg_risk,
-            ),
+        create_options = await self.__run(
+            self.client.resolve_order_options,
+            order_args.token_id,
+            order_args.price,
+            options,
         )
+        return await self.builder.create_market_order_async(order_args, create_options)
 
-    def __resolve_tick_size(
-        self, token_id: str, tick_size: TickSize = None
-    ) -> TickSize:
-        min_tick_size = self.get_tick_size(token_id)
-        if tick_size is not None:
-            if is_tick_size_smaller(tick_size, min_tick_size):
-                raise Exception(
-                    "invalid tick size ("
-                    + str(tick_size)
-                    + "), minimum for the market is "
-                    + str(min_tick_size),
-                )
-        else:
-            tick_size = min_tick_size
-        return tick_size    
-    
-    def calculate_market_price(
-        self, token_id: str, side: str, amount: float, order_type: OrderType
-    ) -> float:
+    async def post_order(self, order, orderType: OrderType = OrderType.GTC):
         """
-        Calculates the matching price considering an amount and the current orderbook
+        Posts the order
         """
-        book = self.get_order_book(token_id)
-        if book is None:
-            raise Exception("no orderbook")
-        if side == "BUY":
-            if book.asks is None:
-                raise Exception("no match")
-            return self.builder.calculate_buy_market_price(
-                book.asks, amount, order_type
-            )
-        else:
-            if book.bids is None:
-                raise Exception("no match")
-            return self.builder.calculate_sell_market_price(
-                book.bids, amount, order_type
-            )
-        
-
-    def get_neg_risk(self, token_id: str) -> bool:
-        if token_id in self.__neg_risk:
-            return self.__neg_risk[token_id]
-
-        result = get("{}{}?token_id={}".format(self.host, GET_NEG_RISK, token_id))
-        self.__neg_risk[token_id] = result["neg_risk"]
-
-        return result["neg_risk"] 
+        return await self.__run(self.client.post_order, order, orderType)
 
-    def get_tick_size(self, token_id: str) -> TickSize:
-        if token_id in self.__tick_sizes:
-            return self.__tick_sizes[token_id]
+    async def post_orders(self, args: list[PostOrdersArgs]):
+        """
+        Posts orders
+        """
+        return await self.__run(self.client.post_orders, args)
 
-        result = get("{}{}?token_id={}".format(self.host, GET_TICK_SIZE, token_id))
-        self.__tick_sizes[token_id] = str(result["minimum_tick_size"])
+    async def post_orders_batched(
+        self,
+        args: list[PostOrdersArgs],
+        batch_size: int = POST_ORDERS_MAX_BATCH_SIZE,
+        max_workers: int = 4,
+    ) -> list:
+        """
+        Posts a list of orders of any length, see ClobClient.post_orders_batched
+        """
+        return await self.__run(
+            self.client.post_orders_batched, args, batch_size, max_workers
+        )
 
-        return self.__tick_sizes[token_id]
-    
-    def get_order_book(self, token_id) -> OrderBookSummary:
+    async def create_and_post_order(
+        self, order_args: OrderArgs, options: PartialCreateOrderOptions = None
+    ):
         """
-        Fetches the orderbook for the token_id
+        Utility function to create and publish an order
         """
-        raw_obs = get("{}{}?token_id={}".format(self.host, GET_ORDER_BOOK, token_id))
-        return parse_raw_orderbook_summary(raw_obs)
-    
-    def post_order(self, order, orderType: OrderType = OrderType.GTC):
+        order = await self.create_order(order_args, options)
+        return await self.post_order(order)
+
+    async def create_and_post_orders(
+        self,
+        order_args: list[OrderArgs],
+        options: PartialCreateOrderOptions = None,
+        orderType: OrderType = OrderType.GTC,
+        max_in_flight: int = 8,
+    ) -> list:
         """
-        Posts the order
+        Utility function to create and publish a stream of orders
+        Up to max_in_flight orders are in progress at a time, so the MPC signature
+        requests of the next orders overlap with the posting of the previous ones.
+        Returns one result per order, in the same order as the input args.
+        An order that couldn't be created or posted yields an error result
+        Level 2 Auth required
         """
         self.assert_level_2_auth()
-        body = order_to_json(order, self.creds.api_key, orderType)
-        headers = create_level_2_headers(
-            self.mpc_signer.ota_account,
-            self.creds,
-            RequestArgs(method="POST", request_path=POST_ORDER, body=body),
-        )
-        return post("{}{}".format(self.host, POST_ORDER), headers=headers, data=body)
+        semaphore = asyncio.Semaphore(max_in_flight)
 
-    def assert_level_2_auth(self):
+        async def create_and_post(args: OrderArgs):
+            async with semaphore:
+                try:
+                    order = await self.create_order(args, options)
+                    return await self.post_order(order, orderType)
+                except Exception as e:
+                    self.logger.error("Couldn't create and post order: {}".format(e))
+                    return {
+                        "success": False,
+                        "errorMsg": (
+                            e.error_msg if isinstance(e, PolyApiException) else str(e)
+                        ),
+                    }
+
+        return await asyncio.gather(*[create_and_post(args) for args in order_args])
+
+    async def cancel(self, order_id):
+        return await self.__run(self.client.cancel, order_id)
+
+    async def cancel_orders(self, order_ids):
+        return await self.__run(self.client.cancel_orders, order_ids)
+
+    async def cancel_all(self):
+        return await self.__run(self.client.cancel_all)
+
+    async def cancel_market_orders(self, market: str = "", asset_id: str = ""):
+        return await self.__run(self.client.cancel_market_orders, market, asset_id)
+
+    async def get_orders(self, params: OpenOrderParams = None, next_cursor="MA=="):
+        return await self.__run(self.client.get_orders, params, next_cursor)
+
+    async def get_order(self, order_id):
+        return await self.__run(self.client.get_order, order_id)
+
+    async def get_trades(self, params: TradeParams = None, next_cursor="MA=="):
+        return await self.__run(self.client.get_trades, params, next_cursor)
+
+    async def iter_trades_pages(
+        self, params: TradeParams = None, next_cursor="MA=="
+    ) -> AsyncIterator[tuple[list[dict], str]]:
         """
-        Level 2 Poly Auth
+        Streams the trade history one page at a time, see ClobClient.iter_trades_pages
         """
-        if self.mode < L2:
-            raise PolyException(L2_AUTH_UNAVAILABLE)
\ No newline at end of file
+        async for page in self.__iterate(
+            self.client.iter_trades_pages(params, next_cursor)
+        ):
+            yield page
+
+    async def get_notifications(self):
+        return await self.__run(self.client.get_notifications)
+
+    async def drop_notifications(self, params: DropNotificationParams = None):
+        return await self.__run(self.client.drop_notifications, params)
+
+    async def is_order_scoring(self, params: OrderScoringParams):
+        return await self.__run(self.client.is_order_scoring, params)
+
+    async def are_orders_scoring(self, params: OrdersScoringParams):
+        return await self.__run(self.client.are_orders_scoring, params)
+
+    async def get_balance_allowance(self, params: BalanceAllowanceParams = None):
+        return await self.__run(self.client.get_balance_allowance, params)
+
+    async def update_balance_allowance(self, params: BalanceAllowanceParams = None):
+        return await self.__run(self.client.update_balance_allowance, params)
+
+    async def get_markets(self, next_cursor="MA=="):
+        return await self.__run(self.client.get_markets, next_cursor)
+
+    async def get_simplified_markets(self, next_cursor="MA=="):
+        return await self.__run(self.client.get_simplified_markets, next_cursor)
+
+    async def get_sampling_markets(self, next_cursor="MA=="):
+        return await self.__run(self.client.get_sampling_markets, next_cursor)
+
+    async def get_sampling_simplified_markets(self, next_cursor="MA=="):
+        return await self.__run(
+            self.client.get_sampling_simplified_markets, next_cursor
+        )
+
+    async def get_market(self, condition_id):
+        return await self.__run(self.client.get_market, condition_id)
+
+    async def get_market_trades_events(self, condition_id):
+        return await self.__run(self.client.get_market_trades_events, condition_id)
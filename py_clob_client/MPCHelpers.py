@@ -1,36 +1,116 @@
-def validate_mpc_signature(hash_hex: str, mpc_signature: dict, expected_address: str) -> bool:
+import secrets
+
+from eth_keys import keys
+from eth_keys.backends import NativeECCBackend
+from eth_keys.constants import SECPK1_G, SECPK1_N, SECPK1_P
+
+try:
+    # internals of the native backend, the batch check falls back without them
+    from eth_keys.backends.native.jacobian import (
+        from_jacobian,
+        jacobian_add,
+        jacobian_multiply,
+        to_jacobian,
+    )
+except ImportError:
+    from_jacobian = jacobian_add = jacobian_multiply = to_jacobian = None
+
+
+def _mpc_signature_values(mpc_signature: dict) -> tuple[int, int, int]:
     """
-    Validate that the MPC signature was created by the expected address
-    Using original MPC values before reconstruction
+    (recovery_id, r, s) of an MPC signature
     """
-    from eth_keys import keys
-    from eth_utils import keccak
-    
-    # Extract values from MPC signature
     r_point = mpc_signature["big_r"]["affine_point"]
     s_scalar = mpc_signature["s"]["scalar"]
     recovery_id = mpc_signature["recovery_id"]
-    
+
     # Extract x coordinate from affine_point (remove 02/03 prefix)
-    if r_point.startswith('02') or r_point.startswith('03'):
+    if r_point.startswith("02") or r_point.startswith("03"):
         r_x = r_point[2:]  # Remove 02/03 prefix
     else:
         r_x = r_point
-    
-    # Convert hex strings to int
-    r_int = int(r_x, 16)
-    s_int = int(s_scalar, 16)
-    
-    # Recover the public key
-    signature_obj = keys.Signature(vrs=(recovery_id, r_int, s_int))
-    public_key = signature_obj.recover_public_key_from_msg_hash(bytes.fromhex(hash_hex))
-    
-    # Get the address
-    recovered_address = public_key.to_checksum_address()
-    
-    is_valid = expected_address.lower() == recovered_address.lower()
-    print(f"signature is_valid?: {is_valid}")
-    return recovered_address
+
+    return recovery_id, int(r_x, 16), int(s_scalar, 16)
+
+
+def recover_mpc_public_key(hash_hex: str, mpc_signature: dict) -> keys.PublicKey:
+    """
+    Public key of the MPC signature of the hash
+    """
+    signature_obj = keys.Signature(vrs=_mpc_signature_values(mpc_signature))
+    return signature_obj.recover_public_key_from_msg_hash(bytes.fromhex(hash_hex))
+
+
+def verify_mpc_signature(
+    public_key: keys.PublicKey, hash_hex: str, mpc_signature: dict
+) -> bool:
+    """
+    Checks the MPC signature of the hash against a known public key
+    Cheaper than recovering the public key and deriving its address
+    """
+    try:
+        signature_obj = keys.Signature(vrs=_mpc_signature_values(mpc_signature))
+    except Exception:
+        return False
+    return signature_obj.verify_msg_hash(bytes.fromhex(hash_hex), public_key)
+
+
+def _lift_x(x: int, parity: int):
+    y = pow((pow(x, 3, SECPK1_P) + 7) % SECPK1_P, (SECPK1_P + 1) // 4, SECPK1_P)
+    if (y * y - x * x * x - 7) % SECPK1_P != 0:
+        return None
+    return (x, y if y % 2 == parity else SECPK1_P - y)
+
+
+def verify_mpc_signatures(
+    public_key: keys.PublicKey, signatures: list[tuple[str, dict]]
+) -> list[bool]:
+    """
+    Checks many (hash, MPC signature) against a known public key at once
+    With the native backend the signatures are checked together with a randomized
+    batch equation, sum(a_i * R_i) = sum(a_i * z_i / s_i) * G + sum(a_i * r_i / s_i) * P,
+    costing about a quarter of the individual checks. If the batch fails, the
+    signatures are checked one by one to tell which ones are invalid
+    """
+    if (
+        len(signatures) < 2
+        or jacobian_add is None
+        or not isinstance(keys.backend, NativeECCBackend)
+    ):
+        return [verify_mpc_signature(public_key, h, s) for h, s in signatures]
+
+    g_coefficient = 0
+    p_coefficient = 0
+    r_sum = (0, 0, 1)
+    for hash_hex, mpc_signature in signatures:
+        recovery_id, r, s = _mpc_signature_values(mpc_signature)
+        big_r = (
+            _lift_x(r, recovery_id & 1)
+            if 0 < r < SECPK1_N and 0 < s < SECPK1_N
+            else None
+        )
+        if big_r is None:
+            return [verify_mpc_signature(public_key, h, s) for h, s in signatures]
+
+        a = secrets.randbits(128) | 1
+        s_inv = pow(s, -1, SECPK1_N)
+        z = int.from_bytes(bytes.fromhex(hash_hex), "big")
+        g_coefficient = (g_coefficient + a * z * s_inv) % SECPK1_N
+        p_coefficient = (p_coefficient + a * r * s_inv) % SECPK1_N
+        r_sum = jacobian_add(r_sum, jacobian_multiply(to_jacobian(big_r), a))
+
+    public_point = (
+        int.from_bytes(public_key.to_bytes()[:32], "big"),
+        int.from_bytes(public_key.to_bytes()[32:], "big"),
+    )
+    point = jacobian_add(
+        jacobian_multiply(to_jacobian(SECPK1_G), g_coefficient),
+        jacobian_multiply(to_jacobian(public_point), p_coefficient),
+    )
+    if from_jacobian(point) == from_jacobian(r_sum):
+        return [True] * len(signatures)
+    return [verify_mpc_signature(public_key, h, s) for h, s in signatures]
+
 
 def reconstruct_signature(signature):
     """
@@ -43,21 +123,21 @@ def reconstruct_signature(signature):
 
     # Convert recovery_id to v (Ethereum format)
     v = 27 + recovery_id
-    
+
     # Extract ONLY the x coordinate from affine_point (remove 02/03 prefix)
-    if r_point.startswith('02') or r_point.startswith('03'):
+    if r_point.startswith("02") or r_point.startswith("03"):
         r_x = r_point[2:]  # Remove 02/03 prefix
     else:
         r_x = r_point
-    
+
     # Ensure r and s are properly formatted as 64-character hex strings
-    r_hex = r_x.replace('0x', '').zfill(64).lower()
-    s_hex = s_scalar.replace('0x', '').zfill(64).lower()
-    
+    r_hex = r_x.replace("0x", "").zfill(64).lower()
+    s_hex = s_scalar.replace("0x", "").zfill(64).lower()
+
     # Convert v to 2-character hex
     v_hex = hex(v)[2:].zfill(2).lower()
-    
+
     # Concatenate r + s + v to form the complete signature
     complete_signature = r_hex + s_hex + v_hex
-    
-    return complete_signature
\ No newline at end of file
+
+    return complete_signature
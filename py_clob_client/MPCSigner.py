@@ -1,71 +1,154 @@
-from py_near.account import Account
-import os
-import base64
-import json
-from py_clob_client.MPCHelpers import validate_mpc_signature, reconstruct_signature
+import asyncio
+from py_clob_client.MPCBackends import MPCBackend, NearMPCBackend
+from py_clob_client.MPCHelpers import (
+    reconstruct_signature,
+    recover_mpc_public_key,
+    verify_mpc_signature,
+    verify_mpc_signatures,
+)
+from py_clob_client.instrumentation import get_instrumentation
 from py_order_utils.utils import prepend_zx
 import logging
 
-class MPCSigner:
-    def __init__(self, account_id: str, private_key: str, network: str, ota_account: str, chain_id: int, path: str, contract_account: str):
+# public keys derived by the MPC, by (contract_account, path)
+_PUBLIC_KEYS = {}
+
 
+class MPCSigner:
+    def __init__(
+        self,
+        account_id: str = None,
+        private_key: str = None,
+        network: str = None,
+        ota_account: str = None,
+        chain_id: int = None,
+        path: str = None,
+        contract_account: str = None,
+        verify: bool = True,
+        backend: MPCBackend = None,
+    ):
+        """
+        Signs with the MPC key derived for the path
+        Uses the sign_hash method of the NEAR contract_account, called by the agent
+        account_id, unless another backend (e.g. LocalMPCBackend) is given
+        """
         self.account_id = account_id
         self.private_key = private_key
-        self.network = "https://1rpc.io/near" if network == "mainnet" else "https://test.rpc.fastnear.com"
         self.ota_account = ota_account
-        self.signer_account = Account(self.account_id, self.private_key, self.network)
         self.chain_id = chain_id
         self.path = path
         self.logger = logging.getLogger(__name__)
         self.contract_account = contract_account
+        # verify every signature against the derived public key, off the event loop
+        self.verify = verify
+        self.backend = (
+            backend
+            if backend is not None
+            else NearMPCBackend(account_id, private_key, network, contract_account)
+        )
+        # public key whose address was checked against ota_account
+        self.__checked_key = None
+        if self.public_key is not None:
+            # pinned by another signer of the same key
+            self.__check_address(self.public_key)
+
+    @property
+    def _key_id(self):
+        # the local backends have no contract, their keys are scoped to the backend
+        return (self.contract_account or self.backend, self.path)
+
+    @property
+    def public_key(self):
+        """
+        Public key derived for the path, pinned by the first verified signature
+        """
+        return _PUBLIC_KEYS.get(self._key_id)
+
+    async def __verify(self, message_hash: str, mpc_signature: dict):
+        loop = asyncio.get_running_loop()
+        public_key = self.public_key
+        if public_key is None:
+            # the derived key never changes, it is recovered once and pinned
+            # the address is adopted only if none was configured
+            public_key = await loop.run_in_executor(
+                None, recover_mpc_public_key, message_hash, mpc_signature
+            )
+            self.__check_address(public_key)
+            _PUBLIC_KEYS[self._key_id] = public_key
+            get_instrumentation().event(
+                "mpc_address_pinned", path=self.path, address=self.ota_account
+            )
+            return
+        if public_key is not self.__checked_key:
+            self.__check_address(public_key)
+
+        valid = await loop.run_in_executor(
+            None, verify_mpc_signature, public_key, message_hash, mpc_signature
+        )
+        get_instrumentation().incr("mpc_verifications", valid=valid)
+        if not valid:
+            raise Exception(
+                "Invalid MPC signature of {} for {}".format(
+                    message_hash, self.ota_account
+                )
+            )
+
+    def __check_address(self, public_key):
+        # the configured address is the one signed into the orders and headers,
+        # it must be the address of the key. It is adopted if none was configured
+        address = public_key.to_checksum_address()
+        if self.ota_account is None:
+            self.ota_account = address
+        elif self.ota_account.lower() != address.lower():
+            raise Exception(
+                "MPC key of path {} is {}, not {}".format(
+                    self.path, address, self.ota_account
+                )
+            )
+        self.__checked_key = public_key
+
+    async def verify_signatures(self, signatures: list[tuple[str, dict]]) -> list[bool]:
+        """
+        Checks many (message hash, MPC signature) against the derived public key at once
+        """
+        if not signatures:
+            return []
+        if self.public_key is None:
+            await self.__verify(*signatures[0])
+        elif self.public_key is not self.__checked_key:
+            self.__check_address(self.public_key)
+        return await asyncio.get_running_loop().run_in_executor(
+            None, verify_mpc_signatures, self.public_key, signatures
+        )
 
     async def startup(self):
-        """Initialize the account connection"""
-        await self.signer_account.startup()
-        print(f"Near MPC Signer initialized for account: {self.account_id}")
-    
+        """Initialize the backend connection"""
+        await self.backend.startup()
+        self.logger.info(
+            "MPC Signer initialized for account: {}".format(self.account_id)
+        )
+        get_instrumentation().event("mpc_signer_started", account=self.account_id)
+
     async def sign(self, message_hash):
-        
         """
         Signs a message hash
         """
-        result = await self.signer_account.function_call(
-            self.contract_account,
-            "sign_hash",
-            {"hash": message_hash, "path": self.path},
-            gas=300000000000000,
-            amount=1,
-        )
-        
-        mpc_signature = self._extract_signature_from_result(result)
-
-        print("mpc_signature from signer: ", mpc_signature)
+        # the MPC contract takes the hash without its 0x prefix
+        if message_hash.startswith("0x"):
+            message_hash = message_hash[2:]
+        mpc_signature = await self.backend.sign_hash(message_hash, self.path)
 
-        # Validate the signature using original MPC values
-        self.ota_account = validate_mpc_signature(message_hash, mpc_signature, self.ota_account)
+        if self.verify:
+            await self.__verify(message_hash, mpc_signature)
 
         signature = reconstruct_signature(mpc_signature)
-        
+
         prepend_signature = prepend_zx(signature)
-        
+
         return prepend_signature
 
-    def _extract_signature_from_result(self, result):
-        """Extract the signature from the transaction result"""
-        
-        if hasattr(result, 'status'):
-            
-            if isinstance(result.status, dict) and 'SuccessValue' in result.status:
-                success_value = result.status['SuccessValue']
-                decoded_bytes = base64.b64decode(success_value)
-                decoded_json = json.loads(decoded_bytes.decode('utf-8'))
-                return decoded_json
-            else:
-                print(f"Debug - result.status keys: {result.status.keys() if hasattr(result.status, 'keys') else 'No keys'}")
-                raise Exception(f"Unexpected result structure: {result.status}")
-        else:
-            print(f"Debug - result has no status attribute")
-            return None
-            
+    def address(self):
+        return self.ota_account
+
     def get_chain_id(self):
-        return self.chain_id
\ No newline at end of file
+        return self.chain_id
@@ -0,0 +1,88 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Optional
+
+from .instrumentation import Histogram, get_instrumentation
+from .signer import sign_async
+
+
+@dataclass
+class MPCSignResult:
+    message_hash: str
+    signature: Optional[str]
+    latency: float
+    error: Optional[Exception] = None
+
+
+class MPCSigningService:
+    """
+    Concurrent MPC signing over an MPCSigner, or any other sync or async signer
+    Up to max_in_flight sign_hash requests run at a time, the others wait for a slot.
+    The latency of every request is recorded in the latency histogram and as an
+    mpc_sign span of the instrumentation.
+
+    Every sign_hash call is its own NEAR transaction: the call needs the full 300 Tgas
+    a transaction can carry and returns a single signature, so hashes can't be batched
+    into one transaction. py_near signs one transaction per access key at a time, give
+    the MPCSigner as many access keys as max_in_flight to run them in parallel.
+
+    The service is an async signer itself, given to an OrderBuilder it bounds the
+    signatures of create_order_async.
+    """
+
+    def __init__(self, signer, max_in_flight: int = 8):
+        self.signer = signer
+        self.max_in_flight = max_in_flight
+        self.latency = Histogram()
+        self.in_flight = 0
+        self.__semaphore = None
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def __getattr__(self, name):
+        # chain_id, ota_account, ... of the signer, so the service can replace it
+        return getattr(self.signer, name)
+
+    def __get_semaphore(self) -> asyncio.Semaphore:
+        # created lazily, inside the event loop running the requests
+        if self.__semaphore is None:
+            self.__semaphore = asyncio.Semaphore(self.max_in_flight)
+        return self.__semaphore
+
+    async def sign(self, message_hash: str) -> str:
+        """
+        Signs a message hash, waiting for a free slot
+        """
+        async with self.__get_semaphore():
+            self.in_flight += 1
+            instrumentation = get_instrumentation()
+            instrumentation.gauge("mpc_in_flight", self.in_flight)
+            start = perf_counter()
+            try:
+                return await sign_async(self.signer, message_hash)
+            finally:
+                latency = perf_counter() - start
+                self.in_flight -= 1
+                instrumentation.gauge("mpc_in_flight", self.in_flight)
+                self.latency.observe(latency)
+                instrumentation.record("mpc_sign", latency)
+
+    async def __sign_result(self, message_hash: str) -> MPCSignResult:
+        start = perf_counter()
+        try:
+            signature = await self.sign(message_hash)
+        except Exception as e:
+            self.logger.error("Couldn't sign {}: {}".format(message_hash, e))
+            return MPCSignResult(message_hash, None, perf_counter() - start, e)
+        return MPCSignResult(message_hash, signature, perf_counter() - start)
+
+    async def sign_many(self, message_hashes: list[str]) -> list[MPCSignResult]:
+        """
+        Signs the message hashes concurrently
+        Returns a result per hash, in order, with the signature or the error and the
+        latency of the request (queueing included)
+        """
+        return await asyncio.gather(
+            *[self.__sign_result(message_hash) for message_hash in message_hashes]
+        )
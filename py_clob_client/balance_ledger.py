@@ -0,0 +1,346 @@
+import logging
+import time
+from dataclasses import dataclass
+from threading import Event, Lock, Thread
+
+from .clob_types import AssetType, BalanceAllowanceParams, OrderType
+from .instrumentation import get_instrumentation
+from .order_tracker import OPEN_STATUSES, RESTING_ORDER_TYPES
+
+TOKEN_DECIMALS = 10**6
+
+
+@dataclass
+class _Reservation:
+    token_id: str
+    side: str
+    price: float
+    size: float
+    """
+    Unmatched size of the order, in shares
+    """
+
+
+class BalanceLedger:
+    """
+    Local ledger of the collateral balance and the token positions of an account
+    The balances are seeded by get_balance_allowance (sync). The orders posted
+    reserve their collateral (BUY) or shares (SELL) until they are filled or
+    canceled, and the fills of the trades move the balances, so the pre-trade
+    checks (check_order) run locally without a request.
+    sync can run every interval seconds in the background, and runs early when a
+    balance goes negative, see start.
+    The amounts are in collateral units and shares, not in token decimals
+    """
+
+    def __init__(self, client=None, interval: float = 60, tolerance: float = 1e-6):
+        self.client = client
+        self.interval = interval
+        self.tolerance = tolerance
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self.collateral = 0.0
+        self.positions: dict[str, float] = {}
+        self.reserved_collateral = 0.0
+        self.reserved_positions: dict[str, float] = {}
+
+        self.__lock = Lock()
+        self.__reservations: dict[str, _Reservation] = {}
+        # orders whose taker fill was applied from the post response
+        self.__taker_filled: set[str] = set()
+        self.__trade_ids: set[str] = set()
+        # fills applied while a sync is fetching, re-applied on top of its balances
+        self.__sync_fills: list[list[tuple]] = []
+        self.__stop = Event()
+        self.__wake = Event()
+        self.__worker = None
+
+    def position(self, token_id: str) -> float:
+        return self.positions.get(token_id, 0.0)
+
+    def available_collateral(self) -> float:
+        """
+        Collateral balance not reserved by open BUY orders
+        """
+        return self.collateral - self.reserved_collateral
+
+    def available_position(self, token_id: str) -> float:
+        """
+        Shares of the token not reserved by open SELL orders
+        """
+        return self.positions.get(token_id, 0.0) - self.reserved_positions.get(
+            token_id, 0.0
+        )
+
+    def check_order(self, token_id: str, side: str, price: float, size: float) -> bool:
+        """
+        True if the available balances cover the order
+        """
+        if side == "BUY":
+            return price * size <= self.available_collateral() + self.tolerance
+        return size <= self.available_position(token_id) + self.tolerance
+
+    def sync(self, token_ids: list[str] = None) -> dict:
+        """
+        Sets the balances from get_balance_allowance: the collateral and the positions
+        of the token_ids, by default of the tokens already in the ledger.
+        Returns the differences found with the local balances, by asset
+        The fills applied while the balances are fetched are kept if they matched
+        after the balance of their asset was fetched: the trades by their match_time,
+        the fills of the post responses by the time they were applied. The fetched
+        balances may still lag the matched trades until they settle, which shows as a
+        discrepancy corrected by the next sync
+        """
+        if token_ids is None:
+            token_ids = set(self.positions) | set(self.reserved_positions)
+
+        fills = []
+        with self.__lock:
+            self.__sync_fills.append(fills)
+        try:
+            balances = {
+                None: self.__fetch_balance(
+                    BalanceAllowanceParams(asset_type=AssetType.COLLATERAL)
+                )
+            }
+            fetched_at = {None: time.time()}
+            for token_id in token_ids:
+                balances[token_id] = self.__fetch_balance(
+                    BalanceAllowanceParams(
+                        asset_type=AssetType.CONDITIONAL, token_id=token_id
+                    )
+                )
+                fetched_at[token_id] = time.time()
+        finally:
+            with self.__lock:
+                self.__sync_fills.remove(fills)
+
+        discrepancies = {}
+        with self.__lock:
+            # the fills matched after a fetch are missing from its balance
+            for matched_at, token_id, side, price, size in fills:
+                sign = 1 if side == "BUY" else -1
+                if matched_at > fetched_at[None]:
+                    balances[None] -= sign * price * size
+                if token_id in balances and matched_at > fetched_at[token_id]:
+                    balances[token_id] += sign * size
+
+            for token_id, balance in balances.items():
+                local = self.collateral if token_id is None else self.position(token_id)
+                if abs(balance - local) > self.tolerance:
+                    discrepancies[token_id or AssetType.COLLATERAL] = balance - local
+                if token_id is None:
+                    self.collateral = balance
+                else:
+                    self.positions[token_id] = balance
+
+        for asset, difference in discrepancies.items():
+            get_instrumentation().event(
+                "balance_discrepancy", asset=asset, difference=difference
+            )
+        return discrepancies
+
+    def __fetch_balance(self, params: BalanceAllowanceParams) -> float:
+        return int(self.client.get_balance_allowance(params)["balance"]) / (
+            TOKEN_DECIMALS
+        )
+
+    def __reserve(self, order_id: str, reservation: _Reservation):
+        self.__reservations[order_id] = reservation
+        if reservation.side == "BUY":
+            self.reserved_collateral += reservation.size * reservation.price
+        else:
+            self.reserved_positions[reservation.token_id] = (
+                self.reserved_positions.get(reservation.token_id, 0.0)
+                + reservation.size
+            )
+
+    def __release(self, order_id: str, size: float = None):
+        reservation = self.__reservations.get(order_id)
+        if reservation is None:
+            return
+        size = reservation.size if size is None else min(size, reservation.size)
+        reservation.size -= size
+        if reservation.side == "BUY":
+            self.reserved_collateral = max(
+                0.0, self.reserved_collateral - size * reservation.price
+            )
+        else:
+            reserved = self.reserved_positions.get(reservation.token_id, 0.0) - size
+            if reserved > self.tolerance:
+                self.reserved_positions[reservation.token_id] = reserved
+            else:
+                self.reserved_positions.pop(reservation.token_id, None)
+        if reservation.size <= self.tolerance:
+            del self.__reservations[order_id]
+
+    def __fill(
+        self,
+        token_id: str,
+        side: str,
+        price: float,
+        size: float,
+        matched_at: float = None,
+    ):
+        matched_at = time.time() if matched_at is None else matched_at
+        for fills in self.__sync_fills:
+            fills.append((matched_at, token_id, side, price, size))
+        if side == "BUY":
+            self.collateral -= price * size
+            self.positions[token_id] = self.positions.get(token_id, 0.0) + size
+        else:
+            self.collateral += price * size
+            self.positions[token_id] = self.positions.get(token_id, 0.0) - size
+
+        if self.collateral < -self.tolerance or self.positions[token_id] < (
+            -self.tolerance
+        ):
+            # the ledger is off, sync it now
+            self.__wake.set()
+
+    def on_order_posted(
+        self, order, response: dict, order_type: OrderType = OrderType.GTC
+    ):
+        """
+        Reserves the balance of a posted order, and applies the fill of its post
+        response if it matched on arrival
+        order is the SignedOrder
+        """
+        if not isinstance(response, dict) or not response.get("orderID"):
+            return
+        if not response.get("success", True):
+            return
+
+        data = order.dict()
+        side = data.get("side")
+        maker_amount = int(data.get("makerAmount") or 0) / TOKEN_DECIMALS
+        taker_amount = int(data.get("takerAmount") or 0) / TOKEN_DECIMALS
+        size, cost = (
+            (taker_amount, maker_amount)
+            if side == "BUY"
+            else (maker_amount, taker_amount)
+        )
+        if not size:
+            return
+        token_id = str(data.get("tokenId"))
+        order_id = response["orderID"]
+
+        # shares and collateral matched on arrival
+        shares, collateral = (
+            (response.get("takingAmount"), response.get("makingAmount"))
+            if side == "BUY"
+            else (response.get("makingAmount"), response.get("takingAmount"))
+        )
+        shares = float(shares or 0)
+        status = (response.get("status") or "").lower()
+        resting = status in OPEN_STATUSES or (
+            status == "matched" and order_type in RESTING_ORDER_TYPES
+        )
+
+        with self.__lock:
+            if shares:
+                self.__taker_filled.add(order_id)
+                self.__fill(token_id, side, float(collateral or 0) / shares, shares)
+            if resting and size - shares > self.tolerance:
+                self.__reserve(
+                    order_id, _Reservation(token_id, side, cost / size, size - shares)
+                )
+
+    def on_orders_posted(self, args: list, responses: list):
+        """
+        Reserves the balances of the orders of a post_orders call
+        """
+        if not isinstance(responses, list):
+            return
+        for arg, response in zip(args, responses):
+            self.on_order_posted(arg.order, response, arg.orderType)
+
+    def on_cancel(self, response: dict):
+        """
+        Releases the reservations of the orders canceled by a cancel response
+        """
+        if not isinstance(response, dict):
+            return
+        with self.__lock:
+            for order_id in response.get("canceled") or []:
+                self.__release(order_id)
+
+    def on_trade(self, trade: dict):
+        """
+        Applies the fills of a trade to the balances, for the orders of the ledger
+        A trade is applied once, whatever the number of its status updates
+        """
+        trade_id = trade.get("id")
+        if (trade.get("status") or "").upper() == "FAILED":
+            return
+        with self.__lock:
+            if trade_id is not None:
+                if trade_id in self.__trade_ids:
+                    return
+                self.__trade_ids.add(trade_id)
+
+            matched_at = trade.get("match_time")
+            matched_at = float(matched_at) if matched_at else None
+            taker_order_id = trade.get("taker_order_id")
+            if (
+                taker_order_id in self.__reservations
+                and taker_order_id not in self.__taker_filled
+            ):
+                self.__apply(
+                    taker_order_id,
+                    float(trade.get("price") or 0),
+                    float(trade.get("size") or 0),
+                    matched_at,
+                )
+            for maker_order in trade.get("maker_orders") or []:
+                order_id = maker_order.get("order_id")
+                if order_id in self.__reservations:
+                    self.__apply(
+                        order_id,
+                        float(maker_order.get("price") or 0),
+                        float(maker_order.get("matched_amount") or 0),
+                        matched_at,
+                    )
+
+    def __apply(
+        self, order_id: str, price: float, size: float, matched_at: float = None
+    ):
+        reservation = self.__reservations[order_id]
+        self.__fill(reservation.token_id, reservation.side, price, size, matched_at)
+        self.__release(order_id, size)
+
+    def on_trades(self, trades: list[dict]):
+        for trade in trades:
+            self.on_trade(trade)
+
+    def start(self, token_ids: list[str] = None):
+        """
+        Syncs now, with the token_ids, and then every interval seconds in the background
+        """
+        if self.__worker is not None:
+            return
+        self.sync(token_ids)
+        self.__stop.clear()
+        self.__worker = Thread(
+            target=self.__sync_loop, name="clob-balances", daemon=True
+        )
+        self.__worker.start()
+
+    def stop(self):
+        if self.__worker is None:
+            return
+        self.__stop.set()
+        self.__wake.set()
+        self.__worker.join()
+        self.__worker = None
+
+    def __sync_loop(self):
+        while True:
+            self.__wake.wait(self.interval)
+            self.__wake.clear()
+            if self.__stop.is_set():
+                return
+            try:
+                self.sync()
+            except Exception as e:
+                self.logger.error("Couldn't sync the balances: {}".format(e))
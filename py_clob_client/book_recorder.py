@@ -0,0 +1,172 @@
+import json
+import struct
+import time
+from typing import Iterator, Optional, Union
+
+from .clob_types import BookParams, OrderBookSummary, OrderType
+from .order_builder.helpers import calculate_book_market_price
+from .utilities import parse_raw_orderbook_summary
+
+MAGIC = b"CLOBBOOK\x01"
+
+# payload length, receive timestamp (unix seconds)
+_RECORD_HEADER = struct.Struct(">Id")
+
+BOOK = "book"
+
+
+class BookRecorder:
+    """
+    Appends order book snapshots to a length-prefixed binary file
+    Every record is a header (payload length, receive timestamp) followed by
+    the compact JSON of [kind, data]. Books are stored with the "book" kind,
+    other kinds (e.g. websocket updates) are stored as given and replayed as is.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.__file = open(path, "ab")
+        if self.__file.tell() == 0:
+            self.__file.write(MAGIC)
+        self.count = 0
+
+    def write(
+        self,
+        data: Union[OrderBookSummary, dict],
+        kind: str = BOOK,
+        timestamp: float = None,
+    ):
+        """
+        Appends a record, stamped with the current time if no timestamp is given
+        """
+        if isinstance(data, OrderBookSummary):
+            data = data.__dict__
+        payload = json.dumps([kind, data], separators=(",", ":")).encode("utf-8")
+        self.__file.write(
+            _RECORD_HEADER.pack(
+                len(payload), timestamp if timestamp is not None else time.time()
+            )
+        )
+        self.__file.write(payload)
+        self.count += 1
+
+    def record_order_book(self, client, token_id: str) -> OrderBookSummary:
+        """
+        Fetches the orderbook for the token_id with the client and records it
+        """
+        book = client.get_order_book(token_id)
+        self.write(book)
+        return book
+
+    def record_order_books(
+        self, client, params: list[BookParams]
+    ) -> list[OrderBookSummary]:
+        """
+        Fetches the orderbooks for a set of token ids with the client and records them
+        """
+        books = client.get_order_books(params)
+        timestamp = time.time()
+        for book in books:
+            self.write(book, timestamp=timestamp)
+        return books
+
+    def flush(self):
+        self.__file.flush()
+
+    def close(self):
+        self.__file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def read_book_records(path: str) -> Iterator[tuple[float, str, object]]:
+    """
+    Yields the (timestamp, kind, data) records of a recording
+    A record truncated by an interrupted write ends the iteration
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError("{} is not a book recording".format(path))
+        while True:
+            header = f.read(_RECORD_HEADER.size)
+            if len(header) < _RECORD_HEADER.size:
+                return
+            length, timestamp = _RECORD_HEADER.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length:
+                return
+            kind, data = json.loads(payload)
+            yield timestamp, kind, data
+
+
+class BookReplayer:
+    """
+    Replays a recording into a local set of books, exposing the same order book
+    and market price methods as the client
+    speed scales the time between the records: 1 is the original pace, 10 is 10x
+    faster and 0 replays as fast as possible
+    """
+
+    def __init__(self, path: str, speed: float = 0):
+        self.path = path
+        self.speed = speed
+        self.books: dict[str, OrderBookSummary] = {}
+        self.timestamp: Optional[float] = None
+
+    def __iter__(self) -> Iterator[tuple[float, str, object]]:
+        return self.replay()
+
+    def replay(self) -> Iterator[tuple[float, str, object]]:
+        """
+        Applies the records one by one, yielding (timestamp, kind, data) after each
+        Books are yielded as OrderBookSummary
+        """
+        first_timestamp = None
+        start = time.monotonic()
+        for timestamp, kind, data in read_book_records(self.path):
+            if first_timestamp is None:
+                first_timestamp = timestamp
+            if self.speed:
+                delay = (timestamp - first_timestamp) / self.speed - (
+                    time.monotonic() - start
+                )
+                if delay > 0:
+                    time.sleep(delay)
+
+            if kind == BOOK:
+                data = parse_raw_orderbook_summary(data)
+                self.books[data.asset_id] = data
+            self.timestamp = timestamp
+            yield timestamp, kind, data
+
+    def run(self) -> int:
+        """
+        Replays the whole recording, returns the number of records
+        """
+        count = 0
+        for _ in self.replay():
+            count += 1
+        return count
+
+    def get_order_book(self, token_id: str) -> OrderBookSummary:
+        """
+        Latest replayed orderbook for the token_id
+        """
+        return self.books.get(token_id)
+
+    def get_order_books(self, params: list[BookParams]) -> list[OrderBookSummary]:
+        return [self.get_order_book(param.token_id) for param in params]
+
+    def calculate_market_price(
+        self, token_id: str, side: str, amount: float, order_type: OrderType
+    ) -> float:
+        """
+        Calculates the matching price considering an amount and the replayed orderbook
+        """
+        return calculate_book_market_price(
+            self.get_order_book(token_id), side, amount, order_type
+        )
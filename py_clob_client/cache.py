@@ -0,0 +1,16 @@
+from .clob_types import TickSize
+
+
+class MarketMetadataCache:
+    """
+    Local cache of the markets metadata, by token id
+    A single instance can be shared by several clients
+    """
+
+    def __init__(self):
+        self.tick_sizes: dict[str, TickSize] = {}
+        self.neg_risk: dict[str, bool] = {}
+
+    def clear(self):
+        self.tick_sizes.clear()
+        self.neg_risk.clear()
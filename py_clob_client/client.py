@@ -1,10 +1,14 @@
-import logging
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional
 
-from .order_builder.builder import OrderBuilder
 from .headers.headers import create_level_1_headers, create_level_2_headers
-from .signer import Signer
 from .config import get_contract_config
+from .clock import ServerClock
+from .cache import MarketMetadataCache
+from .order_pipeline import OrderPipeline
+from .market_data import MarketDataClient
+from .order_tracker import OrderTracker
+from .balance_ledger import BalanceLedger
 
 from .endpoints import (
     CANCEL,
@@ -16,36 +20,17 @@ from .endpoints import (
     DERIVE_API_KEY,
     GET_API_KEYS,
     CLOSED_ONLY,
-    GET_LAST_TRADE_PRICE,
     GET_ORDER,
-    GET_ORDER_BOOK,
-    MID_POINT,
     ORDERS,
     POST_ORDER,
     POST_ORDERS,
-    PRICE,
-    TIME,
     TRADES,
     GET_NOTIFICATIONS,
     DROP_NOTIFICATIONS,
     GET_BALANCE_ALLOWANCE,
     UPDATE_BALANCE_ALLOWANCE,
     IS_ORDER_SCORING,
-    GET_TICK_SIZE,
-    GET_NEG_RISK,
     ARE_ORDERS_SCORING,
-    GET_SIMPLIFIED_MARKETS,
-    GET_MARKETS,
-    GET_MARKET,
-    GET_SAMPLING_SIMPLIFIED_MARKETS,
-    GET_SAMPLING_MARKETS,
-    GET_MARKET_TRADES_EVENTS,
-    GET_LAST_TRADES_PRICES,
-    MID_POINTS,
-    GET_ORDER_BOOKS,
-    GET_PRICES,
-    GET_SPREAD,
-    GET_SPREADS,
 )
 from .clob_types import (
     ApiCreds,
@@ -54,7 +39,6 @@ from .clob_types import (
     OrderArgs,
     RequestArgs,
     DropNotificationParams,
-    OrderBookSummary,
     BalanceAllowanceParams,
     OrderScoringParams,
     TickSize,
@@ -62,11 +46,11 @@ from .clob_types import (
     OrdersScoringParams,
     OrderType,
     PartialCreateOrderOptions,
-    BookParams,
     MarketOrderArgs,
     PostOrdersArgs,
 )
-from .exceptions import PolyException
+from .exceptions import PolyException, PolyApiException
+from .instrumentation import get_instrumentation
 from .http_helpers.helpers import (
     add_query_trade_params,
     add_query_open_orders_params,
@@ -78,17 +62,26 @@ from .http_helpers.helpers import (
     add_order_scoring_params_to_url,
 )
 
-from .constants import L0, L1, L1_AUTH_UNAVAILABLE, L2, L2_AUTH_UNAVAILABLE, END_CURSOR
+from .constants import (
+    L0,
+    L1,
+    L1_AUTH_UNAVAILABLE,
+    L2,
+    L2_AUTH_UNAVAILABLE,
+    END_CURSOR,
+    POST_ORDERS_MAX_BATCH_SIZE,
+)
 from .utilities import (
-    parse_raw_orderbook_summary,
-    generate_orderbook_summary_hash,
     order_to_json,
     is_tick_size_smaller,
     price_valid,
 )
 
+if TYPE_CHECKING:
+    from .signer import Signer
+
 
-class ClobClient:
+class ClobClient(MarketDataClient):
     def __init__(
         self,
         host,
@@ -97,6 +90,8 @@ class ClobClient:
         creds: ApiCreds = None,
         signature_type: int = None,
         funder: str = None,
+        metadata_cache: MarketMetadataCache = None,
+        signer: "Signer" = None,
     ):
         """
         Initializes the clob client
@@ -109,23 +104,112 @@ class ClobClient:
 
         3) Level 2: Requires the host, chain_id, a private key, and Credentials.
                     Allows access to all endpoints
+
+        A metadata_cache can be given to share the markets metadata between clients,
+        and a signer instead of the private key
+
+        The signing stack (eth_account, py_order_utils, ...) is only imported by the
+        clients with a key or a signer, the Level 0 clients start faster without it.
+        The open endpoints come from MarketDataClient
         """
-        self.host = host[0:-1] if host.endswith("/") else host
+        super().__init__(host, metadata_cache=metadata_cache)
         self.chain_id = chain_id
-        self.signer = Signer(key, chain_id) if key else None
+        if signer is None and key:
+            from .signer import Signer
+
+            signer = Signer(key, chain_id)
+        self.signer = signer
         self.creds = creds
         self.mode = self._get_client_mode()
 
         if self.signer:
+            from .order_builder.builder import OrderBuilder
+
             self.builder = OrderBuilder(
                 self.signer, sig_type=signature_type, funder=funder
             )
 
-        # local cache
-        self.__tick_sizes = {}
-        self.__neg_risk = {}
+        # server clock estimate used to timestamp the auth headers, see enable_clock_sync
+        self.clock: Optional[ServerClock] = None
+
+        # local state of the open orders, see enable_order_tracking
+        self.order_tracker: Optional[OrderTracker] = None
+
+        # local balances and positions, see enable_balance_tracking
+        self.balance_ledger: Optional[BalanceLedger] = None
+
+    def enable_clock_sync(self, interval: float = 60):
+        """
+        Timestamps the auth headers with an estimate of the server clock,
+        synced with the server time every interval seconds, instead of the local clock
+        """
+        if self.clock is None:
+            self.clock = ServerClock(self.get_server_time, interval=interval)
+        self.clock.interval = interval
+        self.clock.start()
+
+    def disable_clock_sync(self):
+        """
+        Timestamps the auth headers with the local clock
+        """
+        if self.clock is not None:
+            self.clock.stop()
+            self.clock = None
+
+    def enable_order_tracking(self, reconcile_interval: float = None) -> OrderTracker:
+        """
+        Tracks the open orders locally, from the responses of the posts and cancels
+        and from the trades fetched with get_trades, see OrderTracker.
+        With a reconcile_interval, the tracker is reconciled with get_orders every
+        reconcile_interval seconds
+        """
+        if self.order_tracker is None:
+            self.order_tracker = OrderTracker(self)
+        if reconcile_interval is not None:
+            self.order_tracker.interval = reconcile_interval
+            self.order_tracker.start()
+        return self.order_tracker
+
+    def disable_order_tracking(self):
+        if self.order_tracker is not None:
+            self.order_tracker.stop()
+            self.order_tracker = None
+
+    def enable_balance_tracking(
+        self, sync_interval: float = None, token_ids: list[str] = None
+    ) -> BalanceLedger:
+        """
+        Tracks the balance and the positions locally, see BalanceLedger.
+        The ledger is seeded with get_balance_allowance for the collateral and the
+        token_ids, then fed by the posts, cancels and the trades fetched with
+        get_trades. With a sync_interval, it is synced every sync_interval seconds
+        """
+        created = self.balance_ledger is None
+        if created:
+            self.balance_ledger = BalanceLedger(self)
+        if sync_interval is not None:
+            # start syncs once before the background syncs
+            self.balance_ledger.interval = sync_interval
+            self.balance_ledger.start(token_ids)
+        elif created:
+            self.balance_ledger.sync(token_ids)
+        return self.balance_ledger
+
+    def disable_balance_tracking(self):
+        if self.balance_ledger is not None:
+            self.balance_ledger.stop()
+            self.balance_ledger = None
+
+    def __trackers(self) -> list:
+        # local states fed by the responses of the client
+        return [
+            tracker
+            for tracker in (self.order_tracker, self.balance_ledger)
+            if tracker is not None
+        ]
 
-        self.logger = logging.getLogger(self.__class__.__name__)
+    def __timestamp(self) -> Optional[int]:
+        return self.clock.timestamp() if self.clock is not None else None
 
     def get_address(self):
         """
@@ -157,20 +241,6 @@ class ClobClient:
         if contract_config:
             return contract_config.exchange
 
-    def get_ok(self):
-        """
-        Health check: Confirms that the server is up
-        Does not need authentication
-        """
-        return get("{}/".format(self.host))
-
-    def get_server_time(self):
-        """
-        Returns the current timestamp on the server
-        Does not need authentication
-        """
-        return get("{}{}".format(self.host, TIME))
-
     def create_api_key(self, nonce: int = None) -> ApiCreds:
         """
         Creates a new CLOB API key for the given
@@ -178,7 +248,9 @@ class ClobClient:
         self.assert_level_1_auth()
 
         endpoint = "{}{}".format(self.host, CREATE_API_KEY)
-        headers = create_level_1_headers(self.signer, nonce)
+        headers = create_level_1_headers(
+            self.signer, nonce, timestamp=self.__timestamp()
+        )
 
         creds_raw = post(endpoint, headers=headers)
         try:
@@ -199,7 +271,9 @@ class ClobClient:
         self.assert_level_1_auth()
 
         endpoint = "{}{}".format(self.host, DERIVE_API_KEY)
-        headers = create_level_1_headers(self.signer, nonce)
+        headers = create_level_1_headers(
+            self.signer, nonce, timestamp=self.__timestamp()
+        )
 
         creds_raw = get(endpoint, headers=headers)
         try:
@@ -220,6 +294,7 @@ class ClobClient:
         try:
             return self.create_api_key(nonce)
         except:
+            get_instrumentation().incr("retries", operation="create_api_key")
             return self.derive_api_key(nonce)
 
     def set_api_creds(self, creds: ApiCreds):
@@ -237,7 +312,9 @@ class ClobClient:
         self.assert_level_2_auth()
 
         request_args = RequestArgs(method="GET", request_path=GET_API_KEYS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = create_level_2_headers(
+            self.signer, self.creds, request_args, timestamp=self.__timestamp()
+        )
         return get("{}{}".format(self.host, GET_API_KEYS), headers=headers)
 
     def get_closed_only_mode(self):
@@ -248,7 +325,9 @@ class ClobClient:
         self.assert_level_2_auth()
 
         request_args = RequestArgs(method="GET", request_path=CLOSED_ONLY)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = create_level_2_headers(
+            self.signer, self.creds, request_args, timestamp=self.__timestamp()
+        )
         return get("{}{}".format(self.host, CLOSED_ONLY), headers=headers)
 
     def delete_api_key(self):
@@ -259,66 +338,11 @@ class ClobClient:
         self.assert_level_2_auth()
 
         request_args = RequestArgs(method="DELETE", request_path=DELETE_API_KEY)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = create_level_2_headers(
+            self.signer, self.creds, request_args, timestamp=self.__timestamp()
+        )
         return delete("{}{}".format(self.host, DELETE_API_KEY), headers=headers)
 
-    def get_midpoint(self, token_id):
-        """
-        Get the mid market price for the given market
-        """
-        return get("{}{}?token_id={}".format(self.host, MID_POINT, token_id))
-
-    def get_midpoints(self, params: list[BookParams]):
-        """
-        Get the mid market prices for a set of token ids
-        """
-        body = [{"token_id": param.token_id} for param in params]
-        return post("{}{}".format(self.host, MID_POINTS), data=body)
-
-    def get_price(self, token_id, side):
-        """
-        Get the market price for the given market
-        """
-        return get("{}{}?token_id={}&side={}".format(self.host, PRICE, token_id, side))
-
-    def get_prices(self, params: list[BookParams]):
-        """
-        Get the market prices for a set
-        """
-        body = [{"token_id": param.token_id, "side": param.side} for param in params]
-        return post("{}{}".format(self.host, GET_PRICES), data=body)
-
-    def get_spread(self, token_id):
-        """
-        Get the spread for the given market
-        """
-        return get("{}{}?token_id={}".format(self.host, GET_SPREAD, token_id))
-
-    def get_spreads(self, params: list[BookParams]):
-        """
-        Get the spreads for a set of token ids
-        """
-        body = [{"token_id": param.token_id} for param in params]
-        return post("{}{}".format(self.host, GET_SPREADS), data=body)
-
-    def get_tick_size(self, token_id: str) -> TickSize:
-        if token_id in self.__tick_sizes:
-            return self.__tick_sizes[token_id]
-
-        result = get("{}{}?token_id={}".format(self.host, GET_TICK_SIZE, token_id))
-        self.__tick_sizes[token_id] = str(result["minimum_tick_size"])
-
-        return self.__tick_sizes[token_id]
-
-    def get_neg_risk(self, token_id: str) -> bool:
-        if token_id in self.__neg_risk:
-            return self.__neg_risk[token_id]
-
-        result = get("{}{}?token_id={}".format(self.host, GET_NEG_RISK, token_id))
-        self.__neg_risk[token_id] = result["neg_risk"]
-
-        return result["neg_risk"]
-
     def __resolve_tick_size(
         self, token_id: str, tick_size: TickSize = None
     ) -> TickSize:
@@ -335,43 +359,53 @@ class ClobClient:
             tick_size = min_tick_size
         return tick_size
 
-    def create_order(
-        self, order_args: OrderArgs, options: Optional[PartialCreateOrderOptions] = None
-    ):
+    def resolve_order_options(
+        self,
+        token_id: str,
+        price: float,
+        options: Optional[PartialCreateOrderOptions] = None,
+    ) -> CreateOrderOptions:
         """
-        Creates and signs an order
-        Level 1 Auth required
+        Resolves the tick size and neg risk of an order on the token_id
+        and checks that its price is valid for the tick size
         """
-        self.assert_level_1_auth()
-
-        # add resolve_order_options, or similar
-        tick_size = self.__resolve_tick_size(
-            order_args.token_id,
-            options.tick_size if options else None,
-        )
+        with get_instrumentation().span("resolve_tick_size"):
+            tick_size = self.__resolve_tick_size(
+                token_id,
+                options.tick_size if options else None,
+            )
 
-        if not price_valid(order_args.price, tick_size):
+        if not price_valid(price, tick_size):
             raise Exception(
                 "price ("
-                + str(order_args.price)
+                + str(price)
                 + "), min: "
                 + str(tick_size)
                 + " - max: "
                 + str(1 - float(tick_size))
             )
 
-        neg_risk = (
-            options.neg_risk
-            if options and options.neg_risk
-            else self.get_neg_risk(order_args.token_id)
-        )
+        with get_instrumentation().span("resolve_neg_risk"):
+            neg_risk = (
+                options.neg_risk
+                if options and options.neg_risk is not None
+                else self.get_neg_risk(token_id)
+            )
+
+        return CreateOrderOptions(tick_size=tick_size, neg_risk=neg_risk)
+
+    def create_order(
+        self, order_args: OrderArgs, options: Optional[PartialCreateOrderOptions] = None
+    ):
+        """
+        Creates and signs an order
+        Level 1 Auth required
+        """
+        self.assert_level_1_auth()
 
         return self.builder.create_order(
             order_args,
-            CreateOrderOptions(
-                tick_size=tick_size,
-                neg_risk=neg_risk,
-            ),
+            self.resolve_order_options(order_args.token_id, order_args.price, options),
         )
 
     def create_market_order(
@@ -385,12 +419,6 @@ class ClobClient:
         """
         self.assert_level_1_auth()
 
-        # add resolve_order_options, or similar
-        tick_size = self.__resolve_tick_size(
-            order_args.token_id,
-            options.tick_size if options else None,
-        )
-
         if order_args.price is None or order_args.price <= 0:
             order_args.price = self.calculate_market_price(
                 order_args.token_id,
@@ -399,28 +427,9 @@ class ClobClient:
                 order_args.order_type,
             )
 
-        if not price_valid(order_args.price, tick_size):
-            raise Exception(
-                "price ("
-                + str(order_args.price)
-                + "), min: "
-                + str(tick_size)
-                + " - max: "
-                + str(1 - float(tick_size))
-            )
-
-        neg_risk = (
-            options.neg_risk
-            if options and options.neg_risk
-            else self.get_neg_risk(order_args.token_id)
-        )
-        
         return self.builder.create_market_order(
             order_args,
-            CreateOrderOptions(
-                tick_size=tick_size,
-                neg_risk=neg_risk,
-            ),
+            self.resolve_order_options(order_args.token_id, order_args.price, options),
         )
 
     def post_orders(self, args: list[PostOrdersArgs]):
@@ -428,28 +437,87 @@ class ClobClient:
         Posts orders
         """
         self.assert_level_2_auth()
-        body = [
-            order_to_json(arg.order, self.creds.api_key, arg.orderType) for arg in args
-        ]
+        with get_instrumentation().span("serialize"):
+            body = [
+                order_to_json(arg.order, self.creds.api_key, arg.orderType)
+                for arg in args
+            ]
         headers = create_level_2_headers(
             self.signer,
             self.creds,
             RequestArgs(method="POST", request_path=POST_ORDERS, body=body),
+            timestamp=self.__timestamp(),
         )
-        return post("{}{}".format(self.host, POST_ORDERS), headers=headers, data=body)
+        response = post(
+            "{}{}".format(self.host, POST_ORDERS), headers=headers, data=body
+        )
+        for tracker in self.__trackers():
+            tracker.on_orders_posted(args, response)
+        return response
+
+    def post_orders_batched(
+        self,
+        args: list[PostOrdersArgs],
+        batch_size: int = POST_ORDERS_MAX_BATCH_SIZE,
+        max_workers: int = 4,
+    ) -> list:
+        """
+        Posts a list of orders of any length
+        The list is split into batches accepted by the server, each batch is signed with
+        its own L2 headers and the batches are submitted concurrently.
+        Returns one result per order, in the same order as the input args.
+        A batch rejected as a whole yields an error result for each of its orders
+        Level 2 Auth required
+        """
+        self.assert_level_2_auth()
+        if batch_size < 1 or batch_size > POST_ORDERS_MAX_BATCH_SIZE:
+            raise ValueError(
+                "batch_size must be between 1 and {}".format(POST_ORDERS_MAX_BATCH_SIZE)
+            )
+
+        batches = [args[i : i + batch_size] for i in range(0, len(args), batch_size)]
+        if not batches:
+            return []
+
+        def post_batch(batch: list[PostOrdersArgs]) -> list:
+            # the other batches may already be live, a failed batch never raises
+            try:
+                batch_result = self.post_orders(batch)
+            except PolyApiException as e:
+                error_msg = e.error_msg
+            except Exception as e:
+                error_msg = str(e)
+            else:
+                if isinstance(batch_result, list) and len(batch_result) == len(batch):
+                    return batch_result
+                error_msg = "unexpected POST /orders response: {}".format(batch_result)
+            self.logger.error("Couldn't post orders batch: {}".format(error_msg))
+            return [{"success": False, "errorMsg": error_msg} for _ in batch]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as pool:
+            batch_results = list(pool.map(post_batch, batches))
+
+        return [result for batch_result in batch_results for result in batch_result]
 
     def post_order(self, order, orderType: OrderType = OrderType.GTC):
         """
         Posts the order
         """
         self.assert_level_2_auth()
-        body = order_to_json(order, self.creds.api_key, orderType)
+        with get_instrumentation().span("serialize"):
+            body = order_to_json(order, self.creds.api_key, orderType)
         headers = create_level_2_headers(
             self.signer,
             self.creds,
             RequestArgs(method="POST", request_path=POST_ORDER, body=body),
+            timestamp=self.__timestamp(),
+        )
+        response = post(
+            "{}{}".format(self.host, POST_ORDER), headers=headers, data=body
         )
-        return post("{}{}".format(self.host, POST_ORDER), headers=headers, data=body)
+        for tracker in self.__trackers():
+            tracker.on_order_posted(order, response, orderType)
+        return response
 
     def create_and_post_order(
         self, order_args: OrderArgs, options: PartialCreateOrderOptions = None
@@ -460,6 +528,47 @@ class ClobClient:
         ord = self.create_order(order_args, options)
         return self.post_order(ord)
 
+    def create_and_post_orders(
+        self,
+        order_args: list[OrderArgs],
+        options: PartialCreateOrderOptions = None,
+        orderType: OrderType = OrderType.GTC,
+        max_in_flight: int = 4,
+    ) -> list:
+        """
+        Utility function to create and publish a stream of orders
+        Metadata resolution, signing and posting are pipelined, see OrderPipeline.
+        Returns one result per order, in the same order as the input args.
+        An order that couldn't be created or posted yields an error result
+        Level 2 Auth required
+        """
+        self.assert_level_2_auth()
+
+        with OrderPipeline(max_in_flight=max_in_flight) as pipeline:
+            futures = [
+                pipeline.submit(self, args, options, orderType) for args in order_args
+            ]
+
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(
+                    {
+                        "success": False,
+                        "errorMsg": (
+                            e.error_msg if isinstance(e, PolyApiException) else str(e)
+                        ),
+                    }
+                )
+        return results
+
+    def __canceled(self, response):
+        for tracker in self.__trackers():
+            tracker.on_cancel(response)
+        return response
+
     def cancel(self, order_id):
         """
         Cancels an order
@@ -469,8 +578,12 @@ class ClobClient:
         body = {"orderID": order_id}
 
         request_args = RequestArgs(method="DELETE", request_path=CANCEL, body=body)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        return delete("{}{}".format(self.host, CANCEL), headers=headers, data=body)
+        headers = create_level_2_headers(
+            self.signer, self.creds, request_args, timestamp=self.__timestamp()
+        )
+        return self.__canceled(
+            delete("{}{}".format(self.host, CANCEL), headers=headers, data=body)
+        )
 
     def cancel_orders(self, order_ids):
         """
@@ -483,9 +596,11 @@ class ClobClient:
         request_args = RequestArgs(
             method="DELETE", request_path=CANCEL_ORDERS, body=body
         )
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        return delete(
-            "{}{}".format(self.host, CANCEL_ORDERS), headers=headers, data=body
+        headers = create_level_2_headers(
+            self.signer, self.creds, request_args, timestamp=self.__timestamp()
+        )
+        return self.__canceled(
+            delete("{}{}".format(self.host, CANCEL_ORDERS), headers=headers, data=body)
         )
 
     def cancel_all(self):
@@ -495,8 +610,12 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="DELETE", request_path=CANCEL_ALL)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        return delete("{}{}".format(self.host, CANCEL_ALL), headers=headers)
+        headers = create_level_2_headers(
+            self.signer, self.creds, request_args, timestamp=self.__timestamp()
+        )
+        return self.__canceled(
+            delete("{}{}".format(self.host, CANCEL_ALL), headers=headers)
+        )
 
     def cancel_market_orders(self, market: str = "", asset_id: str = ""):
         """
@@ -509,9 +628,15 @@ class ClobClient:
         request_args = RequestArgs(
             method="DELETE", request_path=CANCEL_MARKET_ORDERS, body=body
         )
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        return delete(
-            "{}{}".format(self.host, CANCEL_MARKET_ORDERS), headers=headers, data=body
+        headers = create_level_2_headers(
+            self.signer, self.creds, request_args, timestamp=self.__timestamp()
+        )
+        return self.__canceled(
+            delete(
+                "{}{}".format(self.host, CANCEL_MARKET_ORDERS),
+                headers=headers,
+                data=body,
+            )
         )
 
     def get_orders(self, params: OpenOrderParams = None, next_cursor="MA=="):
@@ -521,7 +646,9 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="GET", request_path=ORDERS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = create_level_2_headers(
+            self.signer, self.creds, request_args, timestamp=self.__timestamp()
+        )
 
         results = []
         next_cursor = next_cursor if next_cursor is not None else "MA=="
@@ -535,27 +662,6 @@ class ClobClient:
 
         return results
 
-    def get_order_book(self, token_id) -> OrderBookSummary:
-        """
-        Fetches the orderbook for the token_id
-        """
-        raw_obs = get("{}{}?token_id={}".format(self.host, GET_ORDER_BOOK, token_id))
-        return parse_raw_orderbook_summary(raw_obs)
-
-    def get_order_books(self, params: list[BookParams]) -> list[OrderBookSummary]:
-        """
-        Fetches the orderbook for a set of token ids
-        """
-        body = [{"token_id": param.token_id} for param in params]
-        raw_obs = post("{}{}".format(self.host, GET_ORDER_BOOKS), data=body)
-        return [parse_raw_orderbook_summary(r) for r in raw_obs]
-
-    def get_order_book_hash(self, orderbook: OrderBookSummary) -> str:
-        """
-        Calculates the hash for the given orderbook
-        """
-        return generate_orderbook_summary_hash(orderbook)
-
     def get_order(self, order_id):
         """
         Fetches the order corresponding to the order_id
@@ -564,7 +670,9 @@ class ClobClient:
         self.assert_level_2_auth()
         endpoint = "{}{}".format(GET_ORDER, order_id)
         request_args = RequestArgs(method="GET", request_path=endpoint)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = create_level_2_headers(
+            self.signer, self.creds, request_args, timestamp=self.__timestamp()
+        )
         return get("{}{}".format(self.host, endpoint), headers=headers)
 
     def get_trades(self, params: TradeParams = None, next_cursor="MA=="):
@@ -572,34 +680,34 @@ class ClobClient:
         Fetches the trade history for a user
         Requires Level 2 authentication
         """
+        results = []
+        for trades, _ in self.iter_trades_pages(params, next_cursor):
+            results += trades
+
+        return results
+
+    def iter_trades_pages(self, params: TradeParams = None, next_cursor="MA=="):
+        """
+        Streams the trade history for a user, one page at a time
+        Yields (trades, next_cursor), next_cursor resumes after the page
+        Requires Level 2 authentication
+        """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="GET", request_path=TRADES)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
 
-        results = []
         next_cursor = next_cursor if next_cursor is not None else "MA=="
         while next_cursor != END_CURSOR:
+            headers = create_level_2_headers(
+                self.signer, self.creds, request_args, timestamp=self.__timestamp()
+            )
             url = add_query_trade_params(
                 "{}{}".format(self.host, TRADES), params, next_cursor
             )
             response = get(url, headers=headers)
             next_cursor = response["next_cursor"]
-            results += response["data"]
-
-        return results
-
-    def get_last_trade_price(self, token_id):
-        """
-        Fetches the last trade price token_id
-        """
-        return get("{}{}?token_id={}".format(self.host, GET_LAST_TRADE_PRICE, token_id))
-
-    def get_last_trades_prices(self, params: list[BookParams]):
-        """
-        Fetches the last trades prices for a set of token ids
-        """
-        body = [{"token_id": param.token_id} for param in params]
-        return post("{}{}".format(self.host, GET_LAST_TRADES_PRICES), data=body)
+            for tracker in self.__trackers():
+                tracker.on_trades(response["data"])
+            yield response["data"], next_cursor
 
     def assert_level_1_auth(self):
         """
@@ -629,7 +737,9 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="GET", request_path=GET_NOTIFICATIONS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = create_level_2_headers(
+            self.signer, self.creds, request_args, timestamp=self.__timestamp()
+        )
         url = "{}{}?signature_type={}".format(
             self.host, GET_NOTIFICATIONS, self.builder.sig_type
         )
@@ -642,7 +752,9 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="DELETE", request_path=DROP_NOTIFICATIONS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = create_level_2_headers(
+            self.signer, self.creds, request_args, timestamp=self.__timestamp()
+        )
         url = drop_notifications_query_params(
             "{}{}".format(self.host, DROP_NOTIFICATIONS), params
         )
@@ -655,7 +767,9 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="GET", request_path=GET_BALANCE_ALLOWANCE)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = create_level_2_headers(
+            self.signer, self.creds, request_args, timestamp=self.__timestamp()
+        )
         if params.signature_type == -1:
             params.signature_type = self.builder.sig_type
         url = add_balance_allowance_params_to_url(
@@ -669,8 +783,11 @@ class ClobClient:
         Requires Level 2 authentication
         """
         self.assert_level_2_auth()
+        # the server refreshes the cached balance on GET /balance-allowance/update
         request_args = RequestArgs(method="GET", request_path=UPDATE_BALANCE_ALLOWANCE)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = create_level_2_headers(
+            self.signer, self.creds, request_args, timestamp=self.__timestamp()
+        )
         if params.signature_type == -1:
             params.signature_type = self.builder.sig_type
         url = add_balance_allowance_params_to_url(
@@ -685,7 +802,9 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="GET", request_path=IS_ORDER_SCORING)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = create_level_2_headers(
+            self.signer, self.creds, request_args, timestamp=self.__timestamp()
+        )
         url = add_order_scoring_params_to_url(
             "{}{}".format(self.host, IS_ORDER_SCORING), params
         )
@@ -701,73 +820,9 @@ class ClobClient:
         request_args = RequestArgs(
             method="POST", request_path=ARE_ORDERS_SCORING, body=body
         )
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = create_level_2_headers(
+            self.signer, self.creds, request_args, timestamp=self.__timestamp()
+        )
         return post(
             "{}{}".format(self.host, ARE_ORDERS_SCORING), headers=headers, data=body
         )
-
-    def get_sampling_markets(self, next_cursor="MA=="):
-        """
-        Get the current sampling markets
-        """
-        return get(
-            "{}{}?next_cursor={}".format(self.host, GET_SAMPLING_MARKETS, next_cursor)
-        )
-
-    def get_sampling_simplified_markets(self, next_cursor="MA=="):
-        """
-        Get the current sampling simplified markets
-        """
-        return get(
-            "{}{}?next_cursor={}".format(
-                self.host, GET_SAMPLING_SIMPLIFIED_MARKETS, next_cursor
-            )
-        )
-
-    def get_markets(self, next_cursor="MA=="):
-        """
-        Get the current markets
-        """
-        return get("{}{}?next_cursor={}".format(self.host, GET_MARKETS, next_cursor))
-
-    def get_simplified_markets(self, next_cursor="MA=="):
-        """
-        Get the current simplified markets
-        """
-        return get(
-            "{}{}?next_cursor={}".format(self.host, GET_SIMPLIFIED_MARKETS, next_cursor)
-        )
-
-    def get_market(self, condition_id):
-        """
-        Get a market by condition_id
-        """
-        return get("{}{}{}".format(self.host, GET_MARKET, condition_id))
-
-    def get_market_trades_events(self, condition_id):
-        """
-        Get the market's trades events by condition id
-        """
-        return get("{}{}{}".format(self.host, GET_MARKET_TRADES_EVENTS, condition_id))
-
-    def calculate_market_price(
-        self, token_id: str, side: str, amount: float, order_type: OrderType
-    ) -> float:
-        """
-        Calculates the matching price considering an amount and the current orderbook
-        """
-        book = self.get_order_book(token_id)
-        if book is None:
-            raise Exception("no orderbook")
-        if side == "BUY":
-            if book.asks is None:
-                raise Exception("no match")
-            return self.builder.calculate_buy_market_price(
-                book.asks, amount, order_type
-            )
-        else:
-            if book.bids is None:
-                raise Exception("no match")
-            return self.builder.calculate_sell_market_price(
-                book.bids, amount, order_type
-            )
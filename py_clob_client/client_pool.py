@@ -0,0 +1,109 @@
+from concurrent.futures import Future
+from threading import Lock
+from typing import Optional
+
+from .cache import MarketMetadataCache
+from .client import ClobClient
+from .market_data import MarketDataClient
+from .clob_types import ApiCreds, OrderArgs, OrderType, PartialCreateOrderOptions
+from .order_pipeline import OrderPipeline
+
+
+class ClientPool:
+    """
+    Clients for many accounts (funder/proxy wallets) of the same CLOB
+    Every account keeps its own signer and API credentials, while the pool shares
+    between all of them:
+    - the HTTP transport (the pooled session of the http helpers)
+    - the markets metadata cache
+    - a MarketDataClient for the market data
+    - the order pipeline, so the orders of all the accounts are scheduled together
+    """
+
+    def __init__(self, host, chain_id: int, max_in_flight: int = 8):
+        self.host = host
+        self.chain_id = chain_id
+        self.max_in_flight = max_in_flight
+
+        self.metadata = MarketMetadataCache()
+        self.market_data = MarketDataClient(host, metadata_cache=self.metadata)
+
+        self.__clients: dict[str, ClobClient] = {}
+        self.__pipeline: Optional[OrderPipeline] = None
+        self.__lock = Lock()
+
+    def add_account(
+        self,
+        name: str,
+        key: str,
+        creds: ApiCreds = None,
+        signature_type: int = None,
+        funder: str = None,
+    ) -> ClobClient:
+        """
+        Adds an account to the pool and returns its client
+        """
+        client = ClobClient(
+            self.host,
+            chain_id=self.chain_id,
+            key=key,
+            creds=creds,
+            signature_type=signature_type,
+            funder=funder,
+            metadata_cache=self.metadata,
+        )
+        with self.__lock:
+            if name in self.__clients:
+                raise ValueError("account {} already exists".format(name))
+            self.__clients[name] = client
+        return client
+
+    def remove_account(self, name: str):
+        with self.__lock:
+            del self.__clients[name]
+
+    def get_client(self, name: str) -> ClobClient:
+        return self.__clients[name]
+
+    def accounts(self) -> list[str]:
+        return list(self.__clients)
+
+    def __getitem__(self, name: str) -> ClobClient:
+        return self.get_client(name)
+
+    def __len__(self):
+        return len(self.__clients)
+
+    def submit_order(
+        self,
+        name: str,
+        order_args: OrderArgs,
+        options: PartialCreateOrderOptions = None,
+        orderType: OrderType = OrderType.GTC,
+    ) -> Future:
+        """
+        Creates and posts an order for the account through the shared pipeline
+        Returns a future resolved with the post response
+        """
+        client = self.get_client(name)
+        client.assert_level_2_auth()
+        with self.__lock:
+            if self.__pipeline is None:
+                self.__pipeline = OrderPipeline(max_in_flight=self.max_in_flight)
+            pipeline = self.__pipeline
+        return pipeline.submit(client, order_args, options, orderType)
+
+    def close(self):
+        """
+        Waits for the submitted orders and stops the shared pipeline
+        """
+        with self.__lock:
+            pipeline, self.__pipeline = self.__pipeline, None
+        if pipeline is not None:
+            pipeline.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
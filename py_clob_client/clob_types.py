@@ -1,13 +1,13 @@
 from typing import Any
 from dataclasses import dataclass, asdict
 from json import dumps
-from typing import Literal, Optional
-from py_order_utils.model import (
-    SignedOrder,
-)
+from typing import TYPE_CHECKING, Literal, Optional
 
 from .constants import ZERO_ADDRESS
 
+if TYPE_CHECKING:
+    from py_order_utils.model import SignedOrder
+
 
 class OrderType(enumerate):
     GTC = "GTC"
@@ -242,5 +242,5 @@ class ContractConfig:
 
 @dataclass
 class PostOrdersArgs:
-    order: SignedOrder
+    order: "SignedOrder"
     orderType: OrderType = OrderType.GTC
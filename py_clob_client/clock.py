@@ -0,0 +1,102 @@
+import logging
+import time
+from threading import Event, Lock, Thread
+from typing import Callable
+
+
+class ServerClock:
+    """
+    Local estimate of the CLOB server clock
+    The server time is sampled periodically, the offset from the local clock is
+    estimated from the sample with the lowest round trip time, and timestamps are
+    computed from a monotonic clock so local clock jumps between syncs are ignored.
+    """
+
+    def __init__(
+        self,
+        get_server_time: Callable[[], int],
+        interval: float = 60,
+        samples: int = 3,
+    ):
+        self.get_server_time = get_server_time
+        self.interval = interval
+        self.samples = samples
+
+        self.offset = 0.0
+        """
+        Server time - local time, in seconds
+        """
+
+        self.rtt = None
+        """
+        Round trip time of the sample used to estimate the offset, in seconds
+        """
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self.__lock = Lock()
+        # server time at the monotonic time base, the local time until the first sync
+        self.__base_time = time.time()
+        self.__base_monotonic = time.monotonic()
+        self.__stop = Event()
+        self.__worker = None
+
+    def sync(self):
+        """
+        Samples the server time and updates the offset
+        """
+        best = None
+        for _ in range(self.samples):
+            start = time.monotonic()
+            server_time = int(self.get_server_time())
+            end = time.monotonic()
+            if best is None or end - start < best[0]:
+                best = (end - start, server_time, (start + end) / 2)
+
+        rtt, server_time, midpoint = best
+        # the server time is truncated to the second
+        server_time += 0.5
+        local_time = time.time() - (time.monotonic() - midpoint)
+        with self.__lock:
+            self.rtt = rtt
+            self.offset = server_time - local_time
+            self.__base_time = server_time
+            self.__base_monotonic = midpoint
+
+    def time(self) -> float:
+        """
+        Current server time estimate, in seconds
+        """
+        with self.__lock:
+            return self.__base_time + (time.monotonic() - self.__base_monotonic)
+
+    def timestamp(self) -> int:
+        """
+        Current server timestamp estimate, as used in the auth headers
+        """
+        return int(self.time())
+
+    def start(self):
+        """
+        Syncs now and then every interval seconds in the background
+        """
+        if self.__worker is not None:
+            return
+        self.sync()
+        self.__stop.clear()
+        self.__worker = Thread(target=self.__sync_loop, name="clob-clock", daemon=True)
+        self.__worker.start()
+
+    def stop(self):
+        if self.__worker is None:
+            return
+        self.__stop.set()
+        self.__worker.join()
+        self.__worker = None
+
+    def __sync_loop(self):
+        while not self.__stop.wait(self.interval):
+            try:
+                self.sync()
+            except Exception as e:
+                self.logger.error("Couldn't sync the server time: {}".format(e))
@@ -20,3 +20,6 @@ AMOY = 80002
 POLYGON = 137
 
 END_CURSOR = "LTE="
+
+# Maximum number of orders accepted by a single POST /orders request
+POST_ORDERS_MAX_BATCH_SIZE = 15
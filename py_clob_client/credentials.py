@@ -0,0 +1,141 @@
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Optional
+
+from Crypto.Cipher import AES
+
+from .clob_types import ApiCreds
+from .client import ClobClient
+from .signer import Signer
+
+logger = logging.getLogger(__name__)
+
+# scrypt parameters used to derive the store encryption key from the passphrase
+SCRYPT_N = 2**14
+SCRYPT_R = 8
+SCRYPT_P = 1
+
+
+class ApiCredsStore:
+    """
+    Local store of API credentials, keyed by (address, nonce)
+    Every entry is encrypted with AES-GCM using a key derived from the passphrase
+    """
+
+    def __init__(self, path: str, passphrase: str):
+        self.path = path
+        self.__lock = Lock()
+
+        data = {}
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                data = json.load(f)
+
+        self.__salt = bytes.fromhex(data["salt"]) if "salt" in data else os.urandom(16)
+        self.__entries: dict[str, dict] = data.get("entries", {})
+        self.__key = hashlib.scrypt(
+            passphrase.encode("utf-8"),
+            salt=self.__salt,
+            n=SCRYPT_N,
+            r=SCRYPT_R,
+            p=SCRYPT_P,
+            dklen=32,
+        )
+
+    @staticmethod
+    def _entry_key(address: str, nonce: int) -> str:
+        return "{}:{}".format(address.lower(), nonce)
+
+    def get(self, address: str, nonce: int = 0) -> Optional[ApiCreds]:
+        """
+        Returns the stored creds, None if there are none
+        Raises ValueError if the entry can't be decrypted with the passphrase
+        """
+        with self.__lock:
+            entry = self.__entries.get(self._entry_key(address, nonce))
+        if entry is None:
+            return None
+
+        cipher = AES.new(self.__key, AES.MODE_GCM, nonce=bytes.fromhex(entry["iv"]))
+        plaintext = cipher.decrypt_and_verify(
+            bytes.fromhex(entry["ciphertext"]), bytes.fromhex(entry["tag"])
+        )
+        return ApiCreds(**json.loads(plaintext))
+
+    def put(self, address: str, nonce: int, creds: ApiCreds):
+        cipher = AES.new(self.__key, AES.MODE_GCM)
+        ciphertext, tag = cipher.encrypt_and_digest(
+            json.dumps(creds.__dict__).encode("utf-8")
+        )
+        with self.__lock:
+            self.__entries[self._entry_key(address, nonce)] = {
+                "iv": cipher.nonce.hex(),
+                "ciphertext": ciphertext.hex(),
+                "tag": tag.hex(),
+            }
+
+    def save(self):
+        """
+        Writes the store to disk
+        """
+        with self.__lock:
+            data = {"salt": self.__salt.hex(), "entries": dict(self.__entries)}
+        tmp_path = "{}.tmp".format(self.path)
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def __len__(self):
+        return len(self.__entries)
+
+
+def bootstrap_api_creds(
+    host: str,
+    chain_id: int,
+    keys: list[str],
+    nonce: int = None,
+    store: ApiCredsStore = None,
+    max_workers: int = 16,
+) -> dict[str, Optional[ApiCreds]]:
+    """
+    Creates or derives the API creds of many wallets concurrently
+    The L1 headers are signed and the create/derive requests are issued in parallel.
+    Creds found in the store skip the network, new ones are added to it.
+    Returns the creds by wallet address, None for the wallets that failed
+    """
+    n = nonce if nonce is not None else 0
+    results: dict[str, Optional[ApiCreds]] = {}
+    missing = []
+    for key in keys:
+        address = Signer(key, chain_id).address()
+        creds = store.get(address, n) if store is not None else None
+        results[address] = creds
+        if creds is None:
+            missing.append((address, key))
+
+    def fetch(address: str, key: str) -> Optional[ApiCreds]:
+        try:
+            return ClobClient(
+                host, chain_id=chain_id, key=key
+            ).create_or_derive_api_creds(nonce)
+        except Exception as e:
+            logger.error(
+                "Couldn't bootstrap the CLOB creds of {}: {}".format(address, e)
+            )
+            return None
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as pool:
+            fetched = pool.map(lambda m: fetch(*m), missing)
+            for (address, _), creds in zip(missing, fetched):
+                results[address] = creds
+                if creds is not None and store is not None:
+                    store.put(address, n, creds)
+        if store is not None:
+            store.save()
+
+    return results
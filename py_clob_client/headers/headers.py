@@ -1,9 +1,13 @@
+import time
+from typing import TYPE_CHECKING
+
 from ..clob_types import ApiCreds, RequestArgs
+from ..instrumentation import get_instrumentation
 from ..signing.hmac import build_hmac_signature
 
-from ..signing.eip712 import sign_clob_auth_message
-from datetime import datetime
-from ..signer import Signer
+if TYPE_CHECKING:
+    from ..signer import Signer
+
 POLY_ADDRESS = "POLY_ADDRESS"
 POLY_SIGNATURE = "POLY_SIGNATURE"
 POLY_TIMESTAMP = "POLY_TIMESTAMP"
@@ -12,39 +16,78 @@ POLY_API_KEY = "POLY_API_KEY"
 POLY_PASSPHRASE = "POLY_PASSPHRASE"
 
 
-def create_level_1_headers(signer: Signer, nonce: int = None):
+def create_level_1_headers(signer: "Signer", nonce: int = None, timestamp: int = None):
     """
     Creates Level 1 Poly headers for a request
+    Uses the local time if no timestamp is given
     """
-    timestamp = int(datetime.now().timestamp())
+    # the eip712 stack is only needed by the L1 headers
+    from ..signing.eip712 import sign_clob_auth_message
+
+    if timestamp is None:
+        timestamp = int(time.time())
 
     n = 0
     if nonce is not None:
         n = nonce
-    signature = sign_clob_auth_message(signer, timestamp, n)
-    headers = {
-        POLY_ADDRESS: signer.address(),
-        POLY_SIGNATURE: signature,
-        POLY_TIMESTAMP: str(timestamp),
-        POLY_NONCE: str(n),
-    }
+    with get_instrumentation().span("l1_headers"):
+        signature = sign_clob_auth_message(signer, timestamp, n)
+        headers = {
+            POLY_ADDRESS: signer.address(),
+            POLY_SIGNATURE: signature,
+            POLY_TIMESTAMP: str(timestamp),
+            POLY_NONCE: str(n),
+        }
+
+    return headers
+
+
+async def create_level_1_headers_async(
+    signer, nonce: int = None, timestamp: int = None
+):
+    """
+    Same as create_level_1_headers, for sync and async signers (e.g. MPCSigner)
+    """
+    from ..signing.eip712 import sign_clob_auth_message_async
+
+    if timestamp is None:
+        timestamp = int(time.time())
+
+    n = 0
+    if nonce is not None:
+        n = nonce
+    # the signed message and the header must carry the same address
+    address = signer.address()
+    with get_instrumentation().span("l1_headers"):
+        signature = await sign_clob_auth_message_async(signer, timestamp, n, address)
+        headers = {
+            POLY_ADDRESS: address,
+            POLY_SIGNATURE: signature,
+            POLY_TIMESTAMP: str(timestamp),
+            POLY_NONCE: str(n),
+        }
 
     return headers
 
 
-def create_level_2_headers(signer: Signer, creds: ApiCreds, request_args: RequestArgs):
+def create_level_2_headers(
+    signer: "Signer", creds: ApiCreds, request_args: RequestArgs, timestamp: int = None
+):
     """
     Creates Level 2 Poly headers for a request
+    Uses the local time if no timestamp is given
     """
-    timestamp = int(datetime.now().timestamp())
-
-    hmac_sig = build_hmac_signature(
-        creds.api_secret,
-        timestamp,
-        request_args.method,
-        request_args.request_path,
-        request_args.body,
-    )
+    if timestamp is None:
+        timestamp = int(time.time())
+
+    with get_instrumentation().span("l2_headers"):
+        hmac_sig = build_hmac_signature(
+            creds.api_secret,
+            timestamp,
+            request_args.method,
+            request_args.request_path,
+            request_args.body,
+        )
 
     return {
         POLY_ADDRESS: signer.address(),
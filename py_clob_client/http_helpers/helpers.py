@@ -1,4 +1,9 @@
+import json
+from time import perf_counter
+from urllib.parse import urlsplit
+
 import requests
+from requests.adapters import HTTPAdapter
 
 from py_clob_client.clob_types import (
     DropNotificationParams,
@@ -9,13 +14,72 @@ from py_clob_client.clob_types import (
     OpenOrderParams,
 )
 
+from .. import endpoints
 from ..exceptions import PolyApiException
+from ..instrumentation import get_instrumentation
 
 GET = "GET"
 POST = "POST"
 DELETE = "DELETE"
 PUT = "PUT"
 
+# Connection pool shared by every request issued by the client, so that
+# concurrent submissions reuse keep-alive connections instead of opening new ones
+HTTP_POOL_MAXSIZE = 32
+
+_http_session = requests.Session()
+for _prefix in ("https://", "http://"):
+    _http_session.mount(
+        _prefix,
+        HTTPAdapter(pool_connections=HTTP_POOL_MAXSIZE, pool_maxsize=HTTP_POOL_MAXSIZE),
+    )
+
+
+def http_pool_usage() -> dict:
+    """
+    Connections of the shared session pools, by state: "in_use" by a request,
+    or "idle" kept alive for the next ones
+    """
+    usage = {"in_use": 0, "idle": 0}
+    for adapter in _http_session.adapters.values():
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            # a pool holds its free slots, None until a connection is returned
+            if pool is None or pool.pool is None:
+                continue
+            slots = list(pool.pool.queue)
+            usage["in_use"] += pool.pool.maxsize - len(slots)
+            usage["idle"] += sum(conn is not None for conn in slots)
+    return usage
+
+
+# paths of the endpoints, longest first so that /data/orders matches before /orders
+_ENDPOINT_PATHS = sorted(
+    {
+        value
+        for name, value in vars(endpoints).items()
+        if name.isupper() and isinstance(value, str)
+    },
+    key=len,
+    reverse=True,
+)
+
+
+def endpoint_template(url: str) -> str:
+    """
+    Endpoint of the url, with its id replaced by {id}: a bounded metrics label
+    /data/order/0xabc is /data/order/{id}, the unknown paths are "other"
+    """
+    path = urlsplit(url).path.rstrip("/") or "/"
+    head, _, tail = path.rpartition("/")
+    for endpoint in _ENDPOINT_PATHS:
+        if path.endswith(endpoint):
+            return endpoint
+        if endpoint.endswith("/") and (head + "/").endswith(endpoint):
+            return endpoint + "{id}"
+    return "/" if path == "/" else "other"
+
 
 def overloadHeaders(method: str, headers: dict) -> dict:
     if headers is None:
@@ -33,18 +97,44 @@ def overloadHeaders(method: str, headers: dict) -> dict:
 
 
 def request(endpoint: str, method: str, headers=None, data=None):
+    instrumentation = get_instrumentation()
     try:
         headers = overloadHeaders(method, headers)
-        
-        resp = requests.request(
-            method=method, url=endpoint, headers=headers, json=data if data else None
-        )
-        
+
+        with instrumentation.span("serialize"):
+            body = json.dumps(data, allow_nan=False).encode("utf-8") if data else None
+
+        if instrumentation.enabled:
+            start = perf_counter()
+            status = "error"
+            try:
+                resp = _http_session.request(
+                    method=method, url=endpoint, headers=headers, data=body
+                )
+                status = resp.status_code
+            finally:
+                instrumentation.record(
+                    "http_request",
+                    perf_counter() - start,
+                    method=method,
+                    path=endpoint_template(endpoint),
+                    status=status,
+                )
+                for state, connections in http_pool_usage().items():
+                    instrumentation.gauge(
+                        "http_pool_connections", connections, state=state
+                    )
+        else:
+            resp = _http_session.request(
+                method=method, url=endpoint, headers=headers, data=body
+            )
+
         if resp.status_code != 200:
             raise PolyApiException(resp)
 
         try:
-            return resp.json()
+            with instrumentation.span("json_decode"):
+                return resp.json()
         except requests.JSONDecodeError:
             return resp.text
 
@@ -83,8 +173,9 @@ def add_query_trade_params(
     Adds query parameters to a url
     """
     url = base_url
-    if params:
+    if params or next_cursor:
         url = url + "?"
+    if params:
         if params.market:
             url = build_query_params(url, "market", params.market)
         if params.asset_id:
@@ -97,8 +188,8 @@ def add_query_trade_params(
             url = build_query_params(url, "maker_address", params.maker_address)
         if params.id:
             url = build_query_params(url, "id", params.id)
-        if next_cursor:
-            url = build_query_params(url, "next_cursor", next_cursor)
+    if next_cursor:
+        url = build_query_params(url, "next_cursor", next_cursor)
     return url
 
 
@@ -109,16 +200,17 @@ def add_query_open_orders_params(
     Adds query parameters to a url
     """
     url = base_url
-    if params:
+    if params or next_cursor:
         url = url + "?"
+    if params:
         if params.market:
             url = build_query_params(url, "market", params.market)
         if params.asset_id:
             url = build_query_params(url, "asset_id", params.asset_id)
         if params.id:
             url = build_query_params(url, "id", params.id)
-        if next_cursor:
-            url = build_query_params(url, "next_cursor", next_cursor)
+    if next_cursor:
+        url = build_query_params(url, "next_cursor", next_cursor)
     return url
 
 
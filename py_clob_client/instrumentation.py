@@ -0,0 +1,222 @@
+import logging
+import math
+from threading import Lock
+from time import perf_counter
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("instrumentation", "name", "labels", "start")
+
+    def __init__(self, instrumentation, name: str, labels: dict):
+        self.instrumentation = instrumentation
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.instrumentation.record(
+            self.name, perf_counter() - self.start, **self.labels
+        )
+        return False
+
+
+class Instrumentation:
+    """
+    Receives the timing spans, counters and events of the client
+    This base class ignores everything, subclasses override record, incr and event.
+
+    Spans emitted by the client:
+    - resolve_tick_size, resolve_neg_risk: market metadata resolution
+    - order_amounts: maker and taker amounts computation
+    - sign_order: EIP712 order hashing and signing
+    - l1_headers, l2_headers: auth headers build
+    - serialize: order and request body serialization
+    - http_request: network send and receive (method, path, status labels)
+    - json_decode: response decoding
+    - mpc_sign: MPC sign_hash request
+
+    Counters: cache_lookups (cache, result), retries (operation)
+    Gauges: pipeline_in_flight, mpc_in_flight
+    """
+
+    enabled = False
+
+    def span(self, name: str, **labels):
+        """
+        Context manager timing its body as the span name
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self, name, labels)
+
+    def record(self, name: str, duration: float, **labels):
+        """
+        Records the duration, in seconds, of a span
+        """
+
+    def incr(self, name: str, value: float = 1, **labels):
+        """
+        Increments a counter
+        """
+
+    def gauge(self, name: str, value: float, **labels):
+        """
+        Sets a gauge
+        """
+
+    def event(self, name: str, **fields):
+        """
+        Emits a structured event
+        """
+
+
+class Histogram:
+    """
+    Histogram of positive values with logarithmic buckets
+    Percentiles are estimated within GROWTH relative error
+    """
+
+    BASE = 1e-7
+    GROWTH = 1.05
+
+    def __init__(self):
+        self.__lock = Lock()
+        self.__buckets: dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value: float):
+        bucket = (
+            math.ceil(math.log(value / self.BASE, self.GROWTH))
+            if value > self.BASE
+            else 0
+        )
+        with self.__lock:
+            self.__buckets[bucket] = self.__buckets.get(bucket, 0) + 1
+            self.count += 1
+            self.sum += value
+            self.min = value if self.min is None else min(self.min, value)
+            self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "Histogram"):
+        """
+        Adds the values of the other histogram
+        """
+        with other.__lock:
+            buckets = dict(other.__buckets)
+            count, total, low, high = other.count, other.sum, other.min, other.max
+        if count == 0:
+            return
+        with self.__lock:
+            for bucket, n in buckets.items():
+                self.__buckets[bucket] = self.__buckets.get(bucket, 0) + n
+            self.count += count
+            self.sum += total
+            self.min = low if self.min is None else min(self.min, low)
+            self.max = high if self.max is None else max(self.max, high)
+
+    def percentile(self, p: float) -> float:
+        """
+        Estimated value of the p (0 - 100) percentile
+        """
+        with self.__lock:
+            if self.count == 0:
+                return None
+            rank = max(1, math.ceil(self.count * p / 100))
+            seen = 0
+            for bucket in sorted(self.__buckets):
+                seen += self.__buckets[bucket]
+                if seen >= rank:
+                    value = self.BASE * self.GROWTH**bucket
+                    return min(max(value, self.min), self.max)
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.sum / self.count if self.count else None,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class HistogramCollector(Instrumentation):
+    """
+    In process collector keeping a duration histogram per span and labels,
+    plus the counters and gauges. Events are logged at debug level
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.__lock = Lock()
+        self.histograms: dict[tuple, Histogram] = {}
+        self.counters: dict[tuple, float] = {}
+        self.gauges: dict[tuple, float] = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def record(self, name: str, duration: float, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            with self.__lock:
+                histogram = self.histograms.setdefault(key, Histogram())
+        histogram.observe(duration)
+
+    def incr(self, name: str, value: float = 1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.__lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def gauge(self, name: str, value: float, **labels):
+        self.gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def event(self, name: str, **fields):
+        self.logger.debug("%s %s", name, fields)
+
+    def summary(self) -> dict:
+        """
+        Duration summary by span name, merging the labels
+        """
+        merged: dict[str, Histogram] = {}
+        for (name, _), histogram in list(self.histograms.items()):
+            merged.setdefault(name, Histogram()).merge(histogram)
+        return {name: histogram.summary() for name, histogram in merged.items()}
+
+
+NOOP = Instrumentation()
+
+_instrumentation = NOOP
+
+
+def get_instrumentation() -> Instrumentation:
+    """
+    Returns the instrumentation of the process, no-op by default
+    """
+    return _instrumentation
+
+
+def set_instrumentation(instrumentation: Instrumentation = None):
+    """
+    Sets the instrumentation of the process, None restores the no-op one
+    """
+    global _instrumentation
+    _instrumentation = instrumentation if instrumentation is not None else NOOP
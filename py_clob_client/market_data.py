@@ -0,0 +1,273 @@
+import logging
+import time
+from typing import Iterator, Optional
+
+from .cache import MarketMetadataCache
+from .clob_types import BookParams, OrderBookSummary, OrderType, TickSize
+from .constants import END_CURSOR
+from .endpoints import (
+    GET_LAST_TRADE_PRICE,
+    GET_LAST_TRADES_PRICES,
+    GET_MARKET,
+    GET_MARKET_TRADES_EVENTS,
+    GET_MARKETS,
+    GET_NEG_RISK,
+    GET_ORDER_BOOK,
+    GET_ORDER_BOOKS,
+    GET_PRICES,
+    GET_SAMPLING_MARKETS,
+    GET_SAMPLING_SIMPLIFIED_MARKETS,
+    GET_SIMPLIFIED_MARKETS,
+    GET_SPREAD,
+    GET_SPREADS,
+    GET_TICK_SIZE,
+    MID_POINT,
+    MID_POINTS,
+    PRICE,
+    TIME,
+)
+from .http_helpers.helpers import get, post
+from .instrumentation import get_instrumentation
+from .order_builder.helpers import calculate_book_market_price
+from .utilities import generate_orderbook_summary_hash, parse_raw_orderbook_summary
+
+
+class MarketDataClient:
+    def __init__(self, host, metadata_cache: MarketMetadataCache = None):
+        """
+        Client of the open CLOB endpoints: markets, books, prices and spreads
+        It shares the pooled transport of the ClobClient but none of its auth and
+        signing dependencies, a light client for read-only processes.
+        A metadata_cache can be given to share the markets metadata between clients
+        """
+        self.host = host[0:-1] if host.endswith("/") else host
+
+        # local cache
+        self.__metadata = (
+            metadata_cache if metadata_cache is not None else MarketMetadataCache()
+        )
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def get_ok(self):
+        """
+        Health check: Confirms that the server is up
+        Does not need authentication
+        """
+        return get("{}/".format(self.host))
+
+    def get_server_time(self):
+        """
+        Returns the current timestamp on the server
+        Does not need authentication
+        """
+        return get("{}{}".format(self.host, TIME))
+
+    def get_midpoint(self, token_id):
+        """
+        Get the mid market price for the given market
+        """
+        return get("{}{}?token_id={}".format(self.host, MID_POINT, token_id))
+
+    def get_midpoints(self, params: list[BookParams]):
+        """
+        Get the mid market prices for a set of token ids
+        """
+        body = [{"token_id": param.token_id} for param in params]
+        return post("{}{}".format(self.host, MID_POINTS), data=body)
+
+    def get_price(self, token_id, side):
+        """
+        Get the market price for the given market
+        """
+        return get("{}{}?token_id={}&side={}".format(self.host, PRICE, token_id, side))
+
+    def get_prices(self, params: list[BookParams]):
+        """
+        Get the market prices for a set
+        """
+        body = [{"token_id": param.token_id, "side": param.side} for param in params]
+        return post("{}{}".format(self.host, GET_PRICES), data=body)
+
+    def get_spread(self, token_id):
+        """
+        Get the spread for the given market
+        """
+        return get("{}{}?token_id={}".format(self.host, GET_SPREAD, token_id))
+
+    def get_spreads(self, params: list[BookParams]):
+        """
+        Get the spreads for a set of token ids
+        """
+        body = [{"token_id": param.token_id} for param in params]
+        return post("{}{}".format(self.host, GET_SPREADS), data=body)
+
+    def get_tick_size(self, token_id: str) -> TickSize:
+        if token_id in self.__metadata.tick_sizes:
+            get_instrumentation().incr("cache_lookups", cache="tick_size", result="hit")
+            return self.__metadata.tick_sizes[token_id]
+
+        get_instrumentation().incr("cache_lookups", cache="tick_size", result="miss")
+
+        result = get("{}{}?token_id={}".format(self.host, GET_TICK_SIZE, token_id))
+        self.__metadata.tick_sizes[token_id] = str(result["minimum_tick_size"])
+
+        return self.__metadata.tick_sizes[token_id]
+
+    def get_neg_risk(self, token_id: str) -> bool:
+        if token_id in self.__metadata.neg_risk:
+            get_instrumentation().incr("cache_lookups", cache="neg_risk", result="hit")
+            return self.__metadata.neg_risk[token_id]
+
+        get_instrumentation().incr("cache_lookups", cache="neg_risk", result="miss")
+
+        result = get("{}{}?token_id={}".format(self.host, GET_NEG_RISK, token_id))
+        self.__metadata.neg_risk[token_id] = result["neg_risk"]
+
+        return result["neg_risk"]
+
+    def get_order_book(self, token_id) -> OrderBookSummary:
+        """
+        Fetches the orderbook for the token_id
+        """
+        raw_obs = get("{}{}?token_id={}".format(self.host, GET_ORDER_BOOK, token_id))
+        return parse_raw_orderbook_summary(raw_obs)
+
+    def get_order_books(self, params: list[BookParams]) -> list[OrderBookSummary]:
+        """
+        Fetches the orderbook for a set of token ids
+        """
+        body = [{"token_id": param.token_id} for param in params]
+        raw_obs = post("{}{}".format(self.host, GET_ORDER_BOOKS), data=body)
+        return [parse_raw_orderbook_summary(r) for r in raw_obs]
+
+    def get_order_book_hash(self, orderbook: OrderBookSummary) -> str:
+        """
+        Calculates the hash for the given orderbook
+        """
+        return generate_orderbook_summary_hash(orderbook)
+
+    def stream_order_books(
+        self,
+        token_ids: list[str],
+        interval: float = 1,
+        max_polls: Optional[int] = None,
+    ) -> Iterator[OrderBookSummary]:
+        """
+        Polls the orderbooks of the token ids every interval seconds, with one bulk
+        request per poll, and yields the books that changed since the previous poll.
+        The first poll yields every book. Runs until max_polls, forever by default
+        """
+        params = [BookParams(token_id=token_id) for token_id in token_ids]
+        hashes: dict[str, str] = {}
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            if polls:
+                time.sleep(interval)
+            polls += 1
+
+            for book in self.get_order_books(params):
+                book_hash = book.hash or self.get_order_book_hash(book)
+                if hashes.get(book.asset_id) == book_hash:
+                    continue
+                hashes[book.asset_id] = book_hash
+                yield book
+
+    def get_last_trade_price(self, token_id):
+        """
+        Fetches the last trade price token_id
+        """
+        return get("{}{}?token_id={}".format(self.host, GET_LAST_TRADE_PRICE, token_id))
+
+    def get_last_trades_prices(self, params: list[BookParams]):
+        """
+        Fetches the last trades prices for a set of token ids
+        """
+        body = [{"token_id": param.token_id} for param in params]
+        return post("{}{}".format(self.host, GET_LAST_TRADES_PRICES), data=body)
+
+    def get_sampling_markets(self, next_cursor="MA=="):
+        """
+        Get the current sampling markets
+        """
+        return get(
+            "{}{}?next_cursor={}".format(self.host, GET_SAMPLING_MARKETS, next_cursor)
+        )
+
+    def get_sampling_simplified_markets(self, next_cursor="MA=="):
+        """
+        Get the current sampling simplified markets
+        """
+        return get(
+            "{}{}?next_cursor={}".format(
+                self.host, GET_SAMPLING_SIMPLIFIED_MARKETS, next_cursor
+            )
+        )
+
+    def get_markets(self, next_cursor="MA=="):
+        """
+        Get the current markets
+        """
+        return get("{}{}?next_cursor={}".format(self.host, GET_MARKETS, next_cursor))
+
+    def get_simplified_markets(self, next_cursor="MA=="):
+        """
+        Get the current simplified markets
+        """
+        return get(
+            "{}{}?next_cursor={}".format(self.host, GET_SIMPLIFIED_MARKETS, next_cursor)
+        )
+
+    def iter_markets(self, next_cursor="MA==") -> Iterator[dict]:
+        """
+        Streams all the markets, page after page
+        The tick size and neg risk of their tokens fill the metadata cache on the way
+        """
+        while next_cursor != END_CURSOR:
+            response = self.get_markets(next_cursor)
+            for market in response["data"]:
+                self.__cache_market_metadata(market)
+                yield market
+            next_cursor = response["next_cursor"]
+
+    def load_markets_metadata(self) -> int:
+        """
+        Fills the metadata cache with the tick sizes and neg risk of all the markets,
+        a request per page of markets instead of two per token.
+        Returns the number of markets
+        """
+        return sum(1 for _ in self.iter_markets())
+
+    def __cache_market_metadata(self, market: dict):
+        tick_size = market.get("minimum_tick_size")
+        neg_risk = market.get("neg_risk")
+        for token in market.get("tokens") or []:
+            token_id = token.get("token_id")
+            if not token_id:
+                continue
+            if tick_size is not None:
+                self.__metadata.tick_sizes[token_id] = str(tick_size)
+            if neg_risk is not None:
+                self.__metadata.neg_risk[token_id] = neg_risk
+
+    def get_market(self, condition_id):
+        """
+        Get a market by condition_id
+        """
+        return get("{}{}{}".format(self.host, GET_MARKET, condition_id))
+
+    def get_market_trades_events(self, condition_id):
+        """
+        Get the market's trades events by condition id
+        """
+        return get("{}{}{}".format(self.host, GET_MARKET_TRADES_EVENTS, condition_id))
+
+    def calculate_market_price(
+        self, token_id: str, side: str, amount: float, order_type: OrderType
+    ) -> float:
+        """
+        Calculates the matching price considering an amount and the current orderbook
+        """
+        return calculate_book_market_price(
+            self.get_order_book(token_id), side, amount, order_type
+        )
@@ -0,0 +1,274 @@
+import math
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+
+from .instrumentation import Instrumentation
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _format_labels(labels: tuple) -> str:
+    if not labels:
+        return ""
+    return (
+        "{"
+        + ",".join(
+            '{}="{}"'.format(
+                k,
+                str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+            )
+            for k, v in labels
+        )
+        + "}"
+    )
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    type = None
+
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self._lock = Lock()
+        self._values: dict[tuple, object] = {}
+
+    @staticmethod
+    def _key(labels: dict) -> tuple:
+        return tuple(sorted(labels.items()))
+
+    def samples(self) -> list[tuple[str, tuple, float]]:
+        raise NotImplementedError
+
+    def expose(self) -> str:
+        lines = [
+            "# TYPE {} {}".format(self.name, self.type),
+            "# HELP {} {}".format(self.name, self.help),
+        ]
+        for name, labels, value in self.samples():
+            lines.append(
+                "{}{} {}".format(name, _format_labels(labels), _format_value(value))
+            )
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def inc(self, value: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + value
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            return [
+                ("{}_total".format(self.name), labels, value)
+                for labels, value in self._values.items()
+            ]
+
+
+class Gauge(_Metric):
+    type = "gauge"
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, value: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + value
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            return [
+                (self.name, labels, value) for labels, value in self._values.items()
+            ]
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, buckets: tuple = DEFAULT_BUCKETS):
+        super().__init__(name, help)
+        self.buckets = tuple(float(b) for b in sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0, 0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+                    break
+            state[1] += 1
+            state[2] += value
+
+    def get_count(self, **labels) -> int:
+        state = self._values.get(self._key(labels))
+        return state[1] if state else 0
+
+    def samples(self):
+        samples = []
+        with self._lock:
+            for labels, (counts, count, total) in self._values.items():
+                cumulative = 0
+                for bound, n in zip(self.buckets, counts):
+                    cumulative += n
+                    samples.append(
+                        (
+                            "{}_bucket".format(self.name),
+                            labels + (("le", _format_value(bound)),),
+                            cumulative,
+                        )
+                    )
+                samples.append(("{}_count".format(self.name), labels, count))
+                samples.append(("{}_sum".format(self.name), labels, total))
+        return samples
+
+
+class MetricsRegistry:
+    """
+    Registry of the client metrics, exposed in the OpenMetrics text format
+    """
+
+    def __init__(self):
+        self.__lock = Lock()
+        self.__metrics: dict[str, _Metric] = {}
+
+    def __get_or_create(self, cls, name: str, help: str, **kwargs) -> _Metric:
+        with self.__lock:
+            metric = self.__metrics.get(name)
+            if metric is None:
+                metric = self.__metrics[name] = cls(name, help, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(
+                    "metric {} is already registered as a {}".format(name, metric.type)
+                )
+            return metric
+
+    def counter(self, name: str, help: str = "") -> Counter:
+        return self.__get_or_create(Counter, name, help)
+
+    def gauge(self, name: str, help: str = "") -> Gauge:
+        return self.__get_or_create(Gauge, name, help)
+
+    def histogram(
+        self, name: str, help: str = "", buckets: tuple = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.__get_or_create(Histogram, name, help, buckets=buckets)
+
+    def get(self, name: str) -> _Metric:
+        return self.__metrics.get(name)
+
+    def to_openmetrics(self) -> str:
+        with self.__lock:
+            metrics = list(self.__metrics.values())
+        return "".join(metric.expose() + "\n" for metric in metrics) + "# EOF\n"
+
+
+class MetricsInstrumentation(Instrumentation):
+    """
+    Instrumentation feeding a metrics registry:
+    - clob_requests_total, by method, path and status ("error" if no response)
+    - clob_request_duration_seconds, by method and path
+      The path is the endpoint template, /data/order/{id}, not the ids requested
+    - clob_span_duration_seconds, the other spans (signing, headers, ...) by span
+    - clob_cache_lookups_total, the metadata cache lookups by cache and result
+    - clob_retries_total, by operation
+    - clob_<name>_total and clob_<name> for any other counter and gauge
+    """
+
+    enabled = True
+
+    def __init__(self, registry: MetricsRegistry = None):
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self.requests = self.registry.counter(
+            "clob_requests", "Requests sent to the CLOB"
+        )
+        self.request_duration = self.registry.histogram(
+            "clob_request_duration_seconds", "Network round trip of the requests"
+        )
+        self.span_duration = self.registry.histogram(
+            "clob_span_duration_seconds", "Duration of the client steps"
+        )
+
+    def record(self, name: str, duration: float, **labels):
+        if name == "http_request":
+            self.requests.inc(**labels)
+            self.request_duration.observe(
+                duration, method=labels.get("method"), path=labels.get("path")
+            )
+        else:
+            self.span_duration.observe(duration, span=name, **labels)
+
+    def incr(self, name: str, value: float = 1, **labels):
+        self.registry.counter("clob_{}".format(name)).inc(value, **labels)
+
+    def gauge(self, name: str, value: float, **labels):
+        self.registry.gauge("clob_{}".format(name)).set(value, **labels)
+
+    def to_openmetrics(self) -> str:
+        return self.registry.to_openmetrics()
+
+
+def start_metrics_server(
+    registry: MetricsRegistry, port: int = 0, addr: str = "127.0.0.1"
+) -> ThreadingHTTPServer:
+    """
+    Serves the registry in the OpenMetrics text format on http://addr:port/metrics
+    from a background thread. Port 0 picks a free port, see server.server_address.
+    Call server.shutdown() to stop it
+    """
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.to_openmetrics().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((addr, port), MetricsHandler)
+    Thread(target=server.serve_forever, name="clob-metrics", daemon=True).start()
+    return server
@@ -1,148 +1,12 @@
-from ..MPCSigner import MPCSigner
-from py_order_utils.model import EOA
-from ..clob_types import MarketOrderArgs, CreateOrderOptions, TickSize, RoundConfig, OrderType, OrderSummary
-from py_order_utils.model import SignedOrder, OrderData, BUY as UtilsBuy, SELL as UtilsSell
-from py_clob_client.config import get_contract_config
-from py_order_utils.builders import MpcOrderBuilder as UtilsMpcOrderBuilder
-from .constants import BUY, SELL
-from .helpers import (
-    to_token_decimals,
-    round_down,
-    round_normal,
-    decimal_places,
-    round_up,
-)
+from .builder import OrderBuilder
 
-from py_order_utils.model.sides import BUY as UtilsBuy, SELL as UtilsSell
 
-ROUNDING_CONFIG: dict[TickSize, RoundConfig] = {
-    "0.1": RoundConfig(price=1, size=2, amount=3),
-    "0.01": RoundConfig(price=2, size=2, amount=4),
-    "0.001": RoundConfig(price=3, size=2, amount=5),
-    "0.0001": RoundConfig(price=4, size=2, amount=6),
-}
+class MPCOrderBuilder(OrderBuilder):
+    """
+    OrderBuilder whose create methods are the async ones, kept for compatibility
+    The OrderBuilder signs with MPC signers through create_order_async
+    """
 
-class MPCOrderBuilder:
-    def __init__(self, signer: MPCSigner, sig_type=None, funder=None):
-        self.signer = signer
-
-        # Signature type used sign orders, defaults to EOA type
-        self.sig_type = sig_type if sig_type is not None else EOA
-
-        # Address which holds funds to be used.
-        # Used for Polymarket proxy wallets and other smart contract wallets
-        # Defaults to the address of the signer
-        self.funder = funder if funder is not None else self.signer.account_id
-    
-    async def create_market_order(
-        self, order_args: MarketOrderArgs, options: CreateOrderOptions
-    ) -> SignedOrder:
-        """
-        Creates and signs a market order
-        """
-        side, maker_amount, taker_amount = self.get_market_order_amounts(
-            order_args.side,
-            order_args.amount,
-            order_args.price,
-            ROUNDING_CONFIG[options.tick_size],
-        )
-
-        data = OrderData(
-            maker=self.funder,
-            taker=order_args.taker,
-            tokenId=order_args.token_id,
-            makerAmount=str(maker_amount),
-            takerAmount=str(taker_amount),
-            side=side,
-            feeRateBps=str(order_args.fee_rate_bps),
-            nonce=str(order_args.nonce),
-            signer=self.signer.ota_account,
-            expiration="0",
-            signatureType=self.sig_type,
-        )
-
-        contract_config = get_contract_config(
-            self.signer.get_chain_id(), options.neg_risk
-        )
-
-        order_builder = UtilsMpcOrderBuilder(
-            contract_config.exchange,
-            self.signer.chain_id,
-            self.signer, #<-- this is the MPCSigner instance and order builder expect a MPCSigner instance
-        )
-
-        return await order_builder.build_signed_order(data)
-
-    def calculate_sell_market_price(
-        self,
-        positions: list[OrderSummary],
-        amount_to_match: float,
-        order_type: OrderType,
-    ) -> float:
-        if not positions:
-            raise Exception("no match")
-
-        sum = 0
-        for p in reversed(positions):
-            sum += float(p.size)
-            if sum >= amount_to_match:
-                return float(p.price)
-
-        if order_type == OrderType.FOK:
-            raise Exception("no match")
-
-        return float(positions[0].price)
-    
-    def calculate_buy_market_price(
-        self,
-        positions: list[OrderSummary],
-        amount_to_match: float,
-        order_type: OrderType,
-    ) -> float:
-        if not positions:
-            raise Exception("no match")
-
-        sum = 0
-        for p in reversed(positions):
-            sum += float(p.size) * float(p.price)
-            if sum >= amount_to_match:
-                return float(p.price)
-
-        if order_type == OrderType.FOK:
-            raise Exception("no match")
-
-        return float(positions[0].price)
-    
-    def get_market_order_amounts(
-        self, side: str, amount: float, price: float, round_config: RoundConfig
-    ):
-        raw_price = round_normal(price, round_config.price)
-
-        if side == UtilsBuy:
-            raw_maker_amt = round_down(amount, round_config.size)
-            raw_taker_amt = raw_maker_amt / raw_price
-            if decimal_places(raw_taker_amt) > round_config.amount:
-                raw_taker_amt = round_up(raw_taker_amt, round_config.amount + 4)
-                if decimal_places(raw_taker_amt) > round_config.amount:
-                    raw_taker_amt = round_down(raw_taker_amt, round_config.amount)
-
-            maker_amount = to_token_decimals(raw_maker_amt)
-            taker_amount = to_token_decimals(raw_taker_amt)
-            
-            return UtilsBuy, maker_amount, taker_amount
-
-        elif side == UtilsSell:
-            raw_maker_amt = round_down(amount, round_config.size)
-
-            raw_taker_amt = raw_maker_amt * raw_price
-            if decimal_places(raw_taker_amt) > round_config.amount:
-                raw_taker_amt = round_up(raw_taker_amt, round_config.amount + 4)
-                if decimal_places(raw_taker_amt) > round_config.amount:
-                    raw_taker_amt = round_down(raw_taker_amt, round_config.amount)
-
-            maker_amount = to_token_decimals(raw_maker_amt)
-            taker_amount = to_token_decimals(raw_taker_amt)
-
-            return UtilsSell, maker_amount, taker_amount
-        else:
-            raise ValueError(f"order_args.side must be '{BUY}' or '{SELL}'")
+    create_order = OrderBuilder.create_order_async
+    create_market_order = OrderBuilder.create_market_order_async
+    build_signed_order = OrderBuilder.build_signed_order_async
@@ -2,6 +2,9 @@ from py_order_utils.builders import OrderBuilder as UtilsOrderBuilder
 from py_order_utils.signer import Signer as UtilsSigner
 from py_order_utils.model import (
     EOA,
+    POLY_GNOSIS_SAFE,
+    POLY_PROXY,
+    Order,
     OrderData,
     SignedOrder,
     BUY as UtilsBuy,
@@ -14,12 +17,17 @@ from .helpers import (
     round_normal,
     decimal_places,
     round_up,
+    calculate_buy_market_price,
+    calculate_sell_market_price,
 )
 
 from .constants import BUY, SELL
+from py_order_utils.utils import generate_seed, normalize_address, prepend_zx
 from py_order_utils.model.sides import BUY as BuyConstant, SELL as SellConstant
 from ..config import get_contract_config
-from ..signer import Signer
+from ..signer import Signer, is_async_signer, sign_async
+from ..signing.order import get_order_hash
+from ..instrumentation import get_instrumentation
 from ..clob_types import (
     OrderArgs,
     CreateOrderOptions,
@@ -38,6 +46,40 @@ ROUNDING_CONFIG: dict[TickSize, RoundConfig] = {
 }
 
 
+def build_order(data: OrderData) -> Order:
+    """
+    Builds the order from its data, with a new salt
+    Same as the py_order_utils builder, without its local signer check
+    """
+    if (
+        data.maker is None
+        or data.tokenId is None
+        or data.makerAmount is None
+        or data.takerAmount is None
+        or data.side not in [UtilsBuy, UtilsSell]
+        or not data.feeRateBps.isnumeric()
+        or not data.nonce.isnumeric()
+        or not data.expiration.isnumeric()
+        or data.signatureType not in [EOA, POLY_GNOSIS_SAFE, POLY_PROXY]
+    ):
+        raise ValueError("Invalid order inputs")
+
+    return Order(
+        salt=int(generate_seed()),
+        maker=normalize_address(data.maker),
+        signer=normalize_address(data.signer if data.signer else data.maker),
+        taker=normalize_address(data.taker),
+        tokenId=int(data.tokenId),
+        makerAmount=int(data.makerAmount),
+        takerAmount=int(data.takerAmount),
+        expiration=int(data.expiration),
+        nonce=int(data.nonce),
+        feeRateBps=int(data.feeRateBps),
+        side=int(data.side),
+        signatureType=int(data.signatureType),
+    )
+
+
 class OrderBuilder:
     def __init__(self, signer: Signer, sig_type=None, funder=None):
         self.signer = signer
@@ -50,10 +92,13 @@ class OrderBuilder:
         # Defaults to the address of the signer
         self.funder = funder if funder is not None else self.signer.address()
 
+        # py_order_utils builders, by exchange address
+        self.__order_builders = {}
+
     def get_order_amounts(
         self, side: str, size: float, price: float, round_config: RoundConfig
     ):
-        
+
         raw_price = round_normal(price, round_config.price)
 
         if side == BuyConstant:
@@ -88,7 +133,7 @@ class OrderBuilder:
     def get_market_order_amounts(
         self, side: str, amount: float, price: float, round_config: RoundConfig
     ):
-        
+
         raw_price = round_normal(price, round_config.price)
 
         if side == UtilsBuy:
@@ -101,7 +146,7 @@ class OrderBuilder:
 
             maker_amount = to_token_decimals(raw_maker_amt)
             taker_amount = to_token_decimals(raw_taker_amt)
-            
+
             return UtilsBuy, maker_amount, taker_amount
 
         elif side == UtilsSell:
@@ -126,14 +171,55 @@ class OrderBuilder:
         """
         Creates and signs an order
         """
-        side, maker_amount, taker_amount = self.get_order_amounts(
-            order_args.side,
-            order_args.size,
-            order_args.price,
-            ROUNDING_CONFIG[options.tick_size],
+        return self.build_signed_order(
+            self.get_order_data(order_args, options), options.neg_risk
+        )
+
+    def create_market_order(
+        self, order_args: MarketOrderArgs, options: CreateOrderOptions
+    ) -> SignedOrder:
+        """
+        Creates and signs a market order
+        """
+        return self.build_signed_order(
+            self.get_market_order_data(order_args, options), options.neg_risk
         )
 
-        data = OrderData(
+    async def create_order_async(
+        self, order_args: OrderArgs, options: CreateOrderOptions
+    ) -> SignedOrder:
+        """
+        Same as create_order, for sync and async signers
+        """
+        return await self.build_signed_order_async(
+            self.get_order_data(order_args, options), options.neg_risk
+        )
+
+    async def create_market_order_async(
+        self, order_args: MarketOrderArgs, options: CreateOrderOptions
+    ) -> SignedOrder:
+        """
+        Same as create_market_order, for sync and async signers
+        """
+        return await self.build_signed_order_async(
+            self.get_market_order_data(order_args, options), options.neg_risk
+        )
+
+    def get_order_data(
+        self, order_args: OrderArgs, options: CreateOrderOptions
+    ) -> OrderData:
+        """
+        Order data of a limit order, before signing
+        """
+        with get_instrumentation().span("order_amounts"):
+            side, maker_amount, taker_amount = self.get_order_amounts(
+                order_args.side,
+                order_args.size,
+                order_args.price,
+                ROUNDING_CONFIG[options.tick_size],
+            )
+
+        return OrderData(
             maker=self.funder,
             taker=order_args.taker,
             tokenId=order_args.token_id,
@@ -147,33 +233,21 @@ class OrderBuilder:
             signatureType=self.sig_type,
         )
 
-        contract_config = get_contract_config(
-            self.signer.get_chain_id(), options.neg_risk
-        )
-
-        order_builder = UtilsOrderBuilder(
-            contract_config.exchange,
-            self.signer.get_chain_id(),
-            UtilsSigner(key=self.signer.private_key),
-        )
-
-        return order_builder.build_signed_order(data)
-
-    def create_market_order(
+    def get_market_order_data(
         self, order_args: MarketOrderArgs, options: CreateOrderOptions
-    ) -> SignedOrder:
+    ) -> OrderData:
         """
-        Creates and signs a market order
+        Order data of a market order, before signing
         """
-     
-        side, maker_amount, taker_amount = self.get_market_order_amounts(
-            order_args.side,
-            order_args.amount,
-            order_args.price,
-            ROUNDING_CONFIG[options.tick_size],
-        )
-
-        data = OrderData(
+        with get_instrumentation().span("order_amounts"):
+            side, maker_amount, taker_amount = self.get_market_order_amounts(
+                order_args.side,
+                order_args.amount,
+                order_args.price,
+                ROUNDING_CONFIG[options.tick_size],
+            )
+
+        return OrderData(
             maker=self.funder,
             taker=order_args.taker,
             tokenId=order_args.token_id,
@@ -187,17 +261,55 @@ class OrderBuilder:
             signatureType=self.sig_type,
         )
 
-        contract_config = get_contract_config(
-            self.signer.get_chain_id(), options.neg_risk
-        )
+    def prepare_order(self, data: OrderData, neg_risk: bool) -> tuple[Order, str]:
+        """
+        Builds the order and its EIP712 hash, ready to be signed
+        """
+        chain_id = self.signer.get_chain_id()
+        exchange = get_contract_config(chain_id, neg_risk).exchange
 
-        order_builder = UtilsOrderBuilder(
-            contract_config.exchange,
-            self.signer.get_chain_id(),
-            UtilsSigner(key=self.signer.private_key),
-        )
+        if is_async_signer(self.signer):
+            # no local key to check the order signer against
+            order = build_order(data)
+        else:
+            order_builder = self.__order_builders.get(exchange)
+            if order_builder is None:
+                order_builder = UtilsOrderBuilder(
+                    exchange,
+                    chain_id,
+                    UtilsSigner(key=self.signer.private_key),
+                )
+                self.__order_builders[exchange] = order_builder
+            order = order_builder.build_order(data)
+
+        return order, prepend_zx(get_order_hash(order, chain_id, exchange).hex())
+
+    def build_signed_order(self, data: OrderData, neg_risk: bool) -> SignedOrder:
+        """
+        Builds the order and signs its EIP712 hash
+        """
+        if is_async_signer(self.signer):
+            raise ValueError(
+                "the signer is async, orders are created with create_order_async"
+            )
+
+        with get_instrumentation().span("sign_order"):
+            order, order_hash = self.prepare_order(data, neg_risk)
+            signature = prepend_zx(self.signer.sign(order_hash))
+
+        return SignedOrder(order, signature)
+
+    async def build_signed_order_async(
+        self, data: OrderData, neg_risk: bool
+    ) -> SignedOrder:
+        """
+        Builds the order and signs its EIP712 hash, with a sync or an async signer
+        """
+        order, order_hash = self.prepare_order(data, neg_risk)
+        with get_instrumentation().span("sign_order"):
+            signature = prepend_zx(await sign_async(self.signer, order_hash))
 
-        return order_builder.build_signed_order(data)
+        return SignedOrder(order, signature)
 
     def calculate_buy_market_price(
         self,
@@ -205,19 +317,7 @@ class OrderBuilder:
         amount_to_match: float,
         order_type: OrderType,
     ) -> float:
-        if not positions:
-            raise Exception("no match")
-
-        sum = 0
-        for p in reversed(positions):
-            sum += float(p.size) * float(p.price)
-            if sum >= amount_to_match:
-                return float(p.price)
-
-        if order_type == OrderType.FOK:
-            raise Exception("no match")
-
-        return float(positions[0].price)
+        return calculate_buy_market_price(positions, amount_to_match, order_type)
 
     def calculate_sell_market_price(
         self,
@@ -225,16 +325,4 @@ class OrderBuilder:
         amount_to_match: float,
         order_type: OrderType,
     ) -> float:
-        if not positions:
-            raise Exception("no match")
-
-        sum = 0
-        for p in reversed(positions):
-            sum += float(p.size)
-            if sum >= amount_to_match:
-                return float(p.price)
-
-        if order_type == OrderType.FOK:
-            raise Exception("no match")
-
-        return float(positions[0].price)
+        return calculate_sell_market_price(positions, amount_to_match, order_type)
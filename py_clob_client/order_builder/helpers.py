@@ -1,6 +1,8 @@
 from math import floor, ceil
 from decimal import Decimal
 
+from ..clob_types import OrderBookSummary, OrderSummary, OrderType
+
 
 def round_down(x: float, sig_digits: int) -> float:
     return floor(x * (10**sig_digits)) / (10**sig_digits)
@@ -23,3 +25,63 @@ def to_token_decimals(x: float) -> int:
 
 def decimal_places(x: float) -> int:
     return abs(Decimal(x.__str__()).as_tuple().exponent)
+
+
+def calculate_buy_market_price(
+    positions: list[OrderSummary], amount_to_match: float, order_type: OrderType
+) -> float:
+    """
+    Price matching an amount to spend against the asks, best ask last
+    """
+    if not positions:
+        raise Exception("no match")
+
+    sum = 0
+    for p in reversed(positions):
+        sum += float(p.size) * float(p.price)
+        if sum >= amount_to_match:
+            return float(p.price)
+
+    if order_type == OrderType.FOK:
+        raise Exception("no match")
+
+    return float(positions[0].price)
+
+
+def calculate_sell_market_price(
+    positions: list[OrderSummary], amount_to_match: float, order_type: OrderType
+) -> float:
+    """
+    Price matching a size to sell against the bids, best bid last
+    """
+    if not positions:
+        raise Exception("no match")
+
+    sum = 0
+    for p in reversed(positions):
+        sum += float(p.size)
+        if sum >= amount_to_match:
+            return float(p.price)
+
+    if order_type == OrderType.FOK:
+        raise Exception("no match")
+
+    return float(positions[0].price)
+
+
+def calculate_book_market_price(
+    book: OrderBookSummary, side: str, amount: float, order_type: OrderType
+) -> float:
+    """
+    Price matching an amount against the orderbook: the asks for a BUY, the bids for a SELL
+    """
+    if book is None:
+        raise Exception("no orderbook")
+    if side == "BUY":
+        if book.asks is None:
+            raise Exception("no match")
+        return calculate_buy_market_price(book.asks, amount, order_type)
+    else:
+        if book.bids is None:
+            raise Exception("no match")
+        return calculate_sell_market_price(book.bids, amount, order_type)
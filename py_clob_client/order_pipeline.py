@@ -0,0 +1,145 @@
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from queue import Queue
+from threading import BoundedSemaphore, Lock, Thread
+from typing import Any, Optional, Union
+
+from .clob_types import (
+    CreateOrderOptions,
+    OrderArgs,
+    OrderType,
+    PartialCreateOrderOptions,
+)
+from .instrumentation import get_instrumentation
+
+_STOP = object()
+
+
+@dataclass
+class _PipelineJob:
+    client: Any
+    order_args: OrderArgs
+    options: Optional[Union[PartialCreateOrderOptions, CreateOrderOptions]]
+    order_type: OrderType
+    future: Future
+    order: Any = None
+
+
+class OrderPipeline:
+    """
+    Pipelined create and post of a stream of orders
+    Every order goes through 3 stages, each one running concurrently with the others:
+    1) Resolve: the tick size and neg risk of the market are resolved and the price checked
+    2) Sign: the order is created and signed
+    3) Post: the signed order is posted, up to max_in_flight requests at a time
+    While order N is in flight, order N+1 is being signed and the metadata of order N+2
+    is resolved, so the throughput is bounded by the slowest stage.
+    Every stage holds at most queue_size orders (max_in_flight + queue_size for the
+    post stage), a slow stage blocks the previous ones instead of piling up orders.
+    """
+
+    def __init__(self, max_in_flight: int = 4, queue_size: int = 16):
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self.__resolve_queue = Queue(maxsize=queue_size)
+        self.__sign_queue = Queue(maxsize=queue_size)
+        self.__post_executor = ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix="clob-post"
+        )
+        # signed orders waiting for or in a post, the sign stage blocks beyond it
+        self.__post_slots = BoundedSemaphore(max_in_flight + queue_size)
+        self.__closed = False
+        self.__in_flight = 0
+        self.__in_flight_lock = Lock()
+
+        self.__resolver = Thread(
+            target=self.__resolve_loop, name="clob-resolve", daemon=True
+        )
+        self.__signer = Thread(target=self.__sign_loop, name="clob-sign", daemon=True)
+        self.__resolver.start()
+        self.__signer.start()
+
+    def submit(
+        self,
+        client,
+        order_args: OrderArgs,
+        options: Optional[PartialCreateOrderOptions] = None,
+        order_type: OrderType = OrderType.GTC,
+    ) -> Future:
+        """
+        Queues an order to be created with the given client and posted
+        Returns a future resolved with the post response
+        """
+        if self.__closed:
+            raise RuntimeError("the pipeline is closed")
+
+        future = Future()
+        self.__resolve_queue.put(
+            _PipelineJob(client, order_args, options, order_type, future)
+        )
+        return future
+
+    def close(self, wait: bool = True):
+        """
+        Stops accepting orders, the queued ones are still processed
+        """
+        if self.__closed:
+            return
+        self.__closed = True
+        self.__resolve_queue.put(_STOP)
+        if wait:
+            self.__resolver.join()
+            self.__signer.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __resolve_loop(self):
+        while True:
+            job = self.__resolve_queue.get()
+            if job is _STOP:
+                self.__sign_queue.put(_STOP)
+                return
+            try:
+                # resolved once here, the sign stage never fetches the metadata
+                job.options = job.client.resolve_order_options(
+                    job.order_args.token_id, job.order_args.price, job.options
+                )
+            except Exception as e:
+                job.future.set_exception(e)
+                continue
+            self.__sign_queue.put(job)
+
+    def __sign_loop(self):
+        while True:
+            job = self.__sign_queue.get()
+            if job is _STOP:
+                self.__post_executor.shutdown(wait=True)
+                return
+            try:
+                job.order = job.client.create_order(job.order_args, job.options)
+            except Exception as e:
+                job.future.set_exception(e)
+                continue
+            self.__post_slots.acquire()
+            self.__post_executor.submit(self.__post, job)
+
+    def __update_in_flight(self, delta: int):
+        with self.__in_flight_lock:
+            self.__in_flight += delta
+            get_instrumentation().gauge("pipeline_in_flight", self.__in_flight)
+
+    def __post(self, job: _PipelineJob):
+        self.__update_in_flight(1)
+        try:
+            job.future.set_result(job.client.post_order(job.order, job.order_type))
+        except Exception as e:
+            self.logger.error("Couldn't post order: {}".format(e))
+            job.future.set_exception(e)
+        finally:
+            self.__update_in_flight(-1)
+            self.__post_slots.release()
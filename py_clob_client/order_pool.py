@@ -0,0 +1,227 @@
+import inspect
+import logging
+from collections import deque
+from queue import Queue
+from threading import Condition, Event, Thread
+from typing import Optional
+
+from .clob_types import OrderArgs, OrderType, PartialCreateOrderOptions
+from .constants import ZERO_ADDRESS
+
+_STOP = object()
+
+
+class PresignedOrderPool:
+    """
+    Pool of limit orders signed ahead of time for a grid of prices and sizes
+    Placing a quote for a point of the grid is a pool lookup plus a post,
+    the consumed order is signed again in the background.
+    The orders are bound to the given nonce: once it is incremented onchain the pool
+    must be cleared.
+    The orders are signed in a thread, the client must sign synchronously: a ClobClient
+    with a private key or a sync signer, not an MPCClobClient.
+    """
+
+    def __init__(
+        self,
+        client,
+        token_id: str,
+        side: str,
+        prices: list[float],
+        sizes: list[float],
+        depth: int = 1,
+        options: Optional[PartialCreateOrderOptions] = None,
+        fee_rate_bps: int = 0,
+        nonce: int = 0,
+        expiration: int = 0,
+        taker: str = ZERO_ADDRESS,
+        retry_delay: float = 0.5,
+        max_retry_delay: float = 30,
+    ):
+        """
+        depth is the number of signed orders kept for each (price, size) of the grid
+        A failed signature is retried after retry_delay seconds, doubled after every
+        consecutive failure up to max_retry_delay
+        """
+        signer = getattr(client, "signer", None)
+        if inspect.iscoroutinefunction(client.create_order) or (
+            signer is not None and inspect.iscoroutinefunction(signer.sign)
+        ):
+            raise ValueError(
+                "the pool signs the orders in a thread, {} signs asynchronously".format(
+                    client.__class__.__name__
+                )
+            )
+
+        self.client = client
+        self.token_id = token_id
+        self.side = side
+        self.depth = depth
+        self.options = options
+        self.fee_rate_bps = fee_rate_bps
+        self.nonce = nonce
+        self.expiration = expiration
+        self.taker = taker
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self.__orders = {
+            (float(price), float(size)): deque() for price in prices for size in sizes
+        }
+        self.__available = Condition()
+        self.__refills = Queue()
+        self.__stop = Event()
+        self.__worker = None
+        # incremented on clear, orders signed before are discarded
+        self.__generation = 0
+
+    def start(self):
+        """
+        Starts signing the orders of the grid in the background
+        """
+        if self.__worker is not None:
+            return
+        for key in self.__orders:
+            for _ in range(self.depth):
+                self.__refills.put(key)
+        self.__stop.clear()
+        self.__worker = Thread(
+            target=self.__refill_loop, name="clob-presign", daemon=True
+        )
+        self.__worker.start()
+
+    def close(self):
+        """
+        Stops the background signing
+        """
+        if self.__worker is None:
+            return
+        self.__stop.set()
+        self.__refills.put(_STOP)
+        self.__worker.join()
+        # the pending refills are queued again by the next start
+        while not self.__refills.empty():
+            self.__refills.get_nowait()
+        with self.__available:
+            self.__worker = None
+            # the pool won't fill any more, wake up wait_until_full
+            self.__available.notify_all()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def available(self, price: float, size: float) -> int:
+        """
+        Number of signed orders ready for the price and size
+        """
+        with self.__available:
+            return len(self.__orders[self.__key(price, size)])
+
+    def wait_until_full(self, timeout: float = None) -> bool:
+        """
+        Blocks until every point of the grid has depth signed orders
+        Returns False on timeout or if the pool is closed meanwhile, raises if the
+        pool is not started
+        """
+        with self.__available:
+            if self.__worker is None:
+                raise RuntimeError("the pool is not started")
+            self.__available.wait_for(
+                lambda: self.__full() or self.__worker is None, timeout
+            )
+            return self.__full()
+
+    def __full(self) -> bool:
+        return all(len(o) >= self.depth for o in self.__orders.values())
+
+    def take(self, price: float, size: float):
+        """
+        Returns a signed order for the price and size and schedules its replacement
+        Signs the order on the spot if the pool for the price and size is empty
+        """
+        key = self.__key(price, size)
+        with self.__available:
+            order = self.__orders[key].popleft() if self.__orders[key] else None
+        if self.__worker is not None:
+            self.__refills.put(key)
+        return order if order is not None else self.__sign(key)
+
+    def place(self, price: float, size: float, orderType: OrderType = OrderType.GTC):
+        """
+        Posts a pre-signed order for the price and size
+        """
+        return self.client.post_order(self.take(price, size), orderType)
+
+    def clear(self):
+        """
+        Drops every signed order and signs them again if the pool is started,
+        e.g. after setting the nonce following an onchain increment
+        """
+        with self.__available:
+            self.__generation += 1
+            for orders in self.__orders.values():
+                orders.clear()
+        if self.__worker is not None:
+            for key in self.__orders:
+                for _ in range(self.depth):
+                    self.__refills.put(key)
+
+    def __key(self, price: float, size: float) -> tuple:
+        key = (float(price), float(size))
+        if key not in self.__orders:
+            raise ValueError(
+                "price ({}) and size ({}) are not in the grid".format(price, size)
+            )
+        return key
+
+    def __sign(self, key: tuple):
+        price, size = key
+        return self.client.create_order(
+            OrderArgs(
+                token_id=self.token_id,
+                price=price,
+                size=size,
+                side=self.side,
+                fee_rate_bps=self.fee_rate_bps,
+                nonce=self.nonce,
+                expiration=self.expiration,
+                taker=self.taker,
+            ),
+            self.options,
+        )
+
+    def __refill_loop(self):
+        failures = 0
+        while True:
+            key = self.__refills.get()
+            if key is _STOP or self.__stop.is_set():
+                return
+            generation = self.__generation
+            try:
+                order = self.__sign(key)
+            except Exception as e:
+                delay = min(self.retry_delay * 2**failures, self.max_retry_delay)
+                failures += 1
+                self.logger.error(
+                    "Couldn't pre-sign order {}, retrying in {}s: {}".format(
+                        key, delay, e
+                    )
+                )
+                if self.__stop.wait(delay):
+                    return
+                self.__refills.put(key)
+                continue
+            failures = 0
+            with self.__available:
+                if (
+                    generation == self.__generation
+                    and len(self.__orders[key]) < self.depth
+                ):
+                    self.__orders[key].append(order)
+                    self.__available.notify_all()
@@ -0,0 +1,322 @@
+import logging
+import time
+from decimal import Decimal
+from threading import Event, Lock, Thread
+from typing import Optional
+
+from .clob_types import OpenOrderParams, OrderType
+
+# statuses of a posted order still resting on the book
+OPEN_STATUSES = ["live", "delayed"]
+
+# order types whose unmatched size rests on the book
+RESTING_ORDER_TYPES = [OrderType.GTC, OrderType.GTD]
+
+TOKEN_DECIMALS = Decimal(10**6)
+
+
+def _decimal_str(value: Decimal) -> str:
+    return "{:f}".format(value.normalize())
+
+
+def remaining_size(order: dict) -> float:
+    """
+    Unmatched size of an open order
+    """
+    return float(order.get("original_size") or 0) - float(
+        order.get("size_matched") or 0
+    )
+
+
+def _order_from_post(order: dict, response: dict, order_type: OrderType) -> dict:
+    maker_amount = Decimal(order.get("makerAmount") or 0)
+    taker_amount = Decimal(order.get("takerAmount") or 0)
+    side = order.get("side")
+    # shares and collateral amounts of the order
+    size, cost = (
+        (taker_amount, maker_amount) if side == "BUY" else (maker_amount, taker_amount)
+    )
+    matched = response.get("takingAmount" if side == "BUY" else "makingAmount")
+    return {
+        "id": response["orderID"],
+        "status": "LIVE",
+        "maker_address": order.get("maker"),
+        "asset_id": str(order.get("tokenId")),
+        "side": side,
+        "original_size": _decimal_str(size / TOKEN_DECIMALS),
+        "size_matched": _decimal_str(Decimal(matched or 0)),
+        "price": _decimal_str(cost / size) if size else "0",
+        "order_type": order_type,
+        "expiration": order.get("expiration"),
+    }
+
+
+def _in_scope(order: dict, params: Optional[OpenOrderParams]) -> bool:
+    if params is None:
+        return True
+    return (
+        (not params.id or order.get("id") == params.id)
+        and (not params.market or order.get("market") == params.market)
+        and (not params.asset_id or order.get("asset_id") == params.asset_id)
+    )
+
+
+class OrderTracker:
+    """
+    Local state of the open orders of an account
+    Orders are recorded from the post responses, and removed by the cancel responses
+    and by the fills of the trades (get_trades or the user channel). The orders are
+    indexed by token, so the open orders of a token are known without a request.
+    reconcile diffs the local state with get_orders, and can run every interval
+    seconds in the background, see start.
+    The orders have the format of get_orders
+    """
+
+    def __init__(self, client=None, interval: float = 60):
+        self.client = client
+        self.interval = interval
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self.__lock = Lock()
+        self.__orders: dict[str, dict] = {}
+        self.__by_token: dict[str, dict[str, dict]] = {}
+        # monotonic time an order was last recorded, so a reconcile never drops the
+        # orders recorded while it was fetching
+        self.__recorded_at: dict[str, float] = {}
+        # orders whose taker fill was applied from the post response
+        self.__taker_filled: set[str] = set()
+        self.__trade_ids: set[str] = set()
+        self.__stop = Event()
+        self.__worker = None
+
+    def __len__(self) -> int:
+        return len(self.__orders)
+
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self.__orders
+
+    def get_order(self, order_id: str) -> Optional[dict]:
+        return self.__orders.get(order_id)
+
+    def open_orders(self, token_id: str = None) -> list[dict]:
+        """
+        Open orders of the token, all of them if no token is given
+        """
+        with self.__lock:
+            if token_id is None:
+                return list(self.__orders.values())
+            return list(self.__by_token.get(token_id, {}).values())
+
+    def has_open_orders(self, token_id: str) -> bool:
+        return bool(self.__by_token.get(token_id))
+
+    def tokens(self) -> list[str]:
+        """
+        Tokens with open orders
+        """
+        return list(self.__by_token)
+
+    def __add(self, order: dict):
+        order_id = order["id"]
+        self.__remove(order_id)
+        self.__orders[order_id] = order
+        self.__by_token.setdefault(order.get("asset_id"), {})[order_id] = order
+        self.__recorded_at[order_id] = time.monotonic()
+
+    def __remove(self, order_id: str) -> Optional[dict]:
+        order = self.__orders.pop(order_id, None)
+        self.__recorded_at.pop(order_id, None)
+        if order is not None:
+            token_orders = self.__by_token.get(order.get("asset_id"))
+            if token_orders is not None:
+                token_orders.pop(order_id, None)
+                if not token_orders:
+                    del self.__by_token[order.get("asset_id")]
+        return order
+
+    def __fill(self, order_id: str, size: float):
+        order = self.__orders.get(order_id)
+        if order is None:
+            return
+        order["size_matched"] = _decimal_str(
+            Decimal(order.get("size_matched") or 0) + Decimal(str(size))
+        )
+        if remaining_size(order) <= 0:
+            self.__remove(order_id)
+
+    def on_order_posted(
+        self, order, response: dict, order_type: OrderType = OrderType.GTC
+    ):
+        """
+        Records the order if its post response leaves it resting on the book
+        order is the SignedOrder
+        """
+        if not isinstance(response, dict) or not response.get("orderID"):
+            return
+        if not response.get("success", True):
+            return
+
+        tracked = _order_from_post(order.dict(), response, order_type)
+        status = (response.get("status") or "").lower()
+        resting = status in OPEN_STATUSES or (
+            status == "matched" and order_type in RESTING_ORDER_TYPES
+        )
+        with self.__lock:
+            if float(tracked["size_matched"]):
+                self.__taker_filled.add(tracked["id"])
+            if resting and remaining_size(tracked) > 0:
+                self.__add(tracked)
+            else:
+                self.__remove(tracked["id"])
+
+    def on_orders_posted(self, args: list, responses: list):
+        """
+        Records the orders of a post_orders call, args are the PostOrdersArgs
+        """
+        if not isinstance(responses, list):
+            return
+        for arg, response in zip(args, responses):
+            self.on_order_posted(arg.order, response, arg.orderType)
+
+    def on_cancel(self, response: dict):
+        """
+        Removes the orders canceled by a cancel response
+        """
+        if not isinstance(response, dict):
+            return
+        with self.__lock:
+            for order_id in response.get("canceled") or []:
+                self.__remove(order_id)
+
+    def on_trade(self, trade: dict):
+        """
+        Applies the fills of a trade to the tracked orders, taker or maker
+        A trade is applied once, whatever the number of its status updates.
+        The taker fill of an order matched on arrival is already in its post response
+        """
+        trade_id = trade.get("id")
+        if (trade.get("status") or "").upper() == "FAILED":
+            return
+        with self.__lock:
+            if trade_id is not None:
+                if trade_id in self.__trade_ids:
+                    return
+                self.__trade_ids.add(trade_id)
+
+            taker_order_id = trade.get("taker_order_id")
+            if (
+                taker_order_id in self.__orders
+                and taker_order_id not in self.__taker_filled
+            ):
+                self.__fill(taker_order_id, float(trade.get("size") or 0))
+            for maker_order in trade.get("maker_orders") or []:
+                order_id = maker_order.get("order_id")
+                if order_id in self.__orders:
+                    self.__fill(order_id, float(maker_order.get("matched_amount") or 0))
+
+    def on_trades(self, trades: list[dict]):
+        for trade in trades:
+            self.on_trade(trade)
+
+    def on_order_event(self, event: dict):
+        """
+        Applies an order message of the user channel: PLACEMENT, UPDATE or CANCELLATION
+        """
+        event_type = (event.get("type") or "").upper()
+        order_id = event.get("id")
+        with self.__lock:
+            if event_type == "CANCELLATION":
+                self.__remove(order_id)
+                return
+            order = {
+                key: event[key]
+                for key in [
+                    "id",
+                    "market",
+                    "asset_id",
+                    "side",
+                    "price",
+                    "original_size",
+                    "size_matched",
+                    "outcome",
+                    "owner",
+                    "order_type",
+                ]
+                if key in event
+            }
+            if event_type == "UPDATE" and order_id in self.__orders:
+                self.__orders[order_id].update(order)
+                if remaining_size(self.__orders[order_id]) <= 0:
+                    self.__remove(order_id)
+            elif remaining_size(order) > 0:
+                order.setdefault("status", "LIVE")
+                self.__add(order)
+
+    def reconcile(self, params: OpenOrderParams = None) -> dict:
+        """
+        Diffs the tracked orders with get_orders, the server state wins
+        Only the orders in the scope of the params are reconciled.
+        Returns the ids of the added, updated and removed orders
+        """
+        start = time.monotonic()
+        orders = self.client.get_orders(params)
+        server_orders = {order["id"]: order for order in orders}
+
+        added, updated, removed = [], [], []
+        with self.__lock:
+            for order_id, order in server_orders.items():
+                local = self.__orders.get(order_id)
+                if local is None:
+                    added.append(order_id)
+                elif local.get("size_matched") != order.get("size_matched"):
+                    updated.append(order_id)
+                else:
+                    continue
+                if remaining_size(order) > 0:
+                    self.__add(order)
+                else:
+                    self.__remove(order_id)
+
+            for order_id, order in list(self.__orders.items()):
+                if (
+                    order_id not in server_orders
+                    and _in_scope(order, params)
+                    and self.__recorded_at.get(order_id, 0) < start
+                ):
+                    self.__remove(order_id)
+                    removed.append(order_id)
+
+        if added or updated or removed:
+            self.logger.info(
+                "Reconciled orders: {} added, {} updated, {} removed".format(
+                    len(added), len(updated), len(removed)
+                )
+            )
+        return {"added": added, "updated": updated, "removed": removed}
+
+    def start(self):
+        """
+        Reconciles now and then every interval seconds in the background
+        """
+        if self.__worker is not None:
+            return
+        self.reconcile()
+        self.__stop.clear()
+        self.__worker = Thread(
+            target=self.__reconcile_loop, name="clob-orders", daemon=True
+        )
+        self.__worker.start()
+
+    def stop(self):
+        if self.__worker is None:
+            return
+        self.__stop.set()
+        self.__worker.join()
+        self.__worker = None
+
+    def __reconcile_loop(self):
+        while not self.__stop.wait(self.interval):
+            try:
+                self.reconcile()
+            except Exception as e:
+                self.logger.error("Couldn't reconcile the orders: {}".format(e))
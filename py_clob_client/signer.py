@@ -1,7 +1,17 @@
+import asyncio
+import inspect
+
 from eth_account import Account
 
 
 class Signer:
+    """
+    Local signer of a private key
+    Every signer of the client has the same interface: address(), get_chain_id() and
+    sign(message_hash) returning the hex signature of the hash. Remote signers
+    (e.g. MPCSigner) define sign as a coroutine, see is_async_signer and sign_async
+    """
+
     def __init__(self, private_key: str, chain_id: int):
         assert private_key is not None and chain_id is not None
 
@@ -20,3 +30,20 @@ class Signer:
         Signs a message hash
         """
         return Account._sign_hash(message_hash, self.private_key).signature.hex()
+
+
+def is_async_signer(signer) -> bool:
+    """
+    True if the signatures of the signer must be awaited
+    """
+    return inspect.iscoroutinefunction(signer.sign)
+
+
+async def sign_async(signer, message_hash: str) -> str:
+    """
+    Signs a message hash with a sync or an async signer
+    The sync signers run in a thread, so the event loop is never blocked
+    """
+    if is_async_signer(signer):
+        return await signer.sign(message_hash)
+    return await asyncio.to_thread(signer.sign, message_hash)
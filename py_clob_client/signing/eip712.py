@@ -1,28 +1,79 @@
+from functools import lru_cache
+
 from poly_eip712_structs import make_domain
 from eth_utils import keccak
 from py_order_utils.utils import prepend_zx
 
 from .model import ClobAuth
-from ..signer import Signer
+from ..signer import Signer, sign_async
 
 CLOB_DOMAIN_NAME = "ClobAuthDomain"
 CLOB_VERSION = "1"
 MSG_TO_SIGN = "This message attests that I control the given wallet"
 
+# Constant parts of the ClobAuth struct hash, only the address, timestamp and nonce change
+CLOB_AUTH_TYPEHASH = keccak(text=ClobAuth.encode_type())
+MSG_TO_SIGN_HASH = keccak(text=MSG_TO_SIGN)
+
 
+@lru_cache(maxsize=None)
 def get_clob_auth_domain(chain_id: int):
     return make_domain(name=CLOB_DOMAIN_NAME, version=CLOB_VERSION, chainId=chain_id)
 
 
-def sign_clob_auth_message(signer: Signer, timestamp: int, nonce: int) -> str:
-    clob_auth_msg = ClobAuth(
-        address=signer.address(),
-        timestamp=str(timestamp),
-        nonce=nonce,
-        message=MSG_TO_SIGN,
+@lru_cache(maxsize=None)
+def get_clob_auth_domain_separator(chain_id: int) -> bytes:
+    """
+    Returns the EIP712 domain separator of the ClobAuthDomain for the chain
+    """
+    return get_clob_auth_domain(chain_id).hash_struct()
+
+
+def get_clob_auth_hash(
+    chain_id: int, address: str, timestamp: int, nonce: int
+) -> bytes:
+    """
+    Returns the EIP712 hash of the ClobAuth message, equivalent to
+    keccak(ClobAuth(...).signable_bytes(get_clob_auth_domain(chain_id)))
+    """
+    struct_hash = keccak(
+        CLOB_AUTH_TYPEHASH
+        + bytes.fromhex(address[2:] if address.startswith("0x") else address).rjust(
+            32, b"\0"
+        )
+        + keccak(text=str(timestamp))
+        + nonce.to_bytes(32, "big")
+        + MSG_TO_SIGN_HASH
     )
-    chain_id = signer.get_chain_id()
-    auth_struct_hash = prepend_zx(
-        keccak(clob_auth_msg.signable_bytes(get_clob_auth_domain(chain_id))).hex()
+    return keccak(b"\x19\x01" + get_clob_auth_domain_separator(chain_id) + struct_hash)
+
+
+def get_clob_auth_message_hash(
+    signer: Signer, timestamp: int, nonce: int, address: str = None
+) -> str:
+    return prepend_zx(
+        get_clob_auth_hash(
+            signer.get_chain_id(),
+            address if address is not None else signer.address(),
+            timestamp,
+            nonce,
+        ).hex()
+    )
+
+
+def sign_clob_auth_message(signer: Signer, timestamp: int, nonce: int) -> str:
+    return prepend_zx(signer.sign(get_clob_auth_message_hash(signer, timestamp, nonce)))
+
+
+async def sign_clob_auth_message_async(
+    signer, timestamp: int, nonce: int, address: str = None
+) -> str:
+    """
+    Same as sign_clob_auth_message, for sync and async signers
+    The address defaults to the address of the signer
+    """
+    return prepend_zx(
+        await sign_async(
+            signer, get_clob_auth_message_hash(signer, timestamp, nonce, address)
+        )
     )
-    return prepend_zx(signer.sign(auth_struct_hash))
@@ -0,0 +1,73 @@
+from functools import lru_cache
+
+from eth_utils import keccak
+from poly_eip712_structs import make_domain
+from py_order_utils.model import Order
+from py_order_utils.utils import normalize_address
+
+EXCHANGE_DOMAIN_NAME = "Polymarket CTF Exchange"
+EXCHANGE_VERSION = "1"
+
+ORDER_TYPEHASH = keccak(text=Order.encode_type())
+
+# (field, is address) in the order of the Order struct
+ORDER_FIELDS = [
+    ("salt", False),
+    ("maker", True),
+    ("signer", True),
+    ("taker", True),
+    ("tokenId", False),
+    ("makerAmount", False),
+    ("takerAmount", False),
+    ("expiration", False),
+    ("nonce", False),
+    ("feeRateBps", False),
+    ("side", False),
+    ("signatureType", False),
+]
+
+ORDER_ENCODED_SIZE = 32 * (len(ORDER_FIELDS) + 1)
+
+
+@lru_cache(maxsize=None)
+def get_exchange_domain_separator(chain_id: int, exchange: str) -> bytes:
+    """
+    Returns the EIP712 domain separator of the exchange contract
+    """
+    return make_domain(
+        name=EXCHANGE_DOMAIN_NAME,
+        version=EXCHANGE_VERSION,
+        chainId=str(chain_id),
+        verifyingContract=normalize_address(exchange),
+    ).hash_struct()
+
+
+def get_order_struct_hash(order: Order) -> bytes:
+    """
+    Returns the EIP712 struct hash of the order, equivalent to order.hash_struct()
+    The type hash and the fields are packed into a single buffer hashed at once
+    """
+    values = order.values
+    buffer = bytearray(ORDER_ENCODED_SIZE)
+    buffer[0:32] = ORDER_TYPEHASH
+    offset = 32
+    for field, is_address in ORDER_FIELDS:
+        value = values[field]
+        if is_address:
+            buffer[offset + 12 : offset + 32] = bytes.fromhex(value[2:])
+        else:
+            buffer[offset : offset + 32] = int(value).to_bytes(32, "big")
+        offset += 32
+    return keccak(bytes(buffer))
+
+
+def get_order_hash(order: Order, chain_id: int, exchange: str) -> bytes:
+    """
+    Returns the EIP712 hash of the order to be signed, equivalent to
+    keccak(order.signable_bytes(domain)) with the exchange domain
+    """
+    return keccak(
+        b"\x19\x01"
+        + get_exchange_domain_separator(chain_id, exchange)
+        + get_order_struct_hash(order)
+    )
@@ -0,0 +1,203 @@
+import json
+import os
+from dataclasses import replace
+from typing import Optional
+
+from .clob_types import TradeParams
+from .constants import END_CURSOR
+
+TRADE_COLUMNS = (
+    "id",
+    "taker_order_id",
+    "market",
+    "asset_id",
+    "side",
+    "size",
+    "fee_rate_bps",
+    "price",
+    "status",
+    "match_time",
+    "last_update",
+    "outcome",
+    "bucket_index",
+    "owner",
+    "maker_address",
+    "transaction_hash",
+    "trader_side",
+    "maker_orders",
+)
+
+STATE_FILE = "_export_state.json"
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(
+            "the trades export requires pyarrow, install py_clob_client[parquet]"
+        )
+    return pyarrow
+
+
+def _to_column_value(value) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, separators=(",", ":"))
+    return str(value)
+
+
+class TradesExport:
+    """
+    Streams the trade history of a client into Parquet part files
+    The trades are paginated from the CLOB and written every chunk_size rows, so the
+    memory stays bounded by a chunk. Every column is a string, the nested maker_orders
+    are JSON encoded. The cursor of the last written page is persisted next to the
+    parts, an interrupted export resumes from it.
+    The CLOB pages the newest trades first, so once done a run exports the trades
+    matched since the latest exported match_time, in a new pass over the pages.
+    """
+
+    def __init__(
+        self,
+        client,
+        path: str,
+        params: TradeParams = None,
+        chunk_size: int = 10000,
+    ):
+        self.client = client
+        self.path = path
+        self.params = params
+        self.chunk_size = chunk_size
+        self.state = self.__load_state()
+
+    @property
+    def state_path(self) -> str:
+        return os.path.join(self.path, STATE_FILE)
+
+    @property
+    def done(self) -> bool:
+        return self.state["next_cursor"] == END_CURSOR
+
+    def __load_state(self) -> dict:
+        if os.path.exists(self.state_path):
+            with open(self.state_path) as f:
+                state = json.load(f)
+        else:
+            state = {"next_cursor": "MA==", "parts": [], "rows": 0}
+        # latest match_time exported and the ids of its trades, the after and the ids
+        # to skip of the current pass
+        state.setdefault("match_time", None)
+        state.setdefault("ids", [])
+        state.setdefault("after", None)
+        state.setdefault("skip_ids", [])
+        return state
+
+    def __save_state(self):
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def __write_part(self, rows: list[dict], next_cursor: str):
+        if rows:
+            self.__write_table(rows)
+        self.state["next_cursor"] = next_cursor
+        self.__save_state()
+
+    def __write_table(self, rows: list[dict]):
+        pa = _import_pyarrow()
+        table = pa.table(
+            {
+                column: pa.array(
+                    [_to_column_value(row.get(column)) for row in rows],
+                    type=pa.string(),
+                )
+                for column in TRADE_COLUMNS
+            }
+        )
+        name = "part-{:05d}.parquet".format(len(self.state["parts"]))
+        pa.parquet.write_table(table, os.path.join(self.path, name))
+
+        self.state["parts"].append(name)
+        self.state["rows"] += len(rows)
+        for row in rows:
+            if row.get("match_time") is None:
+                continue
+            match_time = int(row["match_time"])
+            if (
+                self.state["match_time"] is None
+                or match_time > self.state["match_time"]
+            ):
+                self.state["match_time"] = match_time
+                self.state["ids"] = [row["id"]]
+            elif match_time == self.state["match_time"]:
+                self.state["ids"].append(row["id"])
+
+    def __start_pass(self) -> bool:
+        if self.state["match_time"] is None:
+            if self.state["rows"]:
+                # no match_time to resume from, the trades would be exported again
+                return False
+            self.state["after"] = None
+        else:
+            # the second of the mark is fetched again, its trades are skipped
+            self.state["after"] = self.state["match_time"] - 1
+        self.state["skip_ids"] = list(self.state["ids"])
+        self.state["next_cursor"] = "MA=="
+        self.__save_state()
+        return True
+
+    def run(self) -> int:
+        """
+        Exports the trades not exported yet, returns the number of rows written
+        """
+        _import_pyarrow()
+        os.makedirs(self.path, exist_ok=True)
+        if self.done and not self.__start_pass():
+            return 0
+
+        params = self.params or TradeParams()
+        if self.state["after"] is not None:
+            params = replace(params, after=max(params.after or 0, self.state["after"]))
+        skip_ids = set(self.state["skip_ids"])
+        after = self.state["after"]
+
+        written = 0
+        rows = []
+        next_cursor = self.state["next_cursor"]
+        for trades, next_cursor in self.client.iter_trades_pages(
+            params, self.state["next_cursor"]
+        ):
+            rows += [
+                trade
+                for trade in trades
+                if trade["id"] not in skip_ids
+                and (after is None or int(trade["match_time"]) > after)
+            ]
+            if len(rows) >= self.chunk_size:
+                self.__write_part(rows, next_cursor)
+                written += len(rows)
+                rows = []
+
+        if rows or next_cursor != self.state["next_cursor"]:
+            self.__write_part(rows, next_cursor)
+            written += len(rows)
+
+        return written
+
+    def files(self) -> list[str]:
+        return [os.path.join(self.path, part) for part in self.state["parts"]]
+
+
+def export_trades(
+    client, path: str, params: TradeParams = None, chunk_size: int = 10000
+) -> int:
+    """
+    Exports the trade history of the client to Parquet part files in the path
+    directory, resuming a previous export of the same path
+    Returns the number of rows written
+    """
+    return TradesExport(client, path, params, chunk_size).run()
@@ -0,0 +1,141 @@
+import json
+import os
+from threading import Lock
+from typing import Iterator
+
+from .clob_types import TradeParams
+
+STATE_FILE = "state.json"
+TRADES_FILE = "trades.jsonl"
+
+
+def _sync_key(params: TradeParams) -> str:
+    key = "{}|{}|{}".format(
+        params.market or "", params.asset_id or "", (params.maker_address or "").lower()
+    )
+    # the sync of a single trade doesn't move the mark of the others
+    return key if params.id is None else "{}|{}".format(key, params.id)
+
+
+class TradeSync:
+    """
+    Incremental sync of the trade history into a local store
+    A high-water mark (latest match_time and the ids of the trades matched at that
+    second) is persisted per (market, asset, maker). Every sync fetches only the trades
+    after it, drops the ones already stored and appends the new ones to trades.jsonl,
+    so a recurring sync costs O(new trades).
+    """
+
+    def __init__(self, client, path: str):
+        self.client = client
+        self.path = path
+        self.__lock = Lock()
+        os.makedirs(path, exist_ok=True)
+        self.state: dict[str, dict] = self.__load_state()
+
+    @property
+    def state_path(self) -> str:
+        return os.path.join(self.path, STATE_FILE)
+
+    @property
+    def trades_path(self) -> str:
+        return os.path.join(self.path, TRADES_FILE)
+
+    def __load_state(self) -> dict:
+        if os.path.exists(self.state_path):
+            with open(self.state_path) as f:
+                return json.load(f)
+        return {}
+
+    def __save_state(self):
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def high_water_mark(self, params: TradeParams = None) -> dict:
+        """
+        Last synced match_time and trade ids for the params, None before the first sync
+        """
+        return self.state.get(_sync_key(params or TradeParams()))
+
+    def sync(self, params: TradeParams = None) -> list[dict]:
+        """
+        Fetches and stores the trades matched since the last sync of the same
+        market, asset and maker, returns them oldest first
+        The after, before and id of the params narrow the query: the trades fetched
+        are after the latest of after and the mark. The mark moves to the latest
+        trade stored, the trades skipped by after are not synced later
+        """
+        params = params or TradeParams()
+        key = _sync_key(params)
+
+        with self.__lock:
+            mark = self.state.get(key)
+            query = TradeParams(
+                id=params.id,
+                market=params.market,
+                asset_id=params.asset_id,
+                maker_address=params.maker_address,
+                before=params.before,
+                after=params.after,
+            )
+            if mark is not None:
+                # the second of the mark is fetched again, its trades are deduplicated
+                query.after = max(query.after or 0, mark["match_time"] - 1)
+
+            seen = set(mark["ids"]) if mark is not None else set()
+            new_trades = []
+            for trades, _ in self.client.iter_trades_pages(query):
+                for trade in trades:
+                    match_time = int(trade["match_time"])
+                    if mark is not None and match_time < mark["match_time"]:
+                        continue
+                    if trade["id"] in seen:
+                        continue
+                    seen.add(trade["id"])
+                    new_trades.append(trade)
+
+            if not new_trades:
+                return []
+
+            new_trades.sort(key=lambda t: int(t["match_time"]))
+            with open(self.trades_path, "a") as f:
+                for trade in new_trades:
+                    f.write(json.dumps(trade, separators=(",", ":")) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+            last_match_time = int(new_trades[-1]["match_time"])
+            ids = [
+                t["id"] for t in new_trades if int(t["match_time"]) == last_match_time
+            ]
+            if mark is not None and mark["match_time"] == last_match_time:
+                ids = mark["ids"] + ids
+            self.state[key] = {
+                "match_time": last_match_time,
+                "last_id": new_trades[-1]["id"],
+                "ids": ids,
+            }
+            self.__save_state()
+
+        return new_trades
+
+    def trades(self) -> Iterator[dict]:
+        """
+        Streams the stored trades
+        A trade appended by a sync interrupted before saving its high-water mark is
+        stored twice, the duplicates are skipped
+        """
+        if not os.path.exists(self.trades_path):
+            return
+        seen = set()
+        with open(self.trades_path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                trade = json.loads(line)
+                if trade["id"] in seen:
+                    continue
+                seen.add(trade["id"])
+                yield trade
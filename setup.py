@@ -19,9 +19,13 @@ setuptools.setup(
         "eth-utils>=4.1.1",
         "poly_eip712_structs>=0.0.1",
         "py-order-utils>=0.3.2",
+        "pycryptodome>=3.6.6",
         "python-dotenv",
         "requests",
     ],
+    extras_require={
+        "parquet": ["pyarrow"],
+    },
     project_urls={
         "Bug Tracker": "https://github.com/Polymarket/py-clob-client/issues",
     },
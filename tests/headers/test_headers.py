@@ -1,4 +1,5 @@
 from datetime import datetime
+import asyncio
 from unittest import TestCase
 from py_clob_client.clob_types import ApiCreds, RequestArgs
 from py_clob_client.constants import AMOY
@@ -10,6 +11,7 @@ from py_clob_client.headers.headers import (
     POLY_SIGNATURE,
     POLY_TIMESTAMP,
     create_level_1_headers,
+    create_level_1_headers_async,
     create_level_2_headers,
 )
 from py_clob_client.signer import Signer
@@ -27,6 +29,13 @@ creds = ApiCreds(
 
 
 class TestHeaders(TestCase):
+    def test_create_level_1_headers_async(self):
+        # a sync signer gives the same headers through the async path
+        self.assertEqual(
+            asyncio.run(create_level_1_headers_async(signer, 2, timestamp=1700000000)),
+            create_level_1_headers(signer, 2, timestamp=1700000000),
+        )
+
     def test_create_level_1_headers(self):
         # no nonce
         l1_headers = create_level_1_headers(signer)
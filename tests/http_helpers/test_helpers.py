@@ -62,6 +62,16 @@ class TestHelpers(TestCase):
             "http://tracker?market=10000&asset_id=100&id=aa-bb&next_cursor=MA==",
         )
 
+    def test_add_query_params_next_cursor_only(self):
+        self.assertEqual(
+            add_query_trade_params("http://tracker", next_cursor="Mg=="),
+            "http://tracker?next_cursor=Mg==",
+        )
+        self.assertEqual(
+            add_query_open_orders_params("http://tracker", next_cursor="Mg=="),
+            "http://tracker?next_cursor=Mg==",
+        )
+
     def test_drop_notifications_query_params(self):
         url = drop_notifications_query_params(
             "http://tracker",
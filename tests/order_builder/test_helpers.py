@@ -1,9 +1,32 @@
 from unittest import TestCase
 
-from py_clob_client.order_builder.helpers import decimal_places
+from py_clob_client.clob_types import OrderBookSummary, OrderSummary, OrderType
+from py_clob_client.order_builder.helpers import (
+    calculate_book_market_price,
+    decimal_places,
+)
 
 
 class TestHelpers(TestCase):
     def test_decimal_places(self):
         self.assertEqual(decimal_places(949.9970999999999), 13)
         self.assertEqual(decimal_places(949), 0)
+
+    def test_calculate_book_market_price(self):
+        book = OrderBookSummary(
+            bids=[OrderSummary(price="0.3", size="100"), OrderSummary("0.4", "100")],
+            asks=[OrderSummary(price="0.6", size="100"), OrderSummary("0.5", "10")],
+        )
+        self.assertEqual(
+            calculate_book_market_price(book, "BUY", 20, OrderType.FOK), 0.6
+        )
+        self.assertEqual(
+            calculate_book_market_price(book, "SELL", 150, OrderType.FOK), 0.3
+        )
+
+        with self.assertRaises(Exception):
+            calculate_book_market_price(None, "BUY", 20, OrderType.FOK)
+        with self.assertRaises(Exception):
+            calculate_book_market_price(
+                OrderBookSummary(asks=[]), "BUY", 20, OrderType.FOK
+            )
@@ -1,8 +1,15 @@
 from unittest import TestCase
-from py_clob_client.constants import AMOY
+from eth_utils import keccak
+from py_clob_client.constants import AMOY, POLYGON
 
 from py_clob_client.signer import Signer
-from py_clob_client.signing.eip712 import sign_clob_auth_message
+from py_clob_client.signing.eip712 import (
+    MSG_TO_SIGN,
+    get_clob_auth_domain,
+    get_clob_auth_hash,
+    sign_clob_auth_message,
+)
+from py_clob_client.signing.model import ClobAuth
 
 # publicly known private key
 private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
@@ -18,3 +25,20 @@ class TestEIP712(TestCase):
             signature,
             "0xf62319a987514da40e57e2f4d7529f7bac38f0355bd88bb5adbb3768d80de6c1682518e0af677d5260366425f4361e7b70c25ae232aff0ab2331e2b164a1aedc1b",
         )
+
+    def test_get_clob_auth_hash(self):
+        for chain, timestamp, nonce in [
+            (AMOY, 10000000, 23),
+            (AMOY, 1712345678, 0),
+            (POLYGON, 1712345678, 2**64),
+        ]:
+            clob_auth_msg = ClobAuth(
+                address=signer.address(),
+                timestamp=str(timestamp),
+                nonce=nonce,
+                message=MSG_TO_SIGN,
+            )
+            self.assertEqual(
+                get_clob_auth_hash(chain, signer.address(), timestamp, nonce),
+                keccak(clob_auth_msg.signable_bytes(get_clob_auth_domain(chain))),
+            )
@@ -0,0 +1,67 @@
+from unittest import TestCase
+from eth_utils import keccak
+from py_order_utils.builders import OrderBuilder as UtilsOrderBuilder
+from py_order_utils.model import OrderData, BUY, SELL, POLY_GNOSIS_SAFE
+from py_order_utils.signer import Signer as UtilsSigner
+from py_order_utils.utils import prepend_zx
+
+from py_clob_client.config import get_contract_config
+from py_clob_client.constants import AMOY
+from py_clob_client.order_builder.builder import OrderBuilder
+from py_clob_client.signer import Signer
+from py_clob_client.signing.order import get_order_hash, get_order_struct_hash
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+chain_id = AMOY
+signer = Signer(private_key=private_key, chain_id=chain_id)
+
+
+def order_data(side: int, signature_type: int = 0) -> OrderData:
+    return OrderData(
+        maker="0x70997970C51812dc3A010C7d01b50e0d17dc79C8",
+        taker="0x0000000000000000000000000000000000000000",
+        tokenId="71321045679252212594626385532706912750332728571942532289631379312455583992563",
+        makerAmount="50000000",
+        takerAmount="100000000",
+        side=side,
+        feeRateBps="100",
+        nonce="7",
+        signer=signer.address(),
+        expiration="50000",
+        signatureType=signature_type,
+    )
+
+
+class TestOrderHash(TestCase):
+    def test_get_order_hash(self):
+        for neg_risk in [False, True]:
+            exchange = get_contract_config(chain_id, neg_risk).exchange
+            utils_builder = UtilsOrderBuilder(
+                exchange, chain_id, UtilsSigner(key=private_key)
+            )
+            for data in [order_data(BUY), order_data(SELL, POLY_GNOSIS_SAFE)]:
+                order = utils_builder.build_order(data)
+                self.assertEqual(get_order_struct_hash(order), order.hash_struct())
+                self.assertEqual(
+                    prepend_zx(get_order_hash(order, chain_id, exchange).hex()),
+                    utils_builder._create_struct_hash(order),
+                )
+                self.assertEqual(
+                    get_order_hash(order, chain_id, exchange),
+                    keccak(order.signable_bytes(utils_builder.domain_separator)),
+                )
+
+    def test_build_signed_order(self):
+        builder = OrderBuilder(signer)
+        signed_order = builder.build_signed_order(order_data(BUY), neg_risk=False)
+
+        utils_builder = UtilsOrderBuilder(
+            get_contract_config(chain_id).exchange,
+            chain_id,
+            UtilsSigner(key=private_key),
+        )
+        self.assertEqual(
+            signed_order.signature,
+            utils_builder.build_order_signature(signed_order.order),
+        )
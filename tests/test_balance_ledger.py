@@ -0,0 +1,178 @@
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from py_clob_client.balance_ledger import BalanceLedger
+from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import OrderType
+from py_clob_client.constants import AMOY
+from py_clob_client.instrumentation import HistogramCollector, set_instrumentation
+from tests.test_order_tracker import FakeOrder, creds, post_response, private_key
+
+
+class FakeBalances:
+    def __init__(self, balances: dict):
+        self.balances = balances
+        self.calls = 0
+
+    def get_balance_allowance(self, params):
+        self.calls += 1
+        return {"balance": str(int(self.balances[params.token_id] * 10**6))}
+
+
+class TestBalanceLedger(TestCase):
+    def test_reserve_fill_cancel(self):
+        ledger = BalanceLedger(FakeBalances({None: 100, "1": 50}))
+        ledger.sync(["1"])
+        self.assertEqual((ledger.collateral, ledger.position("1")), (100, 50))
+
+        ledger.on_order_posted(FakeOrder("1", "BUY", 0.5, 100), post_response("a"))
+        ledger.on_order_posted(FakeOrder("1", "SELL", 0.75, 20), post_response("b"))
+        self.assertAlmostEqual(ledger.available_collateral(), 50)
+        self.assertAlmostEqual(ledger.available_position("1"), 30)
+        self.assertTrue(ledger.check_order("1", "BUY", 0.5, 100))
+        self.assertFalse(ledger.check_order("1", "BUY", 0.5, 101))
+        self.assertFalse(ledger.check_order("1", "SELL", 0.75, 31))
+
+        trade = {
+            "id": "t1",
+            "status": "MATCHED",
+            "taker_order_id": "x",
+            "maker_orders": [
+                {"order_id": "a", "price": "0.5", "matched_amount": "40"},
+                {"order_id": "b", "price": "0.75", "matched_amount": "20"},
+            ],
+        }
+        ledger.on_trade(trade)
+        ledger.on_trade(dict(trade, status="CONFIRMED"))
+        # 100 - 40 * 0.5 + 20 * 0.75 = 95, with 60 * 0.5 still reserved
+        self.assertAlmostEqual(ledger.collateral, 95)
+        self.assertAlmostEqual(ledger.available_collateral(), 65)
+        self.assertAlmostEqual(ledger.position("1"), 70)
+        self.assertAlmostEqual(ledger.available_position("1"), 70)
+
+        ledger.on_cancel({"canceled": ["a"], "not_canceled": {}})
+        self.assertAlmostEqual(ledger.available_collateral(), 95)
+
+    def test_matched_on_post(self):
+        ledger = BalanceLedger(FakeBalances({None: 100}))
+        ledger.sync()
+        response = dict(post_response("a", "matched", "10"), makingAmount="5")
+        ledger.on_order_posted(FakeOrder("1", "BUY", 0.5, 10), response, OrderType.FOK)
+
+        self.assertAlmostEqual(ledger.collateral, 95)
+        self.assertEqual(ledger.position("1"), 10)
+        self.assertAlmostEqual(ledger.available_collateral(), 95)
+
+    def test_sync_discrepancy(self):
+        events = []
+
+        class Collector(HistogramCollector):
+            def event(self, name, **fields):
+                events.append((name, fields))
+
+        balances = FakeBalances({None: 100, "1": 10})
+        ledger = BalanceLedger(balances)
+        set_instrumentation(Collector())
+        try:
+            ledger.sync(["1"])
+            self.assertEqual(ledger.sync(), {})
+            balances.balances["1"] = 4
+            self.assertEqual(ledger.sync(), {"1": -6})
+        finally:
+            set_instrumentation(None)
+
+        self.assertEqual(balances.calls, 6)
+        self.assertEqual(ledger.position("1"), 4)
+        self.assertEqual(
+            events[-1], ("balance_discrepancy", {"asset": "1", "difference": -6})
+        )
+
+    def test_fill_during_sync(self):
+        balances = FakeBalances({None: 100, "1": 0})
+        ledger = BalanceLedger(balances)
+        ledger.sync(["1"])
+        ledger.on_order_posted(FakeOrder("1", "BUY", 0.5, 100), post_response("a"))
+
+        trade = {
+            "id": "t1",
+            "status": "MATCHED",
+            "taker_order_id": "x",
+            "maker_orders": [{"order_id": "a", "price": "0.5", "matched_amount": "40"}],
+        }
+        fetch = balances.get_balance_allowance
+
+        def get_balance_allowance(params):
+            # matched after the collateral is fetched, before the position is
+            if balances.calls == 3:
+                ledger.on_trade(trade)
+                balances.balances["1"] = 40
+            return fetch(params)
+
+        balances.get_balance_allowance = get_balance_allowance
+        self.assertEqual(ledger.sync(), {})
+        self.assertAlmostEqual(ledger.collateral, 80)
+        self.assertAlmostEqual(ledger.position("1"), 40)
+        self.assertAlmostEqual(ledger.available_collateral(), 50)
+
+    def test_fill_before_sync_fetch(self):
+        balances = FakeBalances({None: 100, "1": 0})
+        ledger = BalanceLedger(balances)
+        ledger.sync(["1"])
+        ledger.on_order_posted(FakeOrder("1", "BUY", 0.5, 100), post_response("a"))
+        matched_at = time.time()
+
+        trade = {
+            "id": "t1",
+            "status": "MATCHED",
+            "match_time": str(int(matched_at) - 1),
+            "taker_order_id": "x",
+            "maker_orders": [{"order_id": "a", "price": "0.5", "matched_amount": "40"}],
+        }
+        fetch = balances.get_balance_allowance
+
+        def get_balance_allowance(params):
+            # received during the sync, matched before: the balances include it
+            if balances.calls == 3:
+                ledger.on_trade(trade)
+            return fetch(params)
+
+        balances.balances = {None: 80, "1": 40}
+        balances.get_balance_allowance = get_balance_allowance
+        self.assertEqual(ledger.sync(), {})
+        self.assertAlmostEqual(ledger.collateral, 80)
+        self.assertAlmostEqual(ledger.position("1"), 40)
+        self.assertAlmostEqual(ledger.available_collateral(), 50)
+
+    def test_client(self):
+        client = ClobClient("http://clob", AMOY, private_key, creds)
+        with patch(
+            "py_clob_client.client.get", return_value={"balance": "100000000"}
+        ) as mock_get:
+            ledger = client.enable_balance_tracking()
+        self.assertIn("asset_type=COLLATERAL", mock_get.call_args.args[0])
+        self.assertEqual(ledger.collateral, 100)
+
+        with patch("py_clob_client.client.post", return_value=post_response("a")):
+            client.post_order(FakeOrder("1", "BUY", 0.5, 100))
+        self.assertAlmostEqual(ledger.available_collateral(), 50)
+
+        with patch(
+            "py_clob_client.client.delete",
+            return_value={"canceled": ["a"], "not_canceled": {}},
+        ):
+            client.cancel("a")
+        self.assertAlmostEqual(ledger.available_collateral(), 100)
+
+    def test_client_sync_once(self):
+        client = ClobClient("http://clob", AMOY, private_key, creds)
+        with patch(
+            "py_clob_client.client.get", return_value={"balance": "100000000"}
+        ) as mock_get:
+            ledger = client.enable_balance_tracking(sync_interval=3600, token_ids=["1"])
+        try:
+            # the collateral and the token, once
+            self.assertEqual(mock_get.call_count, 2)
+            self.assertEqual(ledger.position("1"), 100)
+        finally:
+            client.disable_balance_tracking()
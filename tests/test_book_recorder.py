@@ -0,0 +1,135 @@
+import os
+import tempfile
+import time
+from unittest import TestCase
+
+from py_clob_client.book_recorder import (
+    BookRecorder,
+    BookReplayer,
+    read_book_records,
+)
+from py_clob_client.clob_types import (
+    BookParams,
+    OrderBookSummary,
+    OrderSummary,
+    OrderType,
+)
+
+
+def make_book(token_id: str, best_ask: str) -> OrderBookSummary:
+    return OrderBookSummary(
+        market="0x1",
+        asset_id=token_id,
+        timestamp="1700000000000",
+        bids=[
+            OrderSummary(price="0.3", size="100"),
+            OrderSummary(price="0.4", size="100"),
+        ],
+        asks=[
+            OrderSummary(price="0.6", size="100"),
+            OrderSummary(price=best_ask, size="10"),
+        ],
+        hash="",
+    )
+
+
+class FakeClient:
+    def get_order_book(self, token_id):
+        return make_book(token_id, "0.5")
+
+    def get_order_books(self, params):
+        return [make_book(p.token_id, "0.5") for p in params]
+
+
+class TestBookRecorder(TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "books.bin")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_record_and_read(self):
+        with BookRecorder(self.path) as recorder:
+            recorder.record_order_book(FakeClient(), "1")
+            recorder.record_order_books(
+                FakeClient(), [BookParams(token_id="2"), BookParams(token_id="3")]
+            )
+            recorder.write({"asset_id": "1", "price": "0.5"}, kind="price_change")
+            self.assertEqual(recorder.count, 4)
+
+        # appending keeps the existing records
+        with BookRecorder(self.path) as recorder:
+            recorder.write(make_book("1", "0.55"), timestamp=1.0)
+
+        records = list(read_book_records(self.path))
+        self.assertEqual(
+            [kind for _, kind, _ in records],
+            ["book", "book", "book", "price_change", "book"],
+        )
+        self.assertEqual(records[1][0], records[2][0])
+        self.assertEqual(records[3][2], {"asset_id": "1", "price": "0.5"})
+        self.assertEqual(records[4][0], 1.0)
+        self.assertEqual(records[4][2]["asks"][-1], {"price": "0.55", "size": "10"})
+
+    def test_truncated_record(self):
+        with BookRecorder(self.path) as recorder:
+            recorder.write(make_book("1", "0.5"))
+            recorder.write(make_book("1", "0.55"))
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 3)
+
+        self.assertEqual(len(list(read_book_records(self.path))), 1)
+
+    def test_not_a_recording(self):
+        with open(self.path, "wb") as f:
+            f.write(b"{}")
+        with self.assertRaises(ValueError):
+            list(read_book_records(self.path))
+
+
+class TestBookReplayer(TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "books.bin")
+        with BookRecorder(self.path) as recorder:
+            recorder.write(make_book("1", "0.5"), timestamp=100.0)
+            recorder.write(make_book("2", "0.45"), timestamp=100.1)
+            recorder.write(make_book("1", "0.55"), timestamp=100.2)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_replay(self):
+        replayer = BookReplayer(self.path)
+        prices = []
+        for timestamp, kind, book in replayer:
+            self.assertEqual(kind, "book")
+            self.assertIsInstance(book, OrderBookSummary)
+            if book.asset_id == "1":
+                prices.append(
+                    replayer.calculate_market_price("1", "BUY", 5, OrderType.FOK)
+                )
+        self.assertEqual(prices, [0.5, 0.55])
+        self.assertEqual(replayer.timestamp, 100.2)
+
+        books = replayer.get_order_books(
+            [BookParams(token_id="1"), BookParams(token_id="2")]
+        )
+        self.assertEqual([b.asks[-1].price for b in books], ["0.55", "0.45"])
+        self.assertEqual(
+            replayer.calculate_market_price("2", "SELL", 150, OrderType.FOK), 0.3
+        )
+        with self.assertRaises(Exception):
+            replayer.calculate_market_price("2", "SELL", 300, OrderType.FOK)
+        with self.assertRaises(Exception):
+            replayer.calculate_market_price("3", "BUY", 1, OrderType.FOK)
+
+    def test_replay_speed(self):
+        start = time.monotonic()
+        self.assertEqual(BookReplayer(self.path, speed=2).run(), 3)
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+        start = time.monotonic()
+        BookReplayer(self.path).run()
+        self.assertLess(time.monotonic() - start, 0.09)
@@ -0,0 +1,199 @@
+import subprocess
+import sys
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from eth_keys import keys
+from py_order_utils.model import BUY
+
+from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import (
+    ApiCreds,
+    CreateOrderOptions,
+    OrderArgs,
+    PartialCreateOrderOptions,
+    PostOrdersArgs,
+)
+from py_clob_client.config import get_contract_config
+from py_clob_client.constants import AMOY
+from py_clob_client.exceptions import PolyApiException
+from py_clob_client.signing.order import get_order_hash
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+chain_id = AMOY
+
+creds = ApiCreds(
+    api_key="000000000-0000-0000-0000-000000000000",
+    api_passphrase="aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+    api_secret="AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=",
+)
+
+
+class FakeOrder:
+    def __init__(self, salt: int):
+        self.salt = salt
+
+    def dict(self):
+        return {"salt": self.salt}
+
+
+def echo_post(endpoint, headers=None, data=None):
+    return [{"success": True, "orderID": str(o["order"]["salt"])} for o in data]
+
+
+class TestClobClient(TestCase):
+    def setUp(self):
+        self.client = ClobClient(
+            "http://clob/", chain_id=chain_id, key=private_key, creds=creds
+        )
+
+    def test_level_0_lazy_imports(self):
+        # a fresh interpreter, the signing stack is loaded by the tests
+        loaded = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys\n"
+                "from py_clob_client.client import ClobClient\n"
+                "ClobClient('http://localhost').get_address()\n"
+                "print([m for m in ['eth_account', 'py_order_utils'] if m in sys.modules])",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        self.assertEqual(loaded, "[]")
+
+        client = ClobClient("http://localhost", chain_id=chain_id, key=private_key)
+        self.assertEqual(
+            client.get_address(), "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+        )
+
+    def test_post_orders_batched(self):
+        args = [PostOrdersArgs(order=FakeOrder(i)) for i in range(37)]
+
+        with patch("py_clob_client.client.post", side_effect=echo_post) as mock_post:
+            results = self.client.post_orders_batched(args, batch_size=10)
+
+        self.assertEqual(mock_post.call_count, 4)
+        for call in mock_post.call_args_list:
+            self.assertEqual(call.args[0], "http://clob/orders")
+            self.assertLessEqual(len(call.kwargs["data"]), 10)
+            self.assertIn("POLY_SIGNATURE", call.kwargs["headers"])
+        self.assertEqual([r["orderID"] for r in results], [str(i) for i in range(37)])
+
+        # empty
+        self.assertEqual(self.client.post_orders_batched([]), [])
+
+        # invalid batch size
+        with self.assertRaises(ValueError):
+            self.client.post_orders_batched(args, batch_size=100)
+
+    def test_post_orders_batched_failed_batch(self):
+        args = [PostOrdersArgs(order=FakeOrder(i)) for i in range(6)]
+
+        def post(endpoint, headers=None, data=None):
+            if data[0]["order"]["salt"] == 3:
+                raise PolyApiException(error_msg="rejected")
+            return echo_post(endpoint, headers, data)
+
+        with patch("py_clob_client.client.post", side_effect=post):
+            results = self.client.post_orders_batched(args, batch_size=3)
+
+        self.assertEqual([r["success"] for r in results], [True] * 3 + [False] * 3)
+        self.assertEqual(results[4]["errorMsg"], "rejected")
+
+    def test_post_orders_batched_bad_response(self):
+        args = [PostOrdersArgs(order=FakeOrder(i)) for i in range(9)]
+
+        def post(endpoint, headers=None, data=None):
+            salt = data[0]["order"]["salt"]
+            if salt == 3:
+                return {"error": "bad shape"}
+            if salt == 6:
+                raise ConnectionError("reset")
+            return echo_post(endpoint, headers, data)
+
+        with patch("py_clob_client.client.post", side_effect=post):
+            results = self.client.post_orders_batched(args, batch_size=3)
+
+        self.assertEqual([r["success"] for r in results], [True] * 3 + [False] * 6)
+        self.assertIn("unexpected", results[3]["errorMsg"])
+        self.assertEqual(results[8]["errorMsg"], "reset")
+
+    def test_clock_sync(self):
+        server_time = int(time.time()) + 3600
+
+        with patch("py_clob_client.market_data.get", return_value=server_time):
+            self.client.enable_clock_sync(interval=3600)
+        try:
+            with patch("py_clob_client.client.get") as mock_get:
+                self.client.get_api_keys()
+            timestamp = int(mock_get.call_args.kwargs["headers"]["POLY_TIMESTAMP"])
+            self.assertLessEqual(abs(timestamp - server_time), 1)
+        finally:
+            self.client.disable_clock_sync()
+
+        with patch("py_clob_client.client.get") as mock_get:
+            self.client.get_api_keys()
+        timestamp = int(mock_get.call_args.kwargs["headers"]["POLY_TIMESTAMP"])
+        self.assertLessEqual(abs(timestamp - int(time.time())), 1)
+
+    def test_iter_trades_pages(self):
+        pages = {
+            "MA==": {"data": [{"id": "1"}, {"id": "2"}], "next_cursor": "Mg=="},
+            "Mg==": {"data": [{"id": "3"}], "next_cursor": "LTE="},
+        }
+
+        def get(url, headers=None):
+            return pages[url.split("next_cursor=")[1]]
+
+        with patch("py_clob_client.client.get", side_effect=get):
+            self.assertEqual(
+                list(self.client.iter_trades_pages()),
+                [([{"id": "1"}, {"id": "2"}], "Mg=="), ([{"id": "3"}], "LTE=")],
+            )
+            self.assertEqual(
+                list(self.client.iter_trades_pages(next_cursor="Mg==")),
+                [([{"id": "3"}], "LTE=")],
+            )
+            self.assertEqual(
+                [t["id"] for t in self.client.get_trades()], ["1", "2", "3"]
+            )
+
+    def test_resolve_order_options_neg_risk(self):
+        with patch(
+            "py_clob_client.market_data.get",
+            return_value={"minimum_tick_size": 0.01, "neg_risk": True},
+        ) as mock_get:
+            options = self.client.resolve_order_options(
+                "1", 0.5, PartialCreateOrderOptions(neg_risk=False)
+            )
+        self.assertEqual(options, CreateOrderOptions(tick_size="0.01", neg_risk=False))
+        # only the tick size is fetched, an explicit neg_risk=False is kept
+        self.assertEqual(mock_get.call_count, 1)
+
+    def test_create_order_explicit_neg_risk(self):
+        # the market is neg risk, the explicit neg_risk=False of the caller wins
+        with patch(
+            "py_clob_client.market_data.get",
+            return_value={"minimum_tick_size": 0.01, "neg_risk": True},
+        ) as mock_get:
+            order = self.client.create_order(
+                OrderArgs(token_id="1", price=0.5, size=10, side=BUY),
+                PartialCreateOrderOptions(neg_risk=False),
+            )
+        self.assertEqual(mock_get.call_count, 1)
+
+        order_hash = get_order_hash(
+            order.order, chain_id, get_contract_config(chain_id, False).exchange
+        )
+        signature = bytes.fromhex(order.signature[2:])
+        signer = (
+            keys.Signature(signature[:64] + bytes([signature[64] - 27]))
+            .recover_public_key_from_msg_hash(order_hash)
+            .to_checksum_address()
+        )
+        self.assertEqual(signer, self.client.get_address())
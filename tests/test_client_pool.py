@@ -0,0 +1,86 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from py_clob_client.client_pool import ClientPool
+from py_clob_client.clob_types import ApiCreds, OrderArgs
+from py_clob_client.constants import AMOY
+from py_clob_client.endpoints import GET_NEG_RISK, GET_TICK_SIZE
+from py_order_utils.model import BUY
+
+# publicly known private keys
+private_keys = [
+    "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80",
+    "0x59c6995e998f97a5a0044966f0945389dc9e86dae88c7a8412f4603b6b78690d",
+]
+
+creds = ApiCreds(
+    api_key="000000000-0000-0000-0000-000000000000",
+    api_passphrase="aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+    api_secret="AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=",
+)
+
+
+def fake_get(endpoint, headers=None, data=None):
+    if GET_TICK_SIZE in endpoint:
+        return {"minimum_tick_size": 0.01}
+    if GET_NEG_RISK in endpoint:
+        return {"neg_risk": False}
+    raise Exception("unexpected endpoint {}".format(endpoint))
+
+
+class TestClientPool(TestCase):
+    def test_accounts(self):
+        pool = ClientPool("http://clob", AMOY)
+        a = pool.add_account("a", private_keys[0], creds)
+        b = pool.add_account("b", private_keys[1], creds)
+
+        self.assertEqual(pool.accounts(), ["a", "b"])
+        self.assertEqual(len(pool), 2)
+        self.assertIs(pool["a"], a)
+        self.assertNotEqual(a.get_address(), b.get_address())
+
+        with self.assertRaises(ValueError):
+            pool.add_account("a", private_keys[1])
+
+        pool.remove_account("b")
+        self.assertEqual(pool.accounts(), ["a"])
+
+    def test_shared_metadata_cache(self):
+        pool = ClientPool("http://clob", AMOY)
+        a = pool.add_account("a", private_keys[0], creds)
+        b = pool.add_account("b", private_keys[1], creds)
+
+        with patch("py_clob_client.market_data.get", side_effect=fake_get) as mock_get:
+            self.assertEqual(a.get_tick_size("1"), "0.01")
+            self.assertEqual(b.get_tick_size("1"), "0.01")
+            self.assertEqual(pool.market_data.get_tick_size("1"), "0.01")
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(pool.metadata.tick_sizes, {"1": "0.01"})
+
+    def test_submit_order(self):
+        posted = []
+
+        def fake_post(endpoint, headers=None, data=None):
+            posted.append((headers["POLY_ADDRESS"], data["order"]["signer"]))
+            return {"success": True}
+
+        with patch("py_clob_client.market_data.get", side_effect=fake_get), patch(
+            "py_clob_client.client.post", side_effect=fake_post
+        ):
+            with ClientPool("http://clob", AMOY) as pool:
+                pool.add_account("a", private_keys[0], creds)
+                pool.add_account("b", private_keys[1], creds)
+                futures = [
+                    pool.submit_order(
+                        name, OrderArgs(token_id="1", price=0.5, size=10, side=BUY)
+                    )
+                    for name in ["a", "b", "a"]
+                ]
+
+        for future in futures:
+            self.assertTrue(future.result()["success"])
+        addresses = [pool[name].get_address() for name in ["a", "b"]]
+        self.assertCountEqual(
+            posted, [(addresses[0], addresses[0])] * 2 + [(addresses[1], addresses[1])]
+        )
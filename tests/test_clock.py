@@ -0,0 +1,39 @@
+import time
+from unittest import TestCase
+
+from py_clob_client.clock import ServerClock
+
+
+class TestServerClock(TestCase):
+    def test_sync(self):
+        calls = []
+
+        def get_server_time():
+            calls.append(1)
+            return int(time.time()) + 100
+
+        clock = ServerClock(get_server_time, samples=3)
+
+        # local time until synced
+        self.assertLessEqual(abs(clock.timestamp() - int(time.time())), 1)
+
+        clock.sync()
+        self.assertEqual(len(calls), 3)
+        self.assertIsNotNone(clock.rtt)
+        self.assertLessEqual(abs(clock.offset - 100), 1)
+        self.assertLessEqual(abs(clock.timestamp() - (int(time.time()) + 100)), 1)
+
+    def test_background_sync(self):
+        calls = []
+
+        def get_server_time():
+            calls.append(1)
+            return int(time.time()) - 30
+
+        clock = ServerClock(get_server_time, interval=0.01, samples=1)
+        clock.start()
+        time.sleep(0.1)
+        clock.stop()
+
+        self.assertGreater(len(calls), 1)
+        self.assertLessEqual(abs(clock.timestamp() - (int(time.time()) - 30)), 1)
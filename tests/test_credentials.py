@@ -0,0 +1,81 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from py_clob_client.clob_types import ApiCreds
+from py_clob_client.constants import AMOY
+from py_clob_client.credentials import ApiCredsStore, bootstrap_api_creds
+from py_clob_client.signer import Signer
+
+# publicly known private keys
+private_keys = [
+    "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80",
+    "0x59c6995e998f97a5a0044966f0945389dc9e86dae88c7a8412f4603b6b78690d",
+]
+
+
+def fake_post(endpoint, headers=None, data=None):
+    return {
+        "apiKey": headers["POLY_ADDRESS"],
+        "secret": "secret",
+        "passphrase": headers["POLY_NONCE"],
+    }
+
+
+class TestCredentials(TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "creds.json")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_store(self):
+        creds = ApiCreds(api_key="k", api_secret="s", api_passphrase="p")
+        store = ApiCredsStore(self.path, "passphrase")
+        store.put("0xABC", 0, creds)
+        self.assertEqual(store.get("0xabc", 0), creds)
+        self.assertIsNone(store.get("0xabc", 1))
+        store.save()
+
+        with open(self.path) as f:
+            self.assertNotIn('"s"', f.read())
+
+        self.assertEqual(ApiCredsStore(self.path, "passphrase").get("0xabc"), creds)
+
+        with self.assertRaises(ValueError):
+            ApiCredsStore(self.path, "wrong").get("0xabc")
+
+    def test_bootstrap_api_creds(self):
+        addresses = [Signer(key, AMOY).address() for key in private_keys]
+        store = ApiCredsStore(self.path, "passphrase")
+
+        with patch("py_clob_client.client.post", side_effect=fake_post) as mock_post:
+            creds = bootstrap_api_creds(
+                "http://clob", AMOY, private_keys, nonce=3, store=store
+            )
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(list(creds), addresses)
+        for address in addresses:
+            self.assertEqual(creds[address].api_key, address)
+            self.assertEqual(creds[address].api_passphrase, "3")
+
+        # served from the store on restart
+        with patch("py_clob_client.client.post") as mock_post:
+            cached = bootstrap_api_creds(
+                "http://clob",
+                AMOY,
+                private_keys,
+                nonce=3,
+                store=ApiCredsStore(self.path, "passphrase"),
+            )
+        mock_post.assert_not_called()
+        self.assertEqual(cached, creds)
+
+    def test_bootstrap_api_creds_failure(self):
+        with patch("py_clob_client.client.post", side_effect=Exception("down")), patch(
+            "py_clob_client.client.get", side_effect=Exception("down")
+        ):
+            creds = bootstrap_api_creds("http://clob", AMOY, private_keys[:1])
+        self.assertEqual(list(creds.values()), [None])
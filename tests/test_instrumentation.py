@@ -0,0 +1,85 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import ApiCreds
+from py_clob_client.constants import AMOY
+from py_clob_client.instrumentation import (
+    NOOP,
+    Histogram,
+    HistogramCollector,
+    get_instrumentation,
+    set_instrumentation,
+)
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+creds = ApiCreds(
+    api_key="000000000-0000-0000-0000-000000000000",
+    api_passphrase="aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+    api_secret="AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=",
+)
+
+
+class TestInstrumentation(TestCase):
+    def tearDown(self):
+        set_instrumentation(None)
+
+    def test_histogram(self):
+        histogram = Histogram()
+        self.assertIsNone(histogram.percentile(50))
+
+        for i in range(1, 101):
+            histogram.observe(i / 1000)
+
+        self.assertEqual(histogram.count, 100)
+        self.assertAlmostEqual(histogram.summary()["mean"], 0.0505)
+        self.assertAlmostEqual(histogram.percentile(50), 0.05, delta=0.05 * 0.05)
+        self.assertAlmostEqual(histogram.percentile(99), 0.099, delta=0.099 * 0.05)
+        self.assertEqual(histogram.percentile(100), 0.1)
+        self.assertAlmostEqual(histogram.percentile(0), 0.001, delta=0.001 * 0.05)
+
+        merged = Histogram()
+        merged.merge(histogram)
+        merged.merge(histogram)
+        self.assertEqual(merged.count, 200)
+        self.assertEqual(merged.percentile(50), histogram.percentile(50))
+
+    def test_noop(self):
+        self.assertIs(get_instrumentation(), NOOP)
+        self.assertFalse(NOOP.enabled)
+        with NOOP.span("any", label="a"):
+            pass
+        NOOP.incr("any")
+        NOOP.event("any", field=1)
+
+    def test_collector(self):
+        collector = HistogramCollector()
+        set_instrumentation(collector)
+        self.assertIs(get_instrumentation(), collector)
+
+        resp = MagicMock(status_code=200)
+        resp.json.return_value = []
+        client = ClobClient("http://clob", chain_id=AMOY, key=private_key, creds=creds)
+        with patch(
+            "py_clob_client.http_helpers.helpers._http_session.request",
+            return_value=resp,
+        ):
+            client.get_api_keys()
+            client.get_api_keys()
+
+        summary = collector.summary()
+        for span in ["l2_headers", "http_request", "json_decode", "serialize"]:
+            self.assertEqual(summary[span]["count"], 2, span)
+        self.assertIn(
+            (
+                "http_request",
+                (("method", "GET"), ("path", "/auth/api-keys"), ("status", 200)),
+            ),
+            collector.histograms,
+        )
+
+        collector.incr("retries", endpoint="/order")
+        collector.incr("retries", 2, endpoint="/order")
+        self.assertEqual(collector.counters[("retries", (("endpoint", "/order"),))], 3)
@@ -0,0 +1,106 @@
+import subprocess
+import sys
+from unittest import TestCase
+from unittest.mock import patch
+
+from py_clob_client.cache import MarketMetadataCache
+from py_clob_client.clob_types import OrderType
+from py_clob_client.constants import END_CURSOR
+from py_clob_client.market_data import MarketDataClient
+
+
+def raw_book(token_id: str, price: str, hash: str = "") -> dict:
+    return {
+        "market": "0x1",
+        "asset_id": token_id,
+        "timestamp": "1",
+        "bids": [{"price": "0.4", "size": "100"}],
+        "asks": [{"price": price, "size": "100"}],
+        "hash": hash,
+    }
+
+
+class TestMarketDataClient(TestCase):
+    def test_no_crypto_imports(self):
+        loaded = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys\n"
+                "from py_clob_client.market_data import MarketDataClient\n"
+                "MarketDataClient('http://localhost')\n"
+                "print([m for m in ['eth_account', 'eth_keys', 'py_order_utils', "
+                "'poly_eip712_structs'] if m in sys.modules])",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        self.assertEqual(loaded, "[]")
+
+    def test_stream_order_books(self):
+        polls = [
+            [raw_book("1", "0.6", "a"), raw_book("2", "0.6", "b")],
+            [raw_book("1", "0.6", "a"), raw_book("2", "0.5", "c")],
+            [raw_book("1", "0.6", "a"), raw_book("2", "0.5", "c")],
+        ]
+
+        with patch("py_clob_client.market_data.post", side_effect=polls) as mock_post:
+            client = MarketDataClient("http://clob/")
+            books = list(client.stream_order_books(["1", "2"], interval=0, max_polls=3))
+
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertEqual(
+            mock_post.call_args.kwargs["data"], [{"token_id": "1"}, {"token_id": "2"}]
+        )
+        self.assertEqual(
+            [(b.asset_id, b.hash) for b in books], [("1", "a"), ("2", "b"), ("2", "c")]
+        )
+
+    def test_load_markets_metadata(self):
+        pages = {
+            "MA==": {
+                "data": [
+                    {
+                        "minimum_tick_size": 0.01,
+                        "neg_risk": False,
+                        "tokens": [{"token_id": "1"}, {"token_id": "2"}],
+                    }
+                ],
+                "next_cursor": "MQ==",
+            },
+            "MQ==": {
+                "data": [
+                    {
+                        "minimum_tick_size": 0.001,
+                        "neg_risk": True,
+                        "tokens": [{"token_id": "3"}, {"token_id": ""}],
+                    }
+                ],
+                "next_cursor": END_CURSOR,
+            },
+        }
+        cache = MarketMetadataCache()
+        client = MarketDataClient("http://clob", metadata_cache=cache)
+
+        with patch(
+            "py_clob_client.market_data.get",
+            side_effect=lambda url: pages[url.split("next_cursor=")[1]],
+        ) as mock_get:
+            self.assertEqual(client.load_markets_metadata(), 2)
+            self.assertEqual(client.get_tick_size("3"), "0.001")
+            self.assertTrue(client.get_neg_risk("3"))
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(cache.tick_sizes, {"1": "0.01", "2": "0.01", "3": "0.001"})
+        self.assertEqual(cache.neg_risk, {"1": False, "2": False, "3": True})
+
+    def test_calculate_market_price(self):
+        client = MarketDataClient("http://clob")
+        with patch("py_clob_client.market_data.get", return_value=raw_book("1", "0.6")):
+            self.assertEqual(
+                client.calculate_market_price("1", "BUY", 10, OrderType.FOK), 0.6
+            )
+            self.assertEqual(
+                client.calculate_market_price("1", "SELL", 10, OrderType.FOK), 0.4
+            )
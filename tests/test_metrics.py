@@ -0,0 +1,155 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from urllib.request import urlopen
+
+import requests
+
+from py_clob_client.client import ClobClient
+from py_clob_client.constants import AMOY
+from py_clob_client.exceptions import PolyApiException
+from py_clob_client.http_helpers.helpers import get
+from py_clob_client.instrumentation import set_instrumentation
+from py_clob_client.metrics import (
+    OPENMETRICS_CONTENT_TYPE,
+    MetricsInstrumentation,
+    MetricsRegistry,
+    start_metrics_server,
+)
+
+
+class TestMetrics(TestCase):
+    def tearDown(self):
+        set_instrumentation(None)
+
+    def test_registry(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("requests", "Requests")
+        counter.inc(path="/book")
+        counter.inc(2, path="/book")
+        self.assertIs(registry.counter("requests"), counter)
+        self.assertEqual(counter.get(path="/book"), 3)
+
+        registry.gauge("in_flight", "In flight").set(4)
+        histogram = registry.histogram("latency", "Latency", buckets=(0.1, 1))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5)
+
+        with self.assertRaises(ValueError):
+            registry.gauge("requests")
+
+        self.assertEqual(
+            registry.to_openmetrics(),
+            "# TYPE requests counter\n"
+            "# HELP requests Requests\n"
+            'requests_total{path="/book"} 3\n'
+            "# TYPE in_flight gauge\n"
+            "# HELP in_flight In flight\n"
+            "in_flight 4\n"
+            "# TYPE latency histogram\n"
+            "# HELP latency Latency\n"
+            'latency_bucket{le="0.1"} 1\n'
+            'latency_bucket{le="1.0"} 2\n'
+            'latency_bucket{le="+Inf"} 3\n'
+            "latency_count 3\n"
+            "latency_sum 5.55\n"
+            "# EOF\n",
+        )
+
+    def test_client_metrics(self):
+        instrumentation = MetricsInstrumentation()
+        set_instrumentation(instrumentation)
+
+        resp = MagicMock(status_code=200)
+        resp.json.return_value = {"minimum_tick_size": 0.01}
+        client = ClobClient("http://clob", chain_id=AMOY)
+        with patch(
+            "py_clob_client.http_helpers.helpers._http_session.request",
+            return_value=resp,
+        ):
+            for _ in range(3):
+                client.get_tick_size("1")
+
+        registry = instrumentation.registry
+        self.assertEqual(
+            registry.get("clob_requests").get(
+                method="GET", path="/tick-size", status=200
+            ),
+            1,
+        )
+        self.assertEqual(
+            registry.get("clob_request_duration_seconds").get_count(
+                method="GET", path="/tick-size"
+            ),
+            1,
+        )
+        lookups = registry.get("clob_cache_lookups")
+        self.assertEqual(lookups.get(cache="tick_size", result="hit"), 2)
+        self.assertEqual(lookups.get(cache="tick_size", result="miss"), 1)
+        self.assertEqual(
+            registry.get("clob_span_duration_seconds").get_count(span="json_decode"), 1
+        )
+
+    def test_request_labels(self):
+        instrumentation = MetricsInstrumentation()
+        set_instrumentation(instrumentation)
+
+        resp = MagicMock(status_code=200)
+        resp.json.return_value = {}
+        client = ClobClient("http://clob", chain_id=AMOY)
+        with patch(
+            "py_clob_client.http_helpers.helpers._http_session.request",
+            return_value=resp,
+        ):
+            client.get_market("0x1")
+            client.get_market("0x2")
+        with patch(
+            "py_clob_client.http_helpers.helpers._http_session.request",
+            side_effect=requests.ConnectionError(),
+        ):
+            with self.assertRaises(PolyApiException):
+                client.get_market("0x3")
+
+        requests_total = instrumentation.registry.get("clob_requests")
+        # the ids requested are not labels
+        self.assertEqual(
+            requests_total.get(method="GET", path="/markets/{id}", status=200), 2
+        )
+        self.assertEqual(
+            requests_total.get(method="GET", path="/markets/{id}", status="error"), 1
+        )
+
+    def test_http_pool_gauges(self):
+        instrumentation = MetricsInstrumentation()
+        set_instrumentation(instrumentation)
+
+        server = start_metrics_server(MetricsRegistry())
+        try:
+            url = "http://{}:{}/metrics".format(*server.server_address)
+            get(url)
+            get(url)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        # the connection is kept alive in the pool between the requests
+        connections = instrumentation.registry.get("clob_http_pool_connections")
+        self.assertEqual(connections.get(state="in_use"), 0)
+        self.assertGreaterEqual(connections.get(state="idle"), 1)
+
+    def test_metrics_server(self):
+        registry = MetricsRegistry()
+        registry.counter("requests", "Requests").inc()
+
+        server = start_metrics_server(registry)
+        try:
+            url = "http://{}:{}/metrics".format(*server.server_address)
+            with urlopen(url) as resp:
+                self.assertEqual(resp.headers["Content-Type"], OPENMETRICS_CONTENT_TYPE)
+                body = resp.read().decode("utf-8")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertIn("requests_total 1\n", body)
+        self.assertTrue(body.endswith("# EOF\n"))
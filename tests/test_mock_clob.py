@@ -0,0 +1,51 @@
+from unittest import TestCase
+
+from py_order_utils.model import BUY
+
+from benchmarks.mock_clob import MockClobServer, MockClobState
+from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import OrderArgs
+from py_clob_client.constants import AMOY
+from py_clob_client.exceptions import PolyApiException
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+
+class TestMockClob(TestCase):
+    def setUp(self):
+        # port 0, a free port is picked
+        self.server = MockClobServer(state=MockClobState(n_markets=2)).start()
+        self.token_id = next(iter(self.server.state.books))
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_book(self):
+        client = ClobClient(self.server.url)
+        book = client.get_order_book(self.token_id)
+        self.assertEqual(book.asset_id, self.token_id)
+        self.assertEqual(
+            len(book.bids), len(self.server.state.books[self.token_id]["bids"])
+        )
+
+        with self.assertRaises(PolyApiException) as e:
+            client.get_order_book("1")
+        self.assertEqual(e.exception.status_code, 404)
+
+    def test_order(self):
+        client = ClobClient(self.server.url, chain_id=AMOY, key=private_key)
+        client.set_api_creds(client.create_api_key())
+
+        order = client.create_order(
+            OrderArgs(token_id=self.token_id, price=0.5, size=10, side=BUY)
+        )
+        resp = client.post_order(order)
+        self.assertTrue(resp["success"])
+        self.assertEqual(client.get_order(resp["orderID"])["status"], "LIVE")
+
+        # the L2 signature is checked
+        client.creds.api_secret = "A" * 43 + "="
+        with self.assertRaises(PolyApiException) as e:
+            client.post_order(order)
+        self.assertEqual(e.exception.status_code, 401)
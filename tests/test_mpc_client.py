@@ -0,0 +1,187 @@
+import time
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from eth_keys import keys
+from py_order_utils.model import BUY
+
+from py_clob_client.MPCBackends import LocalMPCBackend
+from py_clob_client.MPCClient import MPCClobClient
+from py_clob_client.clob_types import ApiCreds, OrderArgs
+from py_clob_client.config import get_contract_config
+from py_clob_client.constants import AMOY, L1, L2
+from py_clob_client.signing.order import get_order_hash
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+path = "polymarket-1"
+token_id = (
+    "71321045679252212594626385532706912750332728571942532289631379312455583992563"
+)
+
+creds = ApiCreds(
+    api_key="000000000-0000-0000-0000-000000000000",
+    api_passphrase="aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+    api_secret="AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=",
+)
+
+
+def recover(message_hash: bytes, signature: str) -> str:
+    signature = bytes.fromhex(signature[2:])
+    return (
+        keys.Signature(signature[:64] + bytes([signature[64] - 27]))
+        .recover_public_key_from_msg_hash(message_hash)
+        .to_checksum_address()
+    )
+
+
+def fake_get(url, headers=None):
+    if "/tick-size" in url:
+        return {"minimum_tick_size": 0.01}
+    if "/neg-risk" in url:
+        return {"neg_risk": False}
+    raise Exception("unexpected GET {}".format(url))
+
+
+def echo_post(url, headers=None, data=None):
+    if data["order"]["tokenId"] == "1":
+        raise Exception("rejected")
+    return {"success": True, "orderID": str(data["order"]["salt"])}
+
+
+class TestMPCClobClient(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.backend = LocalMPCBackend(private_key)
+        self.address = self.backend.address(path)
+        self.client = MPCClobClient(
+            "http://clob/",
+            chain_id=AMOY,
+            funder=self.address,
+            path=path,
+            mpc_backend=self.backend,
+        )
+
+    def test_modes(self):
+        self.assertEqual(self.client.mode, L1)
+        self.assertEqual(self.client.get_address(), self.address)
+        self.client.set_api_creds(creds)
+        self.assertEqual(self.client.mode, L2)
+        self.assertEqual(MPCClobClient("http://clob").mode, 0)
+
+    def test_creds_attribute(self):
+        self.client.creds = creds
+        self.assertIs(self.client.client.creds, creds)
+        self.assertEqual(self.client.mode, L2)
+        self.client.creds = None
+        self.assertEqual(self.client.mode, L1)
+
+    async def test_create_api_key(self):
+        with patch(
+            "py_clob_client.MPCClient.post",
+            return_value={"apiKey": "k", "secret": "s", "passphrase": "p"},
+        ) as mock_post:
+            result = await self.client.create_or_derive_api_creds()
+        self.assertEqual(result, ApiCreds("k", "s", "p"))
+        self.assertEqual(
+            mock_post.call_args.kwargs["headers"]["POLY_ADDRESS"], self.address
+        )
+
+    async def test_create_order(self):
+        with patch("py_clob_client.market_data.get", side_effect=fake_get):
+            order = await self.client.create_order(
+                OrderArgs(token_id=token_id, price=0.5, size=10, side=BUY)
+            )
+
+        self.assertEqual(order.order["signer"], self.address)
+        self.assertEqual(order.order["maker"], self.address)
+        self.assertEqual(order.order["makerAmount"], 5000000)
+        order_hash = get_order_hash(
+            order.order, AMOY, get_contract_config(AMOY, False).exchange
+        )
+        self.assertEqual(recover(order_hash, order.signature), self.address)
+
+    async def test_create_and_post_orders(self):
+        self.client.set_api_creds(creds)
+        args = [
+            OrderArgs(token_id=str(i), price=0.5, size=10, side=BUY) for i in range(6)
+        ]
+        with patch("py_clob_client.market_data.get", side_effect=fake_get), patch(
+            "py_clob_client.client.post", side_effect=echo_post
+        ) as mock_post:
+            results = await self.client.create_and_post_orders(args, max_in_flight=3)
+
+        self.assertEqual(
+            [r["success"] for r in results], [True, False, True, True, True, True]
+        )
+        self.assertEqual(results[1]["errorMsg"], "rejected")
+        self.assertEqual(mock_post.call_count, 6)
+        headers = mock_post.call_args.kwargs["headers"]
+        self.assertEqual(headers["POLY_ADDRESS"], self.address)
+        self.assertEqual(headers["POLY_API_KEY"], creds.api_key)
+
+    async def test_get_orders(self):
+        self.client.set_api_creds(creds)
+        pages = {
+            "MA==": {"data": [{"id": "1"}], "next_cursor": "MQ=="},
+            "MQ==": {"data": [{"id": "2"}], "next_cursor": "LTE="},
+        }
+        with patch(
+            "py_clob_client.client.get",
+            side_effect=lambda url, headers=None: pages[url.split("next_cursor=")[1]],
+        ):
+            orders = await self.client.get_orders()
+        self.assertEqual([o["id"] for o in orders], ["1", "2"])
+
+    async def test_clock_sync(self):
+        server_time = int(time.time()) + 3600
+        with patch("py_clob_client.market_data.get", return_value=server_time):
+            await self.client.enable_clock_sync(interval=3600)
+        try:
+            with patch(
+                "py_clob_client.MPCClient.post",
+                return_value={"apiKey": "k", "secret": "s", "passphrase": "p"},
+            ) as mock_post:
+                await self.client.create_api_key()
+        finally:
+            self.client.disable_clock_sync()
+        timestamp = int(mock_post.call_args.kwargs["headers"]["POLY_TIMESTAMP"])
+        self.assertLessEqual(abs(timestamp - server_time), 1)
+
+    async def test_iter_trades_pages(self):
+        self.client.set_api_creds(creds)
+        pages = {
+            "MA==": {"data": [{"id": "1"}], "next_cursor": "MQ=="},
+            "MQ==": {"data": [{"id": "2"}], "next_cursor": "LTE="},
+        }
+        with patch(
+            "py_clob_client.client.get",
+            side_effect=lambda url, headers=None: pages[url.split("next_cursor=")[1]],
+        ):
+            tracker = await self.client.enable_order_tracking(reconcile_interval=3600)
+            try:
+                self.assertIs(self.client.order_tracker, tracker)
+                result = [page async for page in self.client.iter_trades_pages()]
+            finally:
+                self.client.disable_order_tracking()
+        self.assertEqual(result, [([{"id": "1"}], "MQ=="), ([{"id": "2"}], "LTE=")])
+
+    def test_wrapped_methods(self):
+        for name in [
+            "get_notifications",
+            "drop_notifications",
+            "is_order_scoring",
+            "are_orders_scoring",
+            "get_market_trades_events",
+            "stream_order_books",
+            "iter_trades_pages",
+            "enable_clock_sync",
+        ]:
+            self.assertTrue(callable(getattr(self.client, name)), name)
+        self.assertEqual(
+            self.client.get_collateral_address(),
+            self.client.client.get_collateral_address(),
+        )
+        self.assertEqual(
+            self.client.get_exchange_address(True),
+            self.client.client.get_exchange_address(True),
+        )
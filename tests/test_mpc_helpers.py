@@ -0,0 +1,75 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from eth_keys import keys
+
+from py_clob_client.MPCHelpers import (
+    reconstruct_signature,
+    recover_mpc_public_key,
+    verify_mpc_signature,
+    verify_mpc_signatures,
+)
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+address = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+message_hash = "ab" * 32
+
+
+def mpc_sign(hash_hex: str) -> dict:
+    # same format as the sign_hash result of the MPC contract
+    signature = keys.PrivateKey(bytes.fromhex(private_key[2:])).sign_msg_hash(
+        bytes.fromhex(hash_hex)
+    )
+    prefix = "03" if signature.v else "02"
+    return {
+        "big_r": {"affine_point": prefix + "{:064x}".format(signature.r).upper()},
+        "s": {"scalar": "{:064x}".format(signature.s).upper()},
+        "recovery_id": signature.v,
+    }
+
+
+class TestMPCHelpers(TestCase):
+    def test_recover_mpc_public_key(self):
+        public_key = recover_mpc_public_key(message_hash, mpc_sign(message_hash))
+        self.assertEqual(public_key.to_checksum_address(), address)
+        other = recover_mpc_public_key("cd" * 32, mpc_sign(message_hash))
+        self.assertNotEqual(other.to_checksum_address(), address)
+
+    def test_reconstruct_signature(self):
+        signature = reconstruct_signature(mpc_sign(message_hash))
+        self.assertEqual(len(signature), 130)
+        r, s, v = signature[:64], signature[64:128], int(signature[128:], 16)
+        public_key = keys.Signature(
+            vrs=(v - 27, int(r, 16), int(s, 16))
+        ).recover_public_key_from_msg_hash(bytes.fromhex(message_hash))
+        self.assertEqual(public_key.to_checksum_address(), address)
+
+    def test_verify_mpc_signature(self):
+        public_key = recover_mpc_public_key(message_hash, mpc_sign(message_hash))
+        self.assertEqual(public_key.to_checksum_address(), address)
+
+        self.assertTrue(
+            verify_mpc_signature(public_key, message_hash, mpc_sign(message_hash))
+        )
+        self.assertFalse(
+            verify_mpc_signature(public_key, "cd" * 32, mpc_sign(message_hash))
+        )
+
+    def test_verify_mpc_signatures(self):
+        public_key = keys.PrivateKey(bytes.fromhex(private_key[2:])).public_key
+        hashes = ["{:064x}".format(i + 1) for i in range(10)]
+        signatures = [(h, mpc_sign(h)) for h in hashes]
+
+        self.assertEqual(verify_mpc_signatures(public_key, signatures), [True] * 10)
+        self.assertEqual(verify_mpc_signatures(public_key, []), [])
+
+        # signature of another hash
+        signatures[7] = (hashes[7], mpc_sign(hashes[6]))
+        expected = [True] * 10
+        expected[7] = False
+        self.assertEqual(verify_mpc_signatures(public_key, signatures), expected)
+
+        # without the native backend internals, the signatures are checked one by one
+        with patch("py_clob_client.MPCHelpers.jacobian_add", None):
+            self.assertEqual(verify_mpc_signatures(public_key, signatures), expected)
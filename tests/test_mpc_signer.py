@@ -0,0 +1,205 @@
+import asyncio
+import sys
+import time
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import MagicMock, patch
+
+from eth_keys import keys
+from py_order_utils.model import BUY
+
+from py_clob_client import MPCSigner as mpc_signer_module
+from py_clob_client.MPCBackends import (
+    NEAR_MAINNET_RPC,
+    NEAR_TESTNET_RPC,
+    LocalMPCBackend,
+    NearMPCBackend,
+)
+from py_clob_client.MPCSigner import MPCSigner
+from py_clob_client.MPCSigningService import MPCSigningService
+from py_clob_client.clob_types import CreateOrderOptions, OrderArgs
+from py_clob_client.config import get_contract_config
+from py_clob_client.constants import AMOY
+from py_clob_client.order_builder.builder import OrderBuilder
+from py_clob_client.signer import Signer
+from py_clob_client.signing.MPCeip712 import sign_clob_auth_message
+from py_clob_client.signing.eip712 import get_clob_auth_hash
+from py_clob_client.signing.order import get_order_hash
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+path = "polymarket-1"
+
+
+def recover(message_hash: str, signature: str) -> str:
+    signature = bytes.fromhex(signature[2:])
+    return (
+        keys.Signature(signature[:64] + bytes([signature[64] - 27]))
+        .recover_public_key_from_msg_hash(bytes.fromhex(message_hash))
+        .to_checksum_address()
+    )
+
+
+class TestMPCSigner(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.backend = LocalMPCBackend(private_key)
+        self.address = self.backend.address(path)
+        self.signer = MPCSigner(
+            ota_account=self.address, chain_id=AMOY, path=path, backend=self.backend
+        )
+
+    def test_local_backend_paths(self):
+        self.assertNotEqual(self.address, self.backend.address("polymarket-2"))
+        self.assertEqual(self.address, LocalMPCBackend(private_key).address(path))
+
+    async def test_sign(self):
+        await self.signer.startup()
+        message_hash = "ab" * 32
+        signature = await self.signer.sign(message_hash)
+
+        self.assertEqual(len(signature), 132)
+        self.assertEqual(recover(message_hash, signature), self.address)
+        self.assertEqual(self.signer.ota_account, self.address)
+
+    async def test_public_key_pinned(self):
+        signer = MPCSigner(chain_id=AMOY, path=path, backend=self.backend)
+        self.assertIsNone(signer.address())
+
+        with patch.object(
+            mpc_signer_module,
+            "recover_mpc_public_key",
+            wraps=mpc_signer_module.recover_mpc_public_key,
+        ) as recover_key:
+            for i in range(3):
+                await signer.sign("{:064x}".format(i + 1))
+        recover_key.assert_called_once()
+        self.assertEqual(signer.address(), self.address)
+
+        # signers of the same key share the pinned public key
+        other = MPCSigner(chain_id=AMOY, path=path, backend=self.backend)
+        self.assertEqual(other.address(), self.address)
+
+    async def test_address_mismatch(self):
+        # the key of another path doesn't match the configured address
+        signer = MPCSigner(
+            ota_account=self.address,
+            chain_id=AMOY,
+            path="polymarket-2",
+            backend=self.backend,
+        )
+        with self.assertRaises(Exception):
+            await signer.sign("ab" * 32)
+        self.assertIsNone(signer.public_key)
+        self.assertEqual(signer.ota_account, self.address)
+
+    async def test_address_mismatch_pinned(self):
+        other = self.backend.address("polymarket-2")
+        # created before the key is pinned by another signer
+        signer = MPCSigner(
+            ota_account=other, chain_id=AMOY, path=path, backend=self.backend
+        )
+        await self.signer.sign("ab" * 32)
+
+        # the key is pinned, the configured address is still checked
+        with self.assertRaises(Exception):
+            await signer.sign("cd" * 32)
+        with self.assertRaises(Exception):
+            await signer.verify_signatures([("cd" * 32, {})])
+        with self.assertRaises(Exception):
+            MPCSigner(ota_account=other, chain_id=AMOY, path=path, backend=self.backend)
+
+    async def test_invalid_signature(self):
+        await self.signer.sign("ab" * 32)
+
+        signature = await self.backend.sign_hash("ab" * 32, path)
+        self.backend.sign_hash = lambda message_hash, path: asyncio.sleep(0, signature)
+        with self.assertRaises(Exception):
+            await self.signer.sign("cd" * 32)
+
+    async def test_verify_signatures(self):
+        hashes = ["{:064x}".format(i + 1) for i in range(5)]
+        signatures = [(h, await self.backend.sign_hash(h, path)) for h in hashes]
+        signatures[2] = (hashes[2], signatures[1][1])
+
+        self.assertEqual(
+            await self.signer.verify_signatures(signatures),
+            [True, True, False, True, True],
+        )
+        self.assertEqual(self.signer.public_key.to_checksum_address(), self.address)
+
+    async def test_sign_clob_auth_message(self):
+        signature = await sign_clob_auth_message(self.signer, 1700000000, 0)
+        message_hash = get_clob_auth_hash(AMOY, self.address, 1700000000, 0).hex()
+        self.assertEqual(recover(message_hash, signature), self.address)
+
+    async def test_concurrent_signing(self):
+        self.backend.latency = 0.05
+        service = MPCSigningService(self.signer, max_in_flight=10)
+
+        start = time.monotonic()
+        results = await service.sign_many(["{:064x}".format(i) for i in range(20)])
+        elapsed = time.monotonic() - start
+
+        self.assertTrue(all(r.error is None for r in results))
+        self.assertEqual(
+            recover(results[3].message_hash, results[3].signature), self.address
+        )
+        # 2 rounds of 10 concurrent requests
+        self.assertLess(elapsed, 0.5)
+        self.assertGreaterEqual(elapsed, 0.1)
+
+    async def test_order_builder(self):
+        local_signer = Signer(
+            "0x{:064x}".format(
+                int.from_bytes(self.backend.private_key(path).to_bytes(), "big")
+            ),
+            AMOY,
+        )
+        self.assertEqual(local_signer.address(), self.address)
+        order_args = OrderArgs(token_id="123", price=0.24, size=15, side=BUY)
+        options = CreateOrderOptions(tick_size="0.01", neg_risk=False)
+        exchange = get_contract_config(AMOY, False).exchange
+
+        # one builder for both signers, the MPC one only signs asynchronously
+        mpc_builder = OrderBuilder(self.signer)
+        with self.assertRaises(ValueError):
+            mpc_builder.create_order(order_args, options)
+
+        for builder in [
+            mpc_builder,
+            OrderBuilder(local_signer),
+            OrderBuilder(MPCSigningService(local_signer)),
+        ]:
+            signed_order = await builder.create_order_async(order_args, options)
+            self.assertEqual(signed_order.order["makerAmount"], 3600000)
+            self.assertEqual(signed_order.order["takerAmount"], 15000000)
+            self.assertEqual(signed_order.order["signer"], self.address)
+            self.assertEqual(
+                recover(
+                    get_order_hash(signed_order.order, AMOY, exchange).hex(),
+                    signed_order.signature,
+                ),
+                self.address,
+            )
+
+
+class FakeAccount:
+    def __init__(self, account_id, private_key, rpc_addr):
+        self.rpc_addr = rpc_addr
+
+
+class TestNearMPCBackend(TestCase):
+    def test_networks(self):
+        # py_near is an optional dependency, its Account is faked
+        with patch.dict(
+            sys.modules,
+            {"py_near": MagicMock(), "py_near.account": MagicMock(Account=FakeAccount)},
+        ):
+            for network, rpc in [
+                (None, NEAR_TESTNET_RPC),
+                ("testnet", NEAR_TESTNET_RPC),
+                ("mainnet", NEAR_MAINNET_RPC),
+                ("http://localhost:3030", "http://localhost:3030"),
+            ]:
+                backend = NearMPCBackend("agent.near", "ed25519:key", network, "mpc")
+                self.assertEqual(backend.network, rpc)
+                self.assertEqual(backend.account.rpc_addr, rpc)
@@ -0,0 +1,56 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from py_clob_client.MPCSigningService import MPCSigningService
+
+
+class FakeMPCSigner:
+    chain_id = 80002
+    ota_account = "0x0000000000000000000000000000000000000001"
+
+    def __init__(self, latency: float = 0.02):
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def sign(self, message_hash: str) -> str:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if message_hash == "bad":
+                raise Exception("sign_hash failed")
+            return "0x" + message_hash
+        finally:
+            self.in_flight -= 1
+
+
+class TestMPCSigningService(IsolatedAsyncioTestCase):
+    async def test_sign_many(self):
+        signer = FakeMPCSigner()
+        service = MPCSigningService(signer, max_in_flight=4)
+
+        hashes = ["{:064x}".format(i) for i in range(10)]
+        results = await service.sign_many(hashes)
+
+        self.assertEqual([r.signature for r in results], ["0x" + h for h in hashes])
+        self.assertEqual(signer.max_in_flight, 4)
+        self.assertEqual(service.latency.count, 10)
+        self.assertGreaterEqual(min(r.latency for r in results), 0.02)
+        # the last requests waited for a slot
+        self.assertGreaterEqual(max(r.latency for r in results), 0.06)
+        self.assertEqual(service.in_flight, 0)
+
+    async def test_errors(self):
+        service = MPCSigningService(FakeMPCSigner(latency=0))
+        results = await service.sign_many(["aa", "bad", "bb"])
+
+        self.assertEqual([r.signature for r in results], ["0xaa", None, "0xbb"])
+        self.assertEqual(str(results[1].error), "sign_hash failed")
+        with self.assertRaises(Exception):
+            await service.sign("bad")
+
+    async def test_signer_attributes(self):
+        service = MPCSigningService(FakeMPCSigner())
+        self.assertEqual(service.chain_id, 80002)
+        self.assertEqual(service.ota_account, FakeMPCSigner.ota_account)
@@ -0,0 +1,154 @@
+import time
+from threading import Event, Lock, Thread
+from unittest import TestCase
+
+from py_clob_client.clob_types import (
+    CreateOrderOptions,
+    OrderArgs,
+    OrderType,
+    PartialCreateOrderOptions,
+)
+from py_clob_client.order_builder.constants import BUY
+from py_clob_client.order_pipeline import OrderPipeline
+
+
+class FakeClient:
+    def __init__(self):
+        self.lock = Lock()
+        self.metadata_calls = []
+        self.posted = []
+        self.created_options = []
+
+    def get_tick_size(self, token_id):
+        with self.lock:
+            self.metadata_calls.append(("tick_size", token_id))
+        return "0.01"
+
+    def get_neg_risk(self, token_id):
+        with self.lock:
+            self.metadata_calls.append(("neg_risk", token_id))
+        return False
+
+    def resolve_order_options(self, token_id, price, options):
+        return CreateOrderOptions(
+            tick_size=(
+                options.tick_size
+                if options and options.tick_size
+                else self.get_tick_size(token_id)
+            ),
+            neg_risk=(
+                options.neg_risk
+                if options and options.neg_risk is not None
+                else self.get_neg_risk(token_id)
+            ),
+        )
+
+    def create_order(self, order_args, options):
+        self.created_options.append(options)
+        if order_args.price > 1:
+            raise Exception("invalid price")
+        return {"token_id": order_args.token_id, "price": order_args.price}
+
+    def post_order(self, order, orderType):
+        with self.lock:
+            self.posted.append(order)
+        return {"success": True, "order": order, "orderType": orderType}
+
+
+class TestOrderPipeline(TestCase):
+    def test_pipeline(self):
+        client = FakeClient()
+        with OrderPipeline(max_in_flight=3) as pipeline:
+            futures = [
+                pipeline.submit(
+                    client,
+                    OrderArgs(token_id=str(i), price=0.5, size=10, side=BUY),
+                    order_type=OrderType.GTD,
+                )
+                for i in range(20)
+            ]
+
+        self.assertEqual(len(client.posted), 20)
+        for i, future in enumerate(futures):
+            result = future.result()
+            self.assertEqual(result["order"]["token_id"], str(i))
+            self.assertEqual(result["orderType"], OrderType.GTD)
+
+        # every order resolved its metadata
+        self.assertEqual(len(client.metadata_calls), 40)
+
+    def test_pipeline_options(self):
+        client = FakeClient()
+        with OrderPipeline() as pipeline:
+            future = pipeline.submit(
+                client,
+                OrderArgs(token_id="1", price=0.5, size=10, side=BUY),
+                PartialCreateOrderOptions(tick_size="0.01", neg_risk=True),
+            )
+
+        self.assertTrue(future.result()["success"])
+        self.assertEqual(client.metadata_calls, [])
+
+        # neg_risk=False is resolved, the sign stage gets the concrete options
+        client = FakeClient()
+        with OrderPipeline() as pipeline:
+            future = pipeline.submit(
+                client,
+                OrderArgs(token_id="1", price=0.5, size=10, side=BUY),
+                PartialCreateOrderOptions(neg_risk=False),
+            )
+
+        self.assertTrue(future.result()["success"])
+        self.assertEqual(client.metadata_calls, [("tick_size", "1")])
+        self.assertEqual(
+            client.created_options,
+            [CreateOrderOptions(tick_size="0.01", neg_risk=False)],
+        )
+
+    def test_backpressure(self):
+        client = FakeClient()
+        posting = Event()
+        post_order = client.post_order
+        client.post_order = lambda order, orderType: posting.wait() and post_order(
+            order, orderType
+        )
+
+        pipeline = OrderPipeline(max_in_flight=1, queue_size=1)
+        args = [
+            OrderArgs(token_id=str(i), price=0.5, size=10, side=BUY) for i in range(20)
+        ]
+        futures = []
+        submitter = Thread(
+            target=lambda: futures.extend(pipeline.submit(client, a) for a in args)
+        )
+        submitter.start()
+        time.sleep(0.2)
+        # 1 in flight, 1 waiting for a post, 1 signed waiting for a slot
+        self.assertLessEqual(len(client.created_options), 3)
+
+        posting.set()
+        submitter.join()
+        pipeline.close()
+        self.assertEqual(len(client.posted), 20)
+        self.assertTrue(all(f.result()["success"] for f in futures))
+
+    def test_pipeline_errors(self):
+        client = FakeClient()
+        with OrderPipeline() as pipeline:
+            bad = pipeline.submit(
+                client, OrderArgs(token_id="1", price=2, size=10, side=BUY)
+            )
+            good = pipeline.submit(
+                client, OrderArgs(token_id="2", price=0.5, size=10, side=BUY)
+            )
+
+        with self.assertRaises(Exception):
+            bad.result()
+        self.assertTrue(good.result()["success"])
+        self.assertEqual(len(client.posted), 1)
+
+        # closed
+        with self.assertRaises(RuntimeError):
+            pipeline.submit(
+                client, OrderArgs(token_id="1", price=0.5, size=1, side=BUY)
+            )
@@ -0,0 +1,101 @@
+import time
+from itertools import count
+from threading import Timer
+from unittest import TestCase
+
+from py_clob_client.order_builder.constants import BUY
+from py_clob_client.order_pool import PresignedOrderPool
+
+
+class FakeClient:
+    def __init__(self):
+        self.salts = count()
+        self.posted = []
+
+    def create_order(self, order_args, options):
+        return {
+            "price": order_args.price,
+            "size": order_args.size,
+            "nonce": order_args.nonce,
+            "salt": next(self.salts),
+        }
+
+    def post_order(self, order, orderType):
+        self.posted.append((order, orderType))
+        return {"success": True}
+
+
+class TestPresignedOrderPool(TestCase):
+    def test_pool(self):
+        client = FakeClient()
+        with PresignedOrderPool(
+            client, "1", BUY, prices=[0.4, 0.5], sizes=[10], depth=2, nonce=3
+        ) as pool:
+            self.assertTrue(pool.wait_until_full(timeout=5))
+            self.assertEqual(pool.available(0.4, 10), 2)
+            self.assertEqual(pool.available(0.5, 10), 2)
+
+            order = pool.take(0.5, 10)
+            self.assertEqual(order["price"], 0.5)
+            self.assertEqual(order["nonce"], 3)
+
+            # refilled in the background
+            self.assertTrue(pool.wait_until_full(timeout=5))
+            self.assertEqual(pool.available(0.5, 10), 2)
+
+            self.assertEqual(pool.place(0.4, 10), {"success": True})
+            self.assertEqual(client.posted[0][0]["price"], 0.4)
+
+            # not in the grid
+            with self.assertRaises(ValueError):
+                pool.take(0.3, 10)
+
+            self.assertTrue(pool.wait_until_full(timeout=5))
+
+            # signed again with the new nonce
+            pool.nonce = 4
+            pool.clear()
+            self.assertTrue(pool.wait_until_full(timeout=5))
+            self.assertEqual(pool.take(0.4, 10)["nonce"], 4)
+
+        # signed on the spot when empty
+        order = pool.take(0.4, 10)
+        self.assertEqual(order["size"], 10)
+
+    def test_retry(self):
+        client = FakeClient()
+        create_order = client.create_order
+        failures = count()
+
+        def flaky_create_order(order_args, options):
+            if next(failures) < 2:
+                raise Exception("signer unavailable")
+            return create_order(order_args, options)
+
+        client.create_order = flaky_create_order
+        pool = PresignedOrderPool(
+            client, "1", BUY, prices=[0.5], sizes=[10], retry_delay=0.01
+        )
+        with self.assertRaises(RuntimeError):
+            pool.wait_until_full()
+
+        with pool:
+            # the failed signatures are retried
+            self.assertTrue(pool.wait_until_full(timeout=5))
+
+    def test_closed(self):
+        client = FakeClient()
+        client.create_order = lambda order_args, options: time.sleep(0.05) or {}
+        pool = PresignedOrderPool(client, "1", BUY, prices=[0.5], sizes=[10], depth=50)
+        pool.start()
+        Timer(0.1, pool.close).start()
+        # returns when the pool is closed, not full
+        self.assertFalse(pool.wait_until_full())
+
+    def test_async_client(self):
+        class AsyncClient(FakeClient):
+            async def create_order(self, order_args, options):
+                return {}
+
+        with self.assertRaises(ValueError):
+            PresignedOrderPool(AsyncClient(), "1", BUY, prices=[0.5], sizes=[10])
@@ -0,0 +1,201 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import ApiCreds, OrderType, PostOrdersArgs
+from py_clob_client.constants import AMOY
+from py_clob_client.order_tracker import OrderTracker
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+creds = ApiCreds(
+    api_key="000000000-0000-0000-0000-000000000000",
+    api_passphrase="aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+    api_secret="AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=",
+)
+
+
+class FakeOrder:
+    def __init__(self, token_id: str, side: str, price: float, size: float):
+        shares, cost = int(size * 10**6), int(size * price * 10**6)
+        self.token_id = token_id
+        self.side = side
+        self.maker_amount, self.taker_amount = (
+            (cost, shares) if side == "BUY" else (shares, cost)
+        )
+
+    def dict(self):
+        return {
+            "maker": "0x0000000000000000000000000000000000000001",
+            "tokenId": self.token_id,
+            "side": self.side,
+            "makerAmount": str(self.maker_amount),
+            "takerAmount": str(self.taker_amount),
+            "expiration": "0",
+        }
+
+
+def post_response(order_id: str, status: str = "live", matched: str = "") -> dict:
+    return {
+        "success": True,
+        "errorMsg": "",
+        "orderID": order_id,
+        "status": status,
+        "takingAmount": matched,
+        "makingAmount": "",
+    }
+
+
+def server_order(order_id: str, token_id: str, size_matched: str = "0") -> dict:
+    return {
+        "id": order_id,
+        "status": "LIVE",
+        "market": "0x1",
+        "asset_id": token_id,
+        "side": "BUY",
+        "original_size": "100",
+        "size_matched": size_matched,
+        "price": "0.5",
+    }
+
+
+class TestOrderTracker(TestCase):
+    def setUp(self):
+        self.client = ClobClient("http://clob", AMOY, private_key, creds)
+        self.tracker = self.client.enable_order_tracking()
+
+    def test_post_and_cancel(self):
+        with patch("py_clob_client.client.post", return_value=post_response("a")):
+            self.client.post_order(FakeOrder("1", "BUY", 0.5, 100))
+        with patch(
+            "py_clob_client.client.post",
+            return_value=[
+                post_response("b"),
+                post_response("c", "matched", "10"),
+                {"success": False, "errorMsg": "rejected", "orderID": ""},
+            ],
+        ):
+            self.client.post_orders(
+                [
+                    PostOrdersArgs(FakeOrder("2", "SELL", 0.25, 10), OrderType.GTC),
+                    PostOrdersArgs(FakeOrder("2", "BUY", 0.2, 10), OrderType.FOK),
+                    PostOrdersArgs(FakeOrder("3", "BUY", 0.2, 10), OrderType.GTC),
+                ]
+            )
+
+        self.assertEqual(self.tracker.tokens(), ["1", "2"])
+        order = self.tracker.open_orders("1")[0]
+        self.assertEqual(
+            (order["id"], order["side"], order["price"], order["original_size"]),
+            ("a", "BUY", "0.5", "100"),
+        )
+        self.assertEqual(self.tracker.get_order("b")["price"], "0.25")
+        self.assertNotIn("c", self.tracker)
+        self.assertEqual(self.tracker.open_orders("3"), [])
+
+        with patch(
+            "py_clob_client.client.delete",
+            return_value={"canceled": ["a"], "not_canceled": {"b": "matched"}},
+        ):
+            self.client.cancel_orders(["a", "b"])
+        self.assertFalse(self.tracker.has_open_orders("1"))
+        self.assertIn("b", self.tracker)
+
+    def test_trades(self):
+        with patch("py_clob_client.client.post", return_value=post_response("a")):
+            self.client.post_order(FakeOrder("1", "BUY", 0.5, 100))
+
+        maker_trade = {
+            "id": "t1",
+            "status": "MATCHED",
+            "taker_order_id": "x",
+            "size": "40",
+            "maker_orders": [{"order_id": "a", "matched_amount": "40"}],
+        }
+        self.tracker.on_trade(maker_trade)
+        # status update of the same trade
+        self.tracker.on_trade(dict(maker_trade, status="MINED"))
+        self.assertEqual(self.tracker.get_order("a")["size_matched"], "40")
+
+        with patch(
+            "py_clob_client.client.get",
+            return_value={
+                "data": [
+                    {
+                        "id": "t2",
+                        "status": "MATCHED",
+                        "taker_order_id": "a",
+                        "size": "60",
+                        "maker_orders": [],
+                    }
+                ],
+                "next_cursor": "LTE=",
+            },
+        ):
+            self.client.get_trades()
+        self.assertEqual(len(self.tracker), 0)
+
+    def test_taker_fill_on_post(self):
+        with patch(
+            "py_clob_client.client.post",
+            return_value=post_response("a", "matched", "40"),
+        ):
+            self.client.post_order(FakeOrder("1", "BUY", 0.5, 100))
+        self.assertEqual(self.tracker.get_order("a")["size_matched"], "40")
+
+        # the taker fill of the post response, delivered again by the trades
+        self.tracker.on_trade(
+            {
+                "id": "t1",
+                "status": "MATCHED",
+                "taker_order_id": "a",
+                "size": "40",
+                "maker_orders": [],
+            }
+        )
+        self.assertEqual(self.tracker.get_order("a")["size_matched"], "40")
+
+        self.tracker.on_trade(
+            {
+                "id": "t2",
+                "status": "MATCHED",
+                "taker_order_id": "x",
+                "size": "20",
+                "maker_orders": [{"order_id": "a", "matched_amount": "20"}],
+            }
+        )
+        self.assertEqual(self.tracker.get_order("a")["size_matched"], "60")
+        self.assertTrue(self.tracker.has_open_orders("1"))
+
+    def test_order_events(self):
+        tracker = OrderTracker()
+        tracker.on_order_event(dict(server_order("a", "1"), type="PLACEMENT"))
+        tracker.on_order_event({"type": "UPDATE", "id": "a", "size_matched": "30"})
+        self.assertEqual(tracker.get_order("a")["size_matched"], "30")
+        tracker.on_order_event({"type": "CANCELLATION", "id": "a"})
+        self.assertEqual(tracker.open_orders(), [])
+
+    def test_reconcile(self):
+        with patch(
+            "py_clob_client.client.post",
+            side_effect=[post_response("a"), post_response("b")],
+        ):
+            self.client.post_order(FakeOrder("1", "BUY", 0.5, 100))
+            self.client.post_order(FakeOrder("2", "BUY", 0.5, 100))
+
+        def get_orders(params=None):
+            # posted while the orders are fetched
+            self.tracker.on_order_posted(
+                FakeOrder("1", "BUY", 0.5, 100), post_response("d")
+            )
+            return [server_order("b", "2", "20"), server_order("c", "1")]
+
+        with patch.object(self.client, "get_orders", side_effect=get_orders):
+            diff = self.tracker.reconcile()
+
+        self.assertEqual(diff, {"added": ["c"], "updated": ["b"], "removed": ["a"]})
+        self.assertEqual(
+            sorted(order["id"] for order in self.tracker.open_orders("1")), ["c", "d"]
+        )
+        self.assertEqual(self.tracker.get_order("b")["size_matched"], "20")
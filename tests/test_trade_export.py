@@ -0,0 +1,123 @@
+import os
+import tempfile
+from unittest import TestCase, skipUnless
+
+from py_clob_client.trade_export import TRADE_COLUMNS, TradesExport, export_trades
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+
+def make_trade(i: int) -> dict:
+    return {
+        "id": str(i),
+        "market": "0x1",
+        "asset_id": "100",
+        "side": "BUY",
+        "size": "10",
+        "price": "0.5",
+        "match_time": str(1000 - i // 2),
+        "bucket_index": 0,
+        "maker_orders": [{"order_id": "0x{}".format(i), "matched_amount": "10"}],
+    }
+
+
+class FakeClient:
+    def __init__(self, pages: int, page_size: int, fail_at: int = None):
+        self.pages = pages
+        self.page_size = page_size
+        self.fail_at = fail_at
+        self.cursors = []
+        self.params = []
+
+    def iter_trades_pages(self, params=None, next_cursor="MA=="):
+        self.params.append(params)
+        page = 0 if next_cursor == "MA==" else int(next_cursor)
+        while page < self.pages:
+            self.cursors.append(next_cursor)
+            if page == self.fail_at:
+                raise Exception("network error")
+            trades = [
+                make_trade(page * self.page_size + i) for i in range(self.page_size)
+            ]
+            page += 1
+            next_cursor = str(page) if page < self.pages else "LTE="
+            yield trades, next_cursor
+
+
+@skipUnless(pq, "pyarrow is not installed")
+class TestTradesExport(TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "trades")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def read_ids(self, export: TradesExport) -> list:
+        ids = []
+        for path in export.files():
+            table = pq.read_table(path)
+            self.assertEqual(tuple(table.column_names), TRADE_COLUMNS)
+            ids += table.column("id").to_pylist()
+        return ids
+
+    def test_export(self):
+        self.assertEqual(export_trades(FakeClient(5, 3), self.path, chunk_size=4), 15)
+
+        export = TradesExport(FakeClient(5, 3), self.path)
+        self.assertTrue(export.done)
+        self.assertEqual(export.state["rows"], 15)
+        # pages are never split, a part holds 2 pages of 3 trades
+        self.assertEqual(len(export.files()), 3)
+        self.assertEqual(self.read_ids(export), [str(i) for i in range(15)])
+
+        table = pq.read_table(export.files()[0])
+        self.assertEqual(table.column("bucket_index").to_pylist()[0], "0")
+        self.assertIsNone(table.column("owner").to_pylist()[0])
+        self.assertEqual(
+            table.column("maker_orders").to_pylist()[0],
+            '[{"order_id":"0x0","matched_amount":"10"}]',
+        )
+
+        # nothing left to export
+        self.assertEqual(export.run(), 0)
+
+    def test_resume(self):
+        with self.assertRaises(Exception):
+            export_trades(FakeClient(5, 3, fail_at=3), self.path, chunk_size=4)
+
+        export = TradesExport(FakeClient(5, 3), self.path, chunk_size=4)
+        self.assertFalse(export.done)
+        self.assertEqual(export.state["rows"], 6)
+        self.assertEqual(export.state["next_cursor"], "2")
+
+        self.assertEqual(export.run(), 9)
+        self.assertEqual(export.client.cursors, ["2", "3", "4"])
+        self.assertEqual(self.read_ids(export), [str(i) for i in range(15)])
+
+    def test_new_trades(self):
+        # newest first, 2 trades by second
+        self.assertEqual(export_trades(FakeClient(2, 3), self.path), 6)
+
+        class NewTradesClient(FakeClient):
+            def iter_trades_pages(self, params=None, next_cursor="MA=="):
+                self.params.append(params)
+                trades = [make_trade(-2), make_trade(-1), make_trade(0), make_trade(1)]
+                after = params.after
+                yield [t for t in trades if int(t["match_time"]) >= after], "LTE="
+
+        client = NewTradesClient(0, 0)
+        export = TradesExport(client, self.path)
+        self.assertTrue(export.done)
+        # the second of the trades 0 and 1 is fetched again, they are skipped
+        self.assertEqual(export.run(), 2)
+        self.assertEqual(client.params[-1].after, 999)
+        self.assertEqual(self.read_ids(export)[-2:], ["-2", "-1"])
+
+        # the new pass is empty
+        self.assertEqual(export.run(), 0)
+        self.assertEqual(client.params[-1].after, 1000)
+        self.assertEqual(export.state["rows"], 8)
@@ -0,0 +1,115 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from py_clob_client.clob_types import TradeParams
+from py_clob_client.trade_sync import TradeSync
+
+
+def make_trade(id: str, match_time: int, market: str = "0x1") -> dict:
+    return {"id": id, "market": market, "match_time": str(match_time)}
+
+
+class FakeClient:
+    def __init__(self, trades: list, page_size: int = 2):
+        self.trades = trades
+        self.page_size = page_size
+        self.queries = []
+
+    def iter_trades_pages(self, params=None, next_cursor="MA=="):
+        self.queries.append(params)
+        # newest first, like the CLOB, "after" included
+        trades = [
+            t
+            for t in sorted(self.trades, key=lambda t: -int(t["match_time"]))
+            if (params.market is None or t["market"] == params.market)
+            and (params.after is None or int(t["match_time"]) >= params.after)
+            and (params.before is None or int(t["match_time"]) <= params.before)
+            and (params.id is None or t["id"] == params.id)
+        ]
+        for i in range(0, len(trades), self.page_size):
+            yield trades[i : i + self.page_size], "cursor"
+
+
+class TestTradeSync(TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "sync")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_incremental_sync(self):
+        client = FakeClient(
+            [make_trade("a", 100), make_trade("b", 101), make_trade("c", 101)]
+        )
+        sync = TradeSync(client, self.path)
+        params = TradeParams(market="0x1")
+
+        self.assertEqual([t["id"] for t in sync.sync(params)], ["a", "b", "c"])
+        self.assertIsNone(client.queries[0].after)
+        mark = sync.high_water_mark(params)
+        self.assertEqual(mark["match_time"], 101)
+        self.assertEqual(sorted(mark["ids"]), ["b", "c"])
+
+        # nothing new
+        self.assertEqual(sync.sync(params), [])
+        self.assertEqual(client.queries[1].after, 100)
+
+        # a new trade in the same second as the mark and a later one
+        client.trades += [make_trade("d", 101), make_trade("e", 105)]
+        self.assertEqual([t["id"] for t in sync.sync(params)], ["d", "e"])
+        self.assertEqual(sync.high_water_mark(params)["ids"], ["e"])
+        self.assertEqual(sync.high_water_mark(params)["last_id"], "e")
+
+        # the state survives a restart
+        client.trades.append(make_trade("f", 106))
+        sync = TradeSync(client, self.path)
+        self.assertEqual([t["id"] for t in sync.sync(params)], ["f"])
+        self.assertEqual(
+            [t["id"] for t in sync.trades()], ["a", "b", "c", "d", "e", "f"]
+        )
+
+    def test_caller_params(self):
+        client = FakeClient(
+            [make_trade("a", 100), make_trade("b", 200), make_trade("c", 300)]
+        )
+        sync = TradeSync(client, self.path)
+
+        # a single trade, the mark of the market is left alone
+        self.assertEqual([t["id"] for t in sync.sync(TradeParams(id="b"))], ["b"])
+        self.assertIsNone(sync.high_water_mark())
+
+        params = TradeParams(market="0x1", before=200)
+        self.assertEqual([t["id"] for t in sync.sync(params)], ["a", "b"])
+        self.assertEqual(client.queries[-1].before, 200)
+
+        # the later of the caller's after and the mark
+        params = TradeParams(market="0x1", after=50)
+        self.assertEqual([t["id"] for t in sync.sync(params)], ["c"])
+        self.assertEqual(client.queries[-1].after, 199)
+        client.trades.append(make_trade("d", 400))
+        params = TradeParams(market="0x1", after=350)
+        self.assertEqual([t["id"] for t in sync.sync(params)], ["d"])
+        self.assertEqual(client.queries[-1].after, 350)
+
+    def test_marks_per_market(self):
+        client = FakeClient([make_trade("a", 100, "0x1"), make_trade("b", 200, "0x2")])
+        sync = TradeSync(client, self.path)
+
+        self.assertEqual(len(sync.sync(TradeParams(market="0x2"))), 1)
+        self.assertEqual(len(sync.sync(TradeParams(market="0x1"))), 1)
+        self.assertIsNone(sync.high_water_mark(TradeParams(market="0x3")))
+        self.assertEqual(
+            sync.high_water_mark(TradeParams(market="0x1"))["match_time"], 100
+        )
+
+    def test_duplicates_are_skipped(self):
+        client = FakeClient([make_trade("a", 100)])
+        sync = TradeSync(client, self.path)
+        sync.sync()
+        # a sync interrupted before saving its mark appends the trade again
+        with open(sync.trades_path, "a") as f:
+            f.write('{"id":"a","market":"0x1","match_time":"100"}\n')
+
+        self.assertEqual([t["id"] for t in sync.trades()], ["a"])